@@ -0,0 +1,80 @@
+from abc import ABC, abstractmethod
+from typing import Any
+from asgiref.sync import sync_to_async
+from django.http import HttpRequest, HttpResponse
+from django.views import View
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+
+class AsyncReadView(View, ABC):
+    """
+    Async GET endpoint that mirrors an existing DRF view.
+    Authentication, permissions, queryset scoping, filters, pagination and
+    serializers all come from `view_class`, so the async variant returns
+    the same data as the sync one. Queries go through Django's async ORM
+    (acount, aget, async iteration), so a slow query doesn't hold a worker
+    when served under ASGI. Subclasses define `respond()`.
+    """
+    view_class: Any = None
+    http_method_names = ["get", "options"]
+    
+    def build_view(self, request: HttpRequest, *args: Any, **kwargs: Any) -> tuple:
+        view = self.view_class()
+        view.setup(request, *args, **kwargs)
+        view.renderer_classes = (JSONRenderer,)
+        view.format_kwarg = None
+        drf_request = view.initialize_request(request, *args, **kwargs)
+        view.request = drf_request
+        view.headers = view.default_response_headers
+        return view, drf_request
+    
+    @abstractmethod
+    async def respond(self, view: Any, request: Request, *args: Any, **kwargs: Any) -> Any:
+        ...
+    
+    async def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        view, drf_request = self.build_view(request, *args, **kwargs)
+        try:
+            await sync_to_async(view.initial)(drf_request, *args, **kwargs)
+            response = None
+            if hasattr(view, "check_not_modified"):
+                response = await sync_to_async(view.check_not_modified)(drf_request)
+            if response is None:
+                response = await self.respond(view, drf_request, *args, **kwargs)
+                if hasattr(view, "add_etag"):
+                    response = view.add_etag(response)
+        except Exception as exc:
+            response = view.handle_exception(exc)
+        
+        response = view.finalize_response(drf_request, response, *args, **kwargs)
+        if hasattr(response, "render"):
+            response.render()
+        return response
+
+
+class AsyncListView(AsyncReadView):
+    """
+    Async list endpoint for a DRF ListAPIView.
+    """
+    
+    async def respond(self, view: Any, request: Request, *args: Any, **kwargs: Any) -> Any:
+        queryset = await sync_to_async(
+            lambda: view.filter_queryset(view.get_queryset())
+        )()
+        paginator = view.paginator
+        
+        if paginator is None:
+            objects = [obj async for obj in queryset]
+            return Response(view.get_serializer(objects, many=True).data)
+        
+        if hasattr(paginator, "apaginate_queryset"):
+            page = await paginator.apaginate_queryset(queryset, request, view=view)
+        else:
+            page = await sync_to_async(paginator.paginate_queryset)(
+                queryset, request, view=view
+            )
+        return paginator.get_paginated_response(
+            view.get_serializer(page, many=True).data
+        )
@@ -0,0 +1,121 @@
+import hashlib
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Max
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.http import http_date, parse_http_date_safe
+from rest_framework.renderers import JSONRenderer
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    version: str
+    body: bytes
+    last_modified: Optional[datetime]
+    
+    @property
+    def etag(self) -> str:
+        return f'"{self.version}"'
+
+
+class CatalogCache:
+    """
+    Two-level cache for small reference tables served as pre-rendered JSON.
+    Each worker keeps the rendered catalog in memory for `ttl` seconds and
+    then revalidates its version against Django's cache. Writes call
+    invalidate(), which drops the cached version.
+    - The version is a hash of the rendered body, so ETags agree between
+      workers and survive re-rendering unchanged data
+    - Cache entries also expire after `ttl`, so with a per-process backend
+      (LocMemCache), where another worker's invalidate() is never seen, a
+      worker still re-renders within 2 * `ttl` of a write
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        get_queryset: Callable[[], Any],
+        serializer_class: Any,
+        ttl: Optional[int] = None,
+    ) -> None:
+        self.name = name
+        self.get_queryset = get_queryset
+        self.serializer_class = serializer_class
+        self.ttl = settings.CATALOG_CACHE_TTL if ttl is None else ttl
+        self._local: Optional[CatalogEntry] = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+    
+    @property
+    def version_key(self) -> str:
+        return f"catalog:{self.name}:version"
+    
+    def body_key(self, version: str) -> str:
+        return f"catalog:{self.name}:{version}"
+    
+    def render(self) -> CatalogEntry:
+        queryset = self.get_queryset()
+        data = self.serializer_class(queryset, many=True).data
+        body = JSONRenderer().render(
+            {"count": len(data), "next": None, "previous": None, "results": data}
+        )
+        last_modified = queryset.aggregate(last=Max("updated_at"))["last"]
+        version = hashlib.sha256(body).hexdigest()[:32]
+        return CatalogEntry(version=version, body=body, last_modified=last_modified)
+    
+    def get(self) -> CatalogEntry:
+        local = self._local
+        if local is not None and time.monotonic() < self._expires_at:
+            return local
+        
+        with self._lock:
+            version = cache.get(self.version_key)
+            if local is None or local.version != version:
+                local = cache.get(self.body_key(version)) if version else None
+                if local is None:
+                    local = self.render()
+                    cache.set(self.body_key(local.version), local, timeout=self.ttl)
+                    cache.set(self.version_key, local.version, timeout=self.ttl)
+            
+            self._local = local
+            self._expires_at = time.monotonic() + self.ttl
+            return local
+    
+    def invalidate(self) -> None:
+        cache.delete(self.version_key)
+        with self._lock:
+            self._local = None
+            self._expires_at = 0.0
+
+
+def catalog_response(request: Any, entry: CatalogEntry) -> HttpResponse:
+    """
+    Serve a catalog entry, answering 304 when the client's copy is current.
+    """
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match:
+        not_modified = entry.etag in [tag.strip() for tag in if_none_match.split(",")]
+    else:
+        since = parse_http_date_safe(request.headers.get("If-Modified-Since", ""))
+        not_modified = bool(
+            since
+            and entry.last_modified
+            and int(entry.last_modified.timestamp()) <= since
+        )
+    
+    headers: Dict[str, str] = {"ETag": entry.etag}
+    if entry.last_modified:
+        headers["Last-Modified"] = http_date(entry.last_modified.timestamp())
+    
+    if not_modified:
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(entry.body, content_type="application/json")
+    for header, value in headers.items():
+        response[header] = value
+    return response
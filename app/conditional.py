@@ -0,0 +1,86 @@
+import hashlib
+from typing import Any, Optional, Sequence
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from rest_framework.request import Request
+
+
+class ConditionalGetMixin:
+    """
+    Adds ETag support to GET requests of detail views.
+    The ETag is derived from the latest `updated_at` of the object and the
+    related rows it renders (one aggregate query), so a matching
+    If-None-Match is answered with 304 before anything is serialized.
+    Paginated lists don't use it: the aggregate would scan every row the
+    filters match, not just the page served.
+    - `conditional_fields` lists the timestamps that feed the validator,
+      including those of related rows rendered along with the object
+      (author or team names, members)
+    - `conditional_counts` lists relations whose distinct row count feeds
+      it too, for related rows removed without touching a timestamp (e.g.
+      a member deleted along with their user)
+    Views that define their own get() call check_not_modified() and
+    add_etag() themselves.
+    """
+    conditional_fields: Sequence[str] = ("updated_at",)
+    conditional_counts: Sequence[str] = ()
+    
+    def get_conditional_queryset(self):  # type: ignore[no-untyped-def]
+        queryset = self.filter_queryset(self.get_queryset())  # type: ignore[attr-defined]
+        lookup_url_kwarg = getattr(self, "lookup_url_kwarg", None) or getattr(
+            self, "lookup_field", None
+        )
+        if lookup_url_kwarg and lookup_url_kwarg in self.kwargs:  # type: ignore[attr-defined]
+            queryset = queryset.filter(
+                **{self.lookup_field: self.kwargs[lookup_url_kwarg]}  # type: ignore[attr-defined]
+            )
+        return queryset
+    
+    def get_etag_salt(self, request: Request) -> Any:
+        """
+        Extra inputs to the ETag for responses that change without a row
+        changing (e.g. values relative to the current date).
+        """
+        return None
+    
+    def get_etag(self, request: Request) -> Optional[str]:
+        queryset = self.get_conditional_queryset().order_by()
+        validators = queryset.aggregate(
+            count=Count("pk", distinct=True),
+            **{f"last_{index}": Max(field) for index, field in enumerate(self.conditional_fields)},
+            **{
+                f"count_{index}": Count(relation, distinct=True)
+                for index, relation in enumerate(self.conditional_counts)
+            },
+        )
+        key = repr(
+            (
+                request.get_full_path(),
+                getattr(request.user, "pk", None),
+                request.headers.get("Accept", ""),
+                self.get_etag_salt(request),
+                sorted(validators.items()),
+            )
+        )
+        return 'W/"%s"' % hashlib.md5(key.encode(), usedforsecurity=False).hexdigest()
+    
+    def check_not_modified(self, request: Request) -> Any:
+        """
+        Return a 304 response if the client's ETag is current, else None.
+        """
+        self.etag = self.get_etag(request)
+        not_modified = get_conditional_response(request, etag=self.etag)
+        if not_modified is not None:
+            not_modified["ETag"] = self.etag
+        return not_modified
+    
+    def add_etag(self, response: Any) -> Any:
+        if getattr(self, "etag", None) and response.status_code == 200:
+            response["ETag"] = self.etag
+        return response
+    
+    def get(self, request: Request, *args: Any, **kwargs: Any) -> Any:
+        not_modified = self.check_not_modified(request)
+        if not_modified is not None:
+            return not_modified
+        return self.add_etag(super().get(request, *args, **kwargs))  # type: ignore[misc]
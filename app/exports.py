@@ -0,0 +1,172 @@
+import csv
+import json
+import uuid
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from typing import Any, Iterable, Iterator, Sequence
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.http import StreamingHttpResponse
+from django_filters.filterset import filterset_factory
+from rest_framework.renderers import BaseRenderer
+from rest_framework.request import Request
+
+
+class _LineBuffer:
+    """
+    File-like object whose write() hands the line back to the caller
+    """
+    
+    def write(self, value: str) -> str:
+        return value
+
+
+def _export_value(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+def export_lines(
+    columns: Sequence[str], rows: Iterable[Sequence[Any]], fmt: str
+) -> Iterator[str]:
+    """
+    Yield rows one line at a time as CSV (with a header) or NDJSON.
+    Nothing is buffered, so memory use doesn't depend on the row count.
+    """
+    if fmt == "ndjson":
+        for row in rows:
+            record = dict(zip(columns, (_export_value(value) for value in row)))
+            yield json.dumps(record) + "\n"
+        return
+    
+    writer = csv.writer(_LineBuffer())
+    yield writer.writerow(columns)
+    for row in rows:
+        yield writer.writerow(
+            ["" if value is None else _export_value(value) for value in row]
+        )
+
+
+class CSVRenderer(BaseRenderer):
+    media_type = "text/csv"
+    format = "csv"
+    charset = "utf-8"
+    
+    def render(self, data, accepted_media_type=None, renderer_context=None):  # type: ignore[no-untyped-def]
+        if data is None:
+            return b""
+        records = data if isinstance(data, list) else [data]
+        columns = list(records[0]) if records else []
+        rows = ([record.get(column) for column in columns] for record in records)
+        return "".join(export_lines(columns, rows, self.format)).encode()
+
+
+class NDJSONRenderer(BaseRenderer):
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+    charset = "utf-8"
+    
+    def render(self, data, accepted_media_type=None, renderer_context=None):  # type: ignore[no-untyped-def]
+        if data is None:
+            return b""
+        records = data if isinstance(data, list) else [data]
+        return "".join(json.dumps(record) + "\n" for record in records).encode()
+
+
+class ExportMixin(ABC):
+    """
+    Streams the view's filtered queryset as CSV or NDJSON.
+    The format is picked with `?format=csv|ndjson` or the Accept header.
+    Views define `export_columns` and `get_export_rows(queryset)`.
+    """
+    renderer_classes = (CSVRenderer, NDJSONRenderer)
+    export_columns: Sequence[str] = ()
+    export_filename = "export"
+    export_chunk_size = settings.EXPORT_CHUNK_SIZE
+    
+    @abstractmethod
+    def get_export_rows(self, queryset: Any) -> Iterable[Sequence[Any]]:
+        ...
+    
+    def get(self, request: Request, *args: Any, **kwargs: Any) -> StreamingHttpResponse:
+        queryset = self.filter_queryset(self.get_queryset())  # type: ignore[attr-defined]
+        renderer = request.accepted_renderer
+        response = StreamingHttpResponse(
+            export_lines(self.export_columns, self.get_export_rows(queryset), renderer.format),
+            content_type=f"{renderer.media_type}; charset=utf-8",
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="{self.export_filename}.{renderer.format}"'
+        )
+        return response
+
+
+class BaseExportCommand(BaseCommand, ABC):
+    """
+    Management command that streams a model to a CSV or NDJSON file.
+    Filters use the same filterset fields as the matching list view,
+    e.g. `--filter team=<uuid> --filter year=2024`.
+    Commands define `get_export_rows(queryset, chunk_size)`.
+    """
+    model: Any = None
+    filterset_fields: Sequence[str] = ()
+    export_columns: Sequence[str] = ()
+    
+    @abstractmethod
+    def get_export_rows(self, queryset: Any, chunk_size: int) -> Iterable[Sequence[Any]]:
+        ...
+    
+    def add_arguments(self, parser: Any) -> None:
+        parser.add_argument("--format", choices=("csv", "ndjson"), default="csv")
+        parser.add_argument(
+            "--output", help="File to write to. Defaults to standard output."
+        )
+        parser.add_argument(
+            "--filter",
+            action="append",
+            default=[],
+            metavar="FIELD=VALUE",
+            help=f"Filter on one of: {', '.join(self.filterset_fields)}",
+        )
+        parser.add_argument(
+            "--chunk-size", type=int, default=settings.EXPORT_CHUNK_SIZE
+        )
+    
+    def get_queryset(self, filters: Sequence[str]) -> Any:
+        data = {}
+        for item in filters:
+            field, sep, value = item.partition("=")
+            if not sep or field not in self.filterset_fields:
+                raise CommandError(f"Invalid filter: {item}")
+            data[field] = value
+        
+        filterset_class = filterset_factory(self.model, fields=list(self.filterset_fields))
+        filterset = filterset_class(data, queryset=self.model.objects.all())
+        if not filterset.is_valid():
+            raise CommandError(f"Invalid filters: {dict(filterset.errors)}")
+        return filterset.qs
+    
+    def handle(self, *args: Any, **options: Any) -> None:
+        queryset = self.get_queryset(options["filter"])
+        lines = export_lines(
+            self.export_columns,
+            self.get_export_rows(queryset, options["chunk_size"]),
+            options["format"],
+        )
+        
+        if not options["output"]:
+            for line in lines:
+                self.stdout.write(line, ending="")
+            return
+        
+        count = -1 if options["format"] == "csv" else 0
+        with open(options["output"], "w", newline="", encoding="utf-8") as output:
+            for line in lines:
+                output.write(line)
+                count += 1
+        self.stderr.write(
+            self.style.SUCCESS(f"Exported {count} rows to {options['output']}")
+        )
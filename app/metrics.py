@@ -0,0 +1,165 @@
+import math
+import re
+import threading
+import time
+from collections import Counter, defaultdict, deque
+from typing import Any, Callable, Deque, Dict, List, Sequence, Tuple
+from django.conf import settings
+from django.db import connections
+
+_IN_LIST = re.compile(r"\((?:\s*%s\s*,)+\s*%s\s*\)")
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+\b")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sql(sql: str) -> str:
+    """
+    Collapse literals and IN lists so that repeated statements with
+    different parameters compare equal.
+    """
+    sql = _IN_LIST.sub("(...)", sql)
+    sql = _LITERALS.sub("?", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """
+    Nearest-rank percentile of an already sorted sequence.
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(pct / 100 * len(sorted_values)) - 1, 0)
+    return sorted_values[rank]
+
+
+def summarize(values: Sequence[float]) -> Dict[str, float]:
+    """
+    Mean, p50/p95/p99 and max of a list of samples (nearest-rank), or
+    zeros when there are none.
+    """
+    values = sorted(values)
+    return {
+        "mean": round(sum(values) / len(values), 3) if values else 0.0,
+        "p50": round(percentile(values, 50), 3),
+        "p95": round(percentile(values, 95), 3),
+        "p99": round(percentile(values, 99), 3),
+        "max": round(values[-1], 3) if values else 0.0,
+    }
+
+
+def pool_stats() -> Dict[str, Dict[str, int]]:
+    """
+    psycopg_pool counters for each pooled database in this process:
+    - pool_size / pool_available: connections open, and idle in the pool
+    - requests_waiting: requests waiting for a connection right now
+    - requests_num / requests_queued / requests_wait_ms / requests_errors:
+      checkouts since start, how many waited, total wait, timeouts
+    - connections_num / connections_errors / connections_lost: connections
+      opened, failed attempts, and ones found broken by the health check
+    """
+    stats = {}
+    for alias in connections:
+        pool = getattr(connections[alias], "pool", None)
+        if pool is not None:
+            stats[alias] = pool.get_stats()
+    return stats
+
+
+class QueryRecorder:
+    """
+    connection.execute_wrapper callback that times every statement of a
+    request.
+    """
+    
+    def __init__(self) -> None:
+        self.count = 0
+        self.duration = 0.0
+        self.statements: List[Tuple[float, str]] = []
+        self.shapes: Counter = Counter()
+    
+    def __call__(self, execute: Callable, sql: str, params: Any, many: bool, context: Any) -> Any:
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - started
+            self.count += 1
+            self.duration += elapsed
+            self.statements.append((elapsed, sql))
+            self.shapes[normalize_sql(sql)] += 1
+    
+    def slowest(self, limit: int) -> List[Tuple[float, str]]:
+        return sorted(self.statements, key=lambda item: item[0], reverse=True)[:limit]
+    
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """
+        Statement shapes executed at least `threshold` times (likely N+1)
+        """
+        return [(sql, count) for sql, count in self.shapes.most_common() if count >= threshold]
+
+
+class RequestMetricsStore:
+    """
+    Rolling per-URL-name window of sampled request timings for this process.
+    """
+    
+    def __init__(self, window: int, slow_statements: int) -> None:
+        self.window = window
+        self.slow_statements = slow_statements
+        self._lock = threading.Lock()
+        self._samples: Dict[str, Deque[Dict[str, float]]] = defaultdict(
+            lambda: deque(maxlen=self.window)
+        )
+        self._slowest: Dict[str, List[Tuple[float, str]]] = defaultdict(list)
+        self._n_plus_one: Dict[str, Counter] = defaultdict(Counter)
+    
+    def record(
+        self,
+        url_name: str,
+        timings: Dict[str, float],
+        slowest: List[Tuple[float, str]],
+        repeated: List[Tuple[str, int]],
+    ) -> None:
+        with self._lock:
+            self._samples[url_name].append(timings)
+            merged = self._slowest[url_name] + [(ms, sql[:500]) for ms, sql in slowest]
+            self._slowest[url_name] = sorted(merged, reverse=True)[: self.slow_statements]
+            for sql, count in repeated:
+                self._n_plus_one[url_name][sql[:500]] = max(
+                    self._n_plus_one[url_name][sql[:500]], count
+                )
+    
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            samples = {name: list(window) for name, window in self._samples.items()}
+            slowest = {name: list(items) for name, items in self._slowest.items()}
+            n_plus_one = {name: dict(counter) for name, counter in self._n_plus_one.items()}
+        
+        report = {}
+        for name, window in samples.items():
+            entry: Dict[str, Any] = {"samples": len(window)}
+            for metric in ("total_ms", "db_ms", "app_ms", "render_ms", "queries"):
+                entry[metric] = summarize([sample[metric] for sample in window])
+            entry["slowest_statements"] = [
+                {"ms": round(ms, 3), "sql": sql} for ms, sql in slowest.get(name, [])
+            ]
+            entry["repeated_statements"] = [
+                {"count": count, "sql": sql}
+                for sql, count in sorted(
+                    n_plus_one.get(name, {}).items(), key=lambda item: -item[1]
+                )
+            ]
+            report[name] = entry
+        return report
+    
+    def reset(self) -> None:
+        with self._lock:
+            self._samples.clear()
+            self._slowest.clear()
+            self._n_plus_one.clear()
+
+
+request_metrics = RequestMetricsStore(
+    window=settings.REQUEST_METRICS_WINDOW,
+    slow_statements=settings.REQUEST_METRICS_SLOW_STATEMENTS,
+)
@@ -0,0 +1,123 @@
+import logging
+import random
+import time
+from contextlib import ExitStack
+from typing import Any, Callable
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.http import HttpRequest, HttpResponse
+from app.metrics import QueryRecorder, request_metrics
+from app.replicas import end_routing, finish_routing, install_query_counter, start_routing
+
+logger = logging.getLogger(__name__)
+
+
+class RequestMetricsMiddleware:
+    """
+    Samples requests and records, per resolved URL name:
+    - query count and total database time (via connection.execute_wrapper)
+    - time spent rendering the response body
+    - application time (view and serializer code outside the database)
+    - the slowest statements and statement shapes repeated within one
+      request, which usually point at an N+1 pattern
+    Sampled responses carry a Server-Timing header so the breakdown shows
+    up in browser devtools and load-test output.
+    Off unless REQUEST_METRICS_ENABLED is set.
+    """
+    
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        if not settings.REQUEST_METRICS_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+    
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if random.random() >= settings.REQUEST_METRICS_SAMPLE_RATE:
+            return self.get_response(request)
+        
+        recorder = QueryRecorder()
+        request._metrics_render = [0.0, 0.0]  # type: ignore[attr-defined]
+        started = time.perf_counter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(recorder))
+            response = self.get_response(request)
+        total = time.perf_counter() - started
+        
+        render_started, render_finished = request._metrics_render  # type: ignore[attr-defined]
+        render = max(render_finished - render_started, 0.0)
+        timings = {
+            "total_ms": total * 1000,
+            "db_ms": recorder.duration * 1000,
+            "render_ms": render * 1000,
+            "app_ms": max(total - recorder.duration - render, 0.0) * 1000,
+            "queries": recorder.count,
+        }
+        repeated = recorder.repeated(settings.REQUEST_METRICS_N_PLUS_ONE_THRESHOLD)
+        url_name = self.get_url_name(request)
+        request_metrics.record(
+            url_name,
+            timings,
+            [(ms * 1000, sql) for ms, sql in recorder.slowest(settings.REQUEST_METRICS_SLOW_STATEMENTS)],
+            repeated,
+        )
+        if repeated:
+            logger.warning(
+                "Possible N+1 on %s: %s",
+                url_name,
+                "; ".join(f"{count}x {sql[:200]}" for sql, count in repeated),
+            )
+        
+        response["Server-Timing"] = ", ".join(
+            [
+                f'db;dur={timings["db_ms"]:.2f};desc="{recorder.count} queries"',
+                f'app;dur={timings["app_ms"]:.2f}',
+                f'render;dur={timings["render_ms"]:.2f}',
+                f'total;dur={timings["total_ms"]:.2f}',
+            ]
+        )
+        return response
+    
+    def process_template_response(self, request: HttpRequest, response: Any) -> Any:
+        """
+        DRF responses are rendered after the view returns; time that step.
+        """
+        marks = getattr(request, "_metrics_render", None)
+        if marks is not None:
+            marks[0] = time.perf_counter()
+            
+            def finish_render(rendered: Any) -> None:
+                marks[1] = time.perf_counter()
+            
+            response.add_post_render_callback(finish_render)
+        return response
+    
+    @staticmethod
+    def get_url_name(request: HttpRequest) -> str:
+        match = getattr(request, "resolver_match", None)
+        if match is None:
+            return "<unresolved>"
+        return match.view_name or match.route or "<unnamed>"
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Tracks where each request reads from (see app.replicas): views opt in
+    to replica reads, any write pins the rest of the request to the
+    primary, and a client that wrote stays there for REPLICA_STICKY_SECONDS.
+    """
+    
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+        # Count queries on connections opened before this module was loaded
+        for connection in connections.all(initialized_only=True):
+            install_query_counter(None, connection)
+    
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        routing, token = start_routing()
+        try:
+            response = self.get_response(request)
+            finish_routing(request, routing, response)
+        finally:
+            end_routing(token)
+        return response
@@ -0,0 +1,238 @@
+import base64
+import binascii
+import json
+import uuid
+from datetime import date, datetime
+from functools import reduce
+from operator import or_
+from typing import Any, List, Optional, Sequence
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.filters import OrderingFilter
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (seek) pagination with opaque cursors.
+    Pages are located with a WHERE clause on the ordering fields plus the
+    primary key as a tiebreaker instead of OFFSET, so reading page 10,000
+    costs the same as reading page 1. The total count is included by
+    default for compatibility and can be skipped with `?count=false`.
+    `max_page_size` defaults to KEYSET_PAGINATION_MAX_PAGE_SIZE.
+    """
+    page_size = api_settings.PAGE_SIZE
+    page_size_query_param = "page_size"
+    max_page_size: Optional[int] = None
+    cursor_query_param = "cursor"
+    count_query_param = "count"
+    invalid_cursor_message = "Invalid cursor"
+    
+    def get_page_size(self, request: Any) -> int:
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size or settings.KEYSET_PAGINATION_MAX_PAGE_SIZE)
+    
+    def include_count(self, request: Any) -> bool:
+        value = request.query_params.get(self.count_query_param, "true")
+        return value.lower() not in ("false", "0", "no")
+    
+    def get_ordering(self, request: Any, queryset: Any, view: Any) -> List[str]:
+        """
+        Ordering from the view's OrderingFilter (or the queryset/model
+        default), always ending in the primary key so rows are totally
+        ordered.
+        """
+        ordering = None
+        if view is not None and OrderingFilter in getattr(view, "filter_backends", []):
+            ordering = OrderingFilter().get_ordering(request, queryset, view)
+        if not ordering:
+            ordering = queryset.query.order_by or queryset.model._meta.ordering
+        pk_name = queryset.model._meta.pk.name
+        ordering = [
+            field.replace("pk", pk_name) if field.lstrip("-") == "pk" else field
+            for field in ordering
+            if isinstance(field, str)
+        ]
+        if not any(field.lstrip("-") == pk_name for field in ordering):
+            descending = bool(ordering) and ordering[-1].startswith("-")
+            ordering.append(f"-{pk_name}" if descending else pk_name)
+        return ordering
+    
+    def prepare(self, queryset: Any, request: Any, view: Any = None) -> tuple:
+        """
+        Resolve page size, ordering and cursor; return the page queryset
+        (one row longer than the page) and the cursor position.
+        """
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.model = queryset.model
+        
+        position, reverse = self.decode_cursor(request)
+        self.count = None
+        
+        page_queryset = queryset
+        if position is not None:
+            page_queryset = page_queryset.filter(self.keyset_filter(position, reverse))
+        
+        ordering = self.ordering
+        if reverse:
+            ordering = [self.flip(field) for field in ordering]
+        page_queryset = page_queryset.order_by(*ordering)[: self.page_size + 1]
+        return page_queryset, position, reverse
+    
+    def finish(self, results: list, position: Any, reverse: bool) -> list:
+        has_more = len(results) > self.page_size
+        results = results[: self.page_size]
+        
+        if reverse:
+            results.reverse()
+            self.has_previous, self.has_next = has_more, True
+        else:
+            self.has_previous, self.has_next = position is not None, has_more
+        
+        self.page = results
+        return results
+    
+    def paginate_queryset(self, queryset: Any, request: Any, view: Any = None) -> Optional[list]:
+        page_queryset, position, reverse = self.prepare(queryset, request, view)
+        if self.include_count(request):
+            self.count = queryset.count()
+        return self.finish(list(page_queryset), position, reverse)
+    
+    async def apaginate_queryset(self, queryset: Any, request: Any, view: Any = None) -> list:
+        """
+        Async variant of paginate_queryset for the async read views.
+        """
+        page_queryset, position, reverse = self.prepare(queryset, request, view)
+        if self.include_count(request):
+            self.count = await queryset.acount()
+        results = [obj async for obj in page_queryset]
+        return self.finish(results, position, reverse)
+    
+    @staticmethod
+    def flip(field: str) -> str:
+        return field[1:] if field.startswith("-") else f"-{field}"
+    
+    def keyset_filter(self, position: Sequence[Any], reverse: bool) -> Q:
+        """
+        Rows strictly after `position` in the current ordering, expanded as
+        (a < x) OR (a = x AND b < y) OR ... for each ordering field.
+        """
+        clauses = []
+        for index, field in enumerate(self.ordering):
+            name = field.lstrip("-")
+            descending = field.startswith("-") != reverse
+            lookup = "lt" if descending else "gt"
+            clause = Q(**{f"{name}__{lookup}": position[index]})
+            for previous_field, value in zip(self.ordering[:index], position):
+                clause &= Q(**{previous_field.lstrip("-"): value})
+            clauses.append(clause)
+        return reduce(or_, clauses)
+    
+    def get_position(self, obj: Any) -> list:
+        return [getattr(obj, field.lstrip("-")) for field in self.ordering]
+    
+    @staticmethod
+    def encode_value(value: Any) -> Any:
+        if isinstance(value, (datetime, date)):
+            return value.isoformat()
+        if isinstance(value, uuid.UUID):
+            return str(value)
+        return value
+    
+    def encode_cursor(self, position: Sequence[Any], reverse: bool) -> str:
+        payload = {"p": [self.encode_value(value) for value in position]}
+        if reverse:
+            payload["r"] = 1
+        data = json.dumps(payload, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(data).decode().rstrip("=")
+    
+    def decode_value(self, name: str, value: Any) -> Any:
+        """
+        Cursor value for an ordering field. Annotations such as a search
+        rank are not model fields and must already be numbers.
+        """
+        try:
+            field = self.model._meta.get_field(name)
+        except FieldDoesNotExist:
+            if not isinstance(value, (int, float)) or isinstance(value, bool):
+                raise ValueError(name)
+            return value
+        return field.to_python(value)
+    
+    def decode_cursor(self, request: Any) -> tuple:
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+        try:
+            padded = encoded + "=" * (-len(encoded) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            raw_position = payload["p"]
+            if len(raw_position) != len(self.ordering):
+                raise ValueError
+            position = [
+                self.decode_value(field.lstrip("-"), value)
+                for field, value in zip(self.ordering, raw_position)
+            ]
+        except (
+            binascii.Error,
+            FieldDoesNotExist,
+            KeyError,
+            TypeError,
+            ValueError,
+            ValidationError,
+        ):
+            raise NotFound(self.invalid_cursor_message)
+        return position, bool(payload.get("r"))
+    
+    def build_link(self, position: Sequence[Any], reverse: bool) -> str:
+        url = self.request.build_absolute_uri()
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(position, reverse)
+        )
+    
+    def get_next_link(self) -> Optional[str]:
+        if not self.has_next or not self.page:
+            return None
+        return self.build_link(self.get_position(self.page[-1]), reverse=False)
+    
+    def get_previous_link(self) -> Optional[str]:
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(
+                self.request.build_absolute_uri(), self.cursor_query_param
+            )
+        return self.build_link(self.get_position(self.page[0]), reverse=True)
+    
+    def get_paginated_response(self, data: Any) -> Response:
+        response = {}
+        if self.count is not None:
+            response["count"] = self.count
+        response["next"] = self.get_next_link()
+        response["previous"] = self.get_previous_link()
+        response["results"] = data
+        return Response(response)
+    
+    def get_paginated_response_schema(self, schema: Any) -> Any:
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "count": {"type": "integer"},
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
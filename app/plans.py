@@ -0,0 +1,61 @@
+import re
+from typing import Any, Dict, Optional
+
+SQLITE_ACCESS = re.compile(
+    r"\b(?P<kind>SCAN|SEARCH) (?P<table>\w+)"
+    r"(?: USING (?:COVERING |INTEGER PRIMARY KEY)?(?:INDEX (?P<index>\w+))?)?"
+)
+POSTGRES_ACCESS = re.compile(
+    r"(?P<kind>Seq Scan|Index Only Scan|Index Scan|Bitmap Index Scan|Bitmap Heap Scan)"
+    r"(?: Backward)?(?: using (?P<index>\w+))? on (?P<table>\w+)"
+)
+POSTGRES_BITMAP_INDEX = re.compile(r"Bitmap Index Scan on (?P<index>\w+)")
+POSTGRES_SORT = re.compile(r"^\s*(?:->\s*)?(?:Incremental )?Sort\b", re.MULTILINE)
+
+
+def explain(queryset: Any) -> str:
+    """
+    The database's plan for a queryset, as text.
+    """
+    return queryset.explain()
+
+
+def classify_plan(plan: str, table: str, vendor: str) -> Dict[str, Any]:
+    """
+    How a plan reads `table`:
+    - `access` is `seq_scan` (every row), `index_scan` (a whole index, in
+      order) or `index_search` (a range of an index)
+    - `index` names the index used, if any
+    - `sort` is True when rows are sorted after they are read
+    Only SQLite and PostgreSQL plans are understood; on PostgreSQL an index
+    node counts as a search when the plan has an index condition.
+    """
+    access: Optional[str] = None
+    index = None
+    if vendor == "postgresql":
+        for match in POSTGRES_ACCESS.finditer(plan):
+            if match.group("table") != table:
+                continue
+            if match.group("kind") == "Seq Scan":
+                access = "seq_scan"
+            else:
+                index = match.group("index")
+                if match.group("kind") == "Bitmap Heap Scan":
+                    # The index is named on the Bitmap Index Scan below it
+                    bitmap = POSTGRES_BITMAP_INDEX.search(plan, match.end())
+                    index = bitmap.group("index") if bitmap else None
+                access = "index_search" if "Index Cond" in plan else "index_scan"
+            break
+        sort = bool(POSTGRES_SORT.search(plan))
+    else:
+        for match in SQLITE_ACCESS.finditer(plan):
+            if match.group("table") != table:
+                continue
+            index = match.group("index")
+            if match.group("kind") == "SEARCH":
+                access = "index_search"
+            else:
+                access = "index_scan" if index else "seq_scan"
+            break
+        sort = "USE TEMP B-TREE FOR ORDER BY" in plan
+    return {"access": access, "index": index, "sort": sort}
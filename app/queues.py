@@ -0,0 +1,22 @@
+from typing import Any, List
+from django.db import connections, transaction
+
+
+def claim_rows(queryset: Any, limit: int, **changes: Any) -> List[Any]:
+    """
+    Claim up to `limit` rows of an ordered queue `queryset` by applying
+    `changes` to them, returning the claimed primary keys.
+    - PostgreSQL: rows are selected FOR UPDATE SKIP LOCKED, so concurrent
+      workers claim disjoint rows without waiting on each other
+    - SQLite: the write lock serialises claims
+    The update filters on the primary key alone: with the queue filters
+    too, SQLite walks the status index over the whole backlog.
+    """
+    using = queryset.db
+    with transaction.atomic(using=using):
+        if connections[using].features.has_select_for_update_skip_locked:
+            queryset = queryset.select_for_update(skip_locked=True)
+        pks = list(queryset.values_list("pk", flat=True)[:limit])
+        if pks:
+            queryset.model._default_manager.using(using).filter(pk__in=pks).update(**changes)
+    return pks
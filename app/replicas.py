@@ -0,0 +1,432 @@
+"""
+Read replica routing.
+Writes, and every read outside a request, go to the primary ("default").
+Safe requests to views using ReplicaReadMixin (and admin changelists using
+ReplicaAdminMixin) read from a healthy replica instead, unless:
+- the client wrote within the last REPLICA_STICKY_SECONDS, so it reads
+  its own writes (a signed cookie, and for signed-in users a cache entry,
+  so token clients that drop cookies stick too)
+- the request already wrote
+- no replica passed its last health check (connection and, on
+  PostgreSQL, replication lag under REPLICA_MAX_LAG_SECONDS)
+"""
+import asyncio
+import logging
+import random
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, InterfaceError, OperationalError, connections
+from django.db.backends.signals import connection_created
+from django.http import HttpResponseBase
+from rest_framework.permissions import SAFE_METHODS
+
+logger = logging.getLogger(__name__)
+
+# Seconds since the last replayed transaction, or 0 when the replica has
+# replayed everything it received (an idle primary sends nothing)
+POSTGRES_LAG_SQL = """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+"""
+
+
+def replica_aliases() -> List[str]:
+    return settings.DATABASE_REPLICAS
+
+
+STICKY_COOKIE = "replica_sticky"
+
+
+def sticky_cache_key(user_id: Any) -> str:
+    return f"replica-sticky:{user_id}"
+
+
+def replica_health_cache_key(alias: str) -> str:
+    return f"replica-health:{alias}"
+
+
+def request_user_id(request: Any) -> Optional[Any]:
+    user = getattr(request, "user", None)
+    return user.pk if user is not None and user.is_authenticated else None
+
+
+def is_sticky(request: Any) -> bool:
+    """
+    Whether the client, or the signed-in user, wrote within the last
+    REPLICA_STICKY_SECONDS.
+    """
+    value = request.get_signed_cookie(
+        STICKY_COOKIE, default=None, salt=STICKY_COOKIE, max_age=settings.REPLICA_STICKY_SECONDS
+    )
+    if value is not None:
+        return True
+    user_id = request_user_id(request)
+    return user_id is not None and cache.get(sticky_cache_key(user_id)) is not None
+
+
+class ReadRouting:
+    """
+    Where the current request reads from.
+    """
+    
+    def __init__(self) -> None:
+        self.alias: Optional[str] = None
+        self.wrote = False
+        self.replica_failed = False
+    
+    def read_alias(self) -> Optional[str]:
+        return None if self.wrote else self.alias
+
+
+_routing: ContextVar[Optional[ReadRouting]] = ContextVar("read_routing", default=None)
+
+
+def current_routing() -> Optional[ReadRouting]:
+    return _routing.get()
+
+
+def start_routing() -> Tuple[ReadRouting, Any]:
+    routing = ReadRouting()
+    return routing, _routing.set(routing)
+
+
+def end_routing(token: Any) -> None:
+    _routing.reset(token)
+
+
+class DatabaseMetrics:
+    """
+    Per-process counts of queries run on each database and of the
+    routing decisions made for replica-eligible requests.
+    """
+    
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._queries: Counter = Counter()
+        self._errors: Counter = Counter()
+        self._reads: Counter = Counter()
+    
+    def query(self, alias: str, failed: bool) -> None:
+        with self._lock:
+            self._queries[alias] += 1
+            if failed:
+                self._errors[alias] += 1
+    
+    def read(self, decision: str) -> None:
+        with self._lock:
+            self._reads[decision] += 1
+    
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "queries": dict(self._queries),
+                "errors": dict(self._errors),
+                "reads": dict(self._reads),
+            }
+    
+    def reset(self) -> None:
+        with self._lock:
+            self._queries.clear()
+            self._errors.clear()
+            self._reads.clear()
+
+
+database_metrics = DatabaseMetrics()
+
+
+class ReplicaHealth:
+    """
+    Replica health, shared through the cache for
+    REPLICA_HEALTH_CHECK_INTERVAL seconds. Requests never run the check:
+    when the last result is stale they use it and a background thread
+    re-checks, so a slow replica doesn't hold up reads. A replica nobody
+    has checked yet counts as down. A replica marked down by a failed
+    query stays down until its next check passes.
+    """
+    
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # alias -> (healthy, checked at, lag in seconds, error)
+        self._state: Dict[str, Tuple[bool, float, Optional[float], str]] = {}
+        self._checks: Dict[str, threading.Thread] = {}
+    
+    def is_healthy(self, alias: str) -> bool:
+        state = self._state.get(alias)
+        if state is None or time.monotonic() - state[1] >= settings.REPLICA_HEALTH_CHECK_INTERVAL:
+            shared = cache.get(replica_health_cache_key(alias))
+            if shared is not None:
+                self.store(alias, *shared)
+            else:
+                self.refresh(alias)
+            state = self._state.get(alias)
+        return state is not None and state[0]
+    
+    def refresh(self, alias: str) -> None:
+        """
+        Re-check the replica in a background thread, unless a check is
+        already running.
+        """
+        with self._lock:
+            if alias in self._checks:
+                return
+            thread = threading.Thread(
+                target=self._run_check, args=(alias,), name=f"replica-health-{alias}", daemon=True
+            )
+            self._checks[alias] = thread
+        thread.start()
+    
+    def _run_check(self, alias: str) -> None:
+        try:
+            self.check(alias)
+        finally:
+            connections[alias].close()
+            with self._lock:
+                self._checks.pop(alias, None)
+    
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait for the running checks to finish.
+        """
+        with self._lock:
+            threads = list(self._checks.values())
+        for thread in threads:
+            thread.join(timeout)
+    
+    def check(self, alias: str) -> bool:
+        lag = None
+        error = ""
+        try:
+            lag = self.replication_lag(alias)
+        except DatabaseError as exc:
+            error = f"{type(exc).__name__}: {exc}"
+            connections[alias].close()
+        healthy = lag is not None and lag <= settings.REPLICA_MAX_LAG_SECONDS
+        if not healthy and not error:
+            error = f"Replication lag {lag:.1f}s"
+        self.set(alias, healthy, lag, error)
+        return healthy
+    
+    def replication_lag(self, alias: str) -> float:
+        connection = connections[alias]
+        with connection.cursor() as cursor:
+            if connection.vendor == "postgresql":
+                cursor.execute(POSTGRES_LAG_SQL)
+                return float(cursor.fetchone()[0])
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
+        return 0.0
+    
+    def mark_unhealthy(self, alias: str, error: str) -> None:
+        self.set(alias, False, None, error)
+    
+    def set(self, alias: str, healthy: bool, lag: Optional[float], error: str) -> None:
+        cache.set(
+            replica_health_cache_key(alias), (healthy, lag, error), settings.REPLICA_HEALTH_CHECK_INTERVAL
+        )
+        self.store(alias, healthy, lag, error)
+    
+    def store(self, alias: str, healthy: bool, lag: Optional[float], error: str) -> None:
+        with self._lock:
+            previous = self._state.get(alias)
+            self._state[alias] = (healthy, time.monotonic(), lag, error)
+        if not healthy and (previous is None or previous[0]):
+            logger.warning("Read replica %s is unhealthy: %s", alias, error)
+        elif healthy and previous is not None and not previous[0]:
+            logger.info("Read replica %s is healthy again", alias)
+    
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            state = dict(self._state)
+        now = time.monotonic()
+        return {
+            alias: {
+                "healthy": healthy,
+                "checked_seconds_ago": round(now - checked, 3),
+                "lag_seconds": lag,
+                "error": error,
+            }
+            for alias, (healthy, checked, lag, error) in state.items()
+        }
+    
+    def reset(self) -> None:
+        with self._lock:
+            self._state.clear()
+
+
+replica_health = ReplicaHealth()
+
+
+def choose_replica() -> Optional[str]:
+    """
+    A random healthy replica, or None when there are none.
+    """
+    aliases = replica_aliases()
+    healthy = [alias for alias in aliases if replica_health.is_healthy(alias)]
+    return random.choice(healthy) if healthy else None
+
+
+def allow_replica_reads(request: Any) -> Optional[str]:
+    """
+    Send the rest of the current request's reads to a replica, if one may
+    serve this client. Returns the replica chosen.
+    """
+    routing = current_routing()
+    if routing is None or routing.wrote or not replica_aliases():
+        return None
+    if is_sticky(request):
+        database_metrics.read("sticky")
+        return None
+    routing.alias = choose_replica()
+    database_metrics.read("replica" if routing.alias else "no_healthy_replica")
+    return routing.alias
+
+
+def fail_over_to_primary() -> bool:
+    """
+    After a query on the request's replica failed, send its remaining
+    reads to the primary. Returns False when there was nothing to fail
+    over from.
+    """
+    routing = current_routing()
+    if routing is None or routing.alias is None or not routing.replica_failed:
+        return False
+    routing.alias = None
+    database_metrics.read("failover")
+    return True
+
+
+def in_event_loop() -> bool:
+    """
+    Whether we're on an event loop (the async views), where the sync
+    handlers can't be retried.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def finish_routing(request: Any, routing: ReadRouting, response: HttpResponseBase) -> None:
+    """
+    Keep a client that wrote on the primary for REPLICA_STICKY_SECONDS.
+    """
+    if routing.wrote and replica_aliases():
+        user_id = request_user_id(request)
+        if user_id is not None:
+            cache.set(sticky_cache_key(user_id), True, settings.REPLICA_STICKY_SECONDS)
+        response.set_signed_cookie(
+            STICKY_COOKIE,
+            "1",
+            salt=STICKY_COOKIE,
+            max_age=settings.REPLICA_STICKY_SECONDS,
+            secure=settings.SESSION_COOKIE_SECURE,
+            httponly=True,
+            samesite="Lax",
+        )
+
+
+class ReplicaRouter:
+    """
+    Database router: writes go to the primary, reads follow the current
+    request's ReadRouting.
+    """
+    
+    def db_for_read(self, model: Any, **hints: Any) -> Optional[str]:
+        routing = current_routing()
+        return routing.read_alias() if routing is not None else None
+    
+    def db_for_write(self, model: Any, **hints: Any) -> str:
+        routing = current_routing()
+        if routing is not None:
+            routing.wrote = True
+        return DEFAULT_DB_ALIAS
+    
+    def allow_relation(self, obj1: Any, obj2: Any, **hints: Any) -> bool:
+        # Replicas hold the same data as the primary
+        return True
+    
+    def allow_migrate(self, db: str, app_label: str, **hints: Any) -> bool:
+        # Replicas get their schema through replication
+        return db == DEFAULT_DB_ALIAS
+
+
+class QueryCounter:
+    """
+    connection.execute_wrapper callback counting the statements run on one
+    database. Connection errors on a replica mark it unhealthy.
+    """
+    
+    def __init__(self, alias: str) -> None:
+        self.alias = alias
+    
+    def __call__(self, execute: Callable, sql: str, params: Any, many: bool, context: Any) -> Any:
+        try:
+            result = execute(sql, params, many, context)
+        except (OperationalError, InterfaceError) as exc:
+            database_metrics.query(self.alias, failed=True)
+            if self.alias in replica_aliases():
+                replica_health.mark_unhealthy(self.alias, f"{type(exc).__name__}: {exc}")
+                routing = current_routing()
+                if routing is not None and routing.alias == self.alias:
+                    routing.replica_failed = True
+            raise
+        database_metrics.query(self.alias, failed=False)
+        return result
+
+
+def install_query_counter(sender: Any, connection: Any, **kwargs: Any) -> None:
+    if getattr(connection, "query_counter", None) is None:
+        connection.query_counter = QueryCounter(connection.alias)
+        # First, so the execute_wrapper() context manager, which pops the
+        # last wrapper, never removes it
+        connection.execute_wrappers.insert(0, connection.query_counter)
+
+
+connection_created.connect(install_query_counter)
+
+
+class ReplicaReadMixin:
+    """
+    For list and analytics API views: safe requests read from a replica
+    (see allow_replica_reads). A request whose replica fails mid-way is
+    retried once on the primary.
+    """
+    
+    def initial(self, request, *args, **kwargs):  # type: ignore[no-untyped-def]
+        super().initial(request, *args, **kwargs)  # type: ignore[misc]
+        if request.method in SAFE_METHODS:
+            allow_replica_reads(request)
+    
+    def handle_exception(self, exc):  # type: ignore[no-untyped-def]
+        if (
+            isinstance(exc, (OperationalError, InterfaceError))
+            and not in_event_loop()
+            and fail_over_to_primary()
+        ):
+            handler = getattr(self, self.request.method.lower(), self.http_method_not_allowed)  # type: ignore[attr-defined]
+            try:
+                return handler(self.request, *self.args, **self.kwargs)  # type: ignore[attr-defined]
+            except Exception as retry_exc:
+                exc = retry_exc
+        return super().handle_exception(exc)  # type: ignore[misc]
+
+
+class ReplicaAdminMixin:
+    """
+    For ModelAdmins with heavy changelists: the changelist page reads from
+    a replica. Edits and their redirects stay on the primary.
+    """
+    
+    def changelist_view(self, request, extra_context=None):  # type: ignore[no-untyped-def]
+        if request.method in SAFE_METHODS:
+            allow_replica_reads(request)
+        return super().changelist_view(request, extra_context)  # type: ignore[misc]
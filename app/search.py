@@ -0,0 +1,259 @@
+import re
+from typing import Any, List, Optional
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import connections
+from django.db.models import BooleanField, F, FloatField, Q
+from django.db.models.expressions import RawSQL
+from rest_framework.filters import BaseFilterBackend
+
+SEARCH_TERM = re.compile(r"\w+", re.UNICODE)
+
+search_indexes: List["SearchIndex"] = []
+
+
+class SearchIndex:
+    """
+    Full-text index over one text column of a model.
+    - PostgreSQL: a `search_vector` tsvector column kept current by a
+      trigger (tsvector_update_trigger) and a GIN index over it
+    - SQLite: an FTS5 table `<table>_fts` whose rowids mirror the model
+      table's, kept current by insert/update/delete triggers
+    - anything else: an unranked `icontains` scan
+    install() creates whichever is missing after every migrate, and
+    rebuilds the index contents when its triggers had to be (re)created.
+    Ranked results are annotated as `search_rank`, higher is better.
+    """
+    rank_field = "search_rank"
+    
+    def __init__(self, model: Any, field: str, vector_field: str = "search_vector") -> None:
+        self.model = model
+        self.field = field
+        self.vector_field = vector_field
+    
+    @property
+    def table(self) -> str:
+        return self.model._meta.db_table
+    
+    @property
+    def fts_table(self) -> str:
+        return f"{self.table}_fts"
+    
+    @property
+    def trigger(self) -> str:
+        return f"{self.table}_search"
+    
+    @property
+    def config(self) -> str:
+        return settings.SEARCH_CONFIG
+    
+    def vendor(self, using: str) -> str:
+        return connections[using].vendor
+    
+    def install(self, using: str = "default") -> bool:
+        """
+        Create the index and its triggers if missing. Returns True when they
+        were created, in which case the index was also (re)built.
+        """
+        connection = connections[using]
+        with connection.cursor() as cursor:
+            if self.table not in connection.introspection.table_names(cursor):
+                return False
+            columns = {
+                column.name
+                for column in connection.introspection.get_table_description(cursor, self.table)
+            }
+        vendor = self.vendor(using)
+        if vendor == "postgresql" and self.vector_field not in columns:
+            return False
+        if vendor == "postgresql":
+            return self.install_postgres(using)
+        if vendor == "sqlite":
+            return self.install_sqlite(using)
+        return False
+    
+    def rebuild(self, using: str = "default") -> None:
+        """
+        Recompute the index for every row.
+        """
+        vendor = self.vendor(using)
+        with connections[using].cursor() as cursor:
+            if vendor == "postgresql":
+                cursor.execute(
+                    f'UPDATE "{self.table}" SET "{self.vector_field}" = '
+                    f'to_tsvector(%s::regconfig, coalesce("{self.field}", \'\'))',
+                    [self.config],
+                )
+            elif vendor == "sqlite":
+                cursor.execute(f'DELETE FROM "{self.fts_table}"')
+                cursor.execute(
+                    f'INSERT INTO "{self.fts_table}" (rowid, body) '
+                    f'SELECT rowid, coalesce("{self.field}", \'\') FROM "{self.table}"'
+                )
+    
+    def install_postgres(self, using: str) -> bool:
+        with connections[using].cursor() as cursor:
+            cursor.execute(
+                f'CREATE INDEX IF NOT EXISTS "{self.table}_search_gin" '
+                f'ON "{self.table}" USING gin ("{self.vector_field}")'
+            )
+            cursor.execute(
+                "SELECT 1 FROM pg_trigger WHERE tgrelid = to_regclass(%s) AND tgname = %s",
+                [self.table, self.trigger],
+            )
+            if cursor.fetchone():
+                return False
+            cursor.execute(
+                f'CREATE TRIGGER "{self.trigger}" BEFORE INSERT OR UPDATE ON "{self.table}" '
+                f"FOR EACH ROW EXECUTE FUNCTION tsvector_update_trigger("
+                f"'{self.vector_field}', 'pg_catalog.{self.config}', '{self.field}')"
+            )
+        self.rebuild(using)
+        return True
+    
+    def install_sqlite(self, using: str) -> bool:
+        triggers = {
+            f"{self.trigger}_insert": (
+                f'AFTER INSERT ON "{self.table}" BEGIN '
+                f'INSERT INTO "{self.fts_table}" (rowid, body) '
+                f'VALUES (new.rowid, coalesce(new."{self.field}", \'\')); END'
+            ),
+            f"{self.trigger}_update": (
+                f'AFTER UPDATE OF "{self.field}" ON "{self.table}" BEGIN '
+                f'UPDATE "{self.fts_table}" SET body = coalesce(new."{self.field}", \'\') '
+                f"WHERE rowid = old.rowid; END"
+            ),
+            f"{self.trigger}_delete": (
+                f'AFTER DELETE ON "{self.table}" BEGIN '
+                f'DELETE FROM "{self.fts_table}" WHERE rowid = old.rowid; END'
+            ),
+        }
+        with connections[using].cursor() as cursor:
+            cursor.execute(
+                f'CREATE VIRTUAL TABLE IF NOT EXISTS "{self.fts_table}" '
+                "USING fts5(body, tokenize='unicode61')"
+            )
+            cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'trigger' AND tbl_name = %s",
+                [self.table],
+            )
+            existing = {row[0] for row in cursor.fetchall()}
+            missing = [name for name in triggers if name not in existing]
+            for name in missing:
+                cursor.execute(f'CREATE TRIGGER "{name}" {triggers[name]}')
+        if missing:
+            # Rebuilding the table in a migration drops its triggers and
+            # may renumber rowids, so the FTS rows can't be trusted.
+            self.rebuild(using)
+        return bool(missing)
+    
+    def fts_query(self, text: str) -> Optional[str]:
+        """
+        FTS5 query matching every word of `text` as a prefix ("deploy"
+        finds "deployments"), with the words quoted so user input can't use
+        the FTS5 query syntax.
+        """
+        terms = SEARCH_TERM.findall(text)
+        if not terms:
+            return None
+        return " ".join(f'"{term}"*' for term in terms)
+    
+    def condition(self, text: str, using: str = "default") -> Q:
+        """
+        Filter for rows matching `text`, for the model table unaliased.
+        """
+        vendor = self.vendor(using)
+        if vendor == "postgresql":
+            query = SearchQuery(text, config=self.config, search_type="websearch")
+            return Q(**{self.vector_field: query})
+        if vendor != "sqlite":
+            return Q(**{f"{self.field}__icontains": text})
+        match = self.fts_query(text)
+        if match is None:
+            return Q(pk__in=[])
+        return Q(
+            RawSQL(
+                f'"{self.table}".rowid IN (SELECT rowid FROM "{self.fts_table}" '
+                f'WHERE "{self.fts_table}" MATCH %s)',
+                [match],
+                output_field=BooleanField(),
+            )
+        )
+    
+    def rank(self, text: str) -> Any:
+        """
+        PostgreSQL rank expression for `text`.
+        """
+        query = SearchQuery(text, config=self.config, search_type="websearch")
+        return SearchRank(F(self.vector_field), query)
+    
+    def search(self, queryset: Any, text: str) -> Any:
+        """
+        Rows of `queryset` matching `text`, best match first.
+        On SQLite the rows are filtered with one FTS subquery and only the
+        matches are ranked, each with a bm25() lookup by rowid.
+        """
+        vendor = self.vendor(queryset.db)
+        if vendor == "postgresql":
+            queryset = queryset.filter(self.condition(text, queryset.db))
+            rank = self.rank(text)
+        elif vendor == "sqlite":
+            match = self.fts_query(text)
+            if match is None:
+                return queryset.none()
+            queryset = queryset.filter(self.condition(text, queryset.db))
+            rank = RawSQL(
+                f'SELECT -bm25("{self.fts_table}") FROM "{self.fts_table}" '
+                f'WHERE "{self.fts_table}" MATCH %s AND "{self.fts_table}".rowid = "{self.table}".rowid',
+                [match],
+                output_field=FloatField(),
+            )
+        else:
+            return queryset.filter(self.condition(text, queryset.db))
+        return queryset.annotate(**{self.rank_field: rank}).order_by(f"-{self.rank_field}")
+
+
+def register_search_index(model: Any, field: str) -> SearchIndex:
+    index = SearchIndex(model, field)
+    search_indexes.append(index)
+    return index
+
+
+def install_search_indexes(sender: Any, using: str = "default", **kwargs: Any) -> None:
+    """
+    post_migrate receiver installing the search indexes of the migrated app.
+    """
+    for index in search_indexes:
+        if index.model._meta.app_label == sender.label:
+            index.install(using)
+
+
+class SearchFilterBackend(BaseFilterBackend):
+    """
+    Ranked full-text search with `?q=`, through the view's `search_index`.
+    Results are ordered by relevance unless `?ordering=` is given.
+    """
+    search_param = "q"
+    
+    def filter_queryset(self, request, queryset, view):  # type: ignore[no-untyped-def]
+        text = request.query_params.get(self.search_param, "").strip()
+        if not text:
+            return queryset
+        return view.search_index.search(queryset, text)
+
+
+class SearchIndexAdminMixin:
+    """
+    Admin search through a SearchIndex. The indexed column is matched with
+    full-text search; the other `search_fields` keep the default lookups.
+    """
+    search_index: Any = None
+    
+    def get_search_results(self, request, queryset, search_term):  # type: ignore[no-untyped-def]
+        results, may_have_duplicates = super().get_search_results(  # type: ignore[misc]
+            request, queryset, search_term
+        )
+        if not search_term.strip():
+            return results, may_have_duplicates
+        matches = queryset.filter(self.search_index.condition(search_term, queryset.db))
+        return matches | results, may_have_duplicates
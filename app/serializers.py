@@ -0,0 +1,17 @@
+from typing import Any
+from rest_framework import serializers
+
+
+class DynamicFieldsModelSerializer(serializers.ModelSerializer):
+    """
+    ModelSerializer that takes an optional `fields` argument restricting
+    which fields are rendered.
+    """
+    
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        fields = kwargs.pop("fields", None)
+        super().__init__(*args, **kwargs)
+        
+        if fields is not None:
+            for field_name in set(self.fields) - set(fields):
+                self.fields.pop(field_name)
@@ -0,0 +1,45 @@
+from typing import Any
+from django.contrib.auth import get_user_model
+from django.test import override_settings
+from rest_framework import test
+
+# Password of the users made by create_user()
+PASSWORD = "Password123"
+
+# A fast password hasher, and no HTTPS redirect when the suite runs with
+# DEBUG off
+api_test_settings = override_settings(
+    PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"],
+    SECURE_SSL_REDIRECT=False,
+)
+
+
+def create_user(username: str = "member", **fields: Any) -> Any:
+    """
+    A user with an @example.com email and PASSWORD.
+    """
+    fields.setdefault("email", f"{username}@example.com")
+    return get_user_model().objects.create_user(username=username, password=PASSWORD, **fields)
+
+
+def create_admin(username: str = "admin", **fields: Any) -> Any:
+    """
+    A superuser with an @example.com email and PASSWORD.
+    """
+    fields.setdefault("email", f"{username}@example.com")
+    return get_user_model().objects.create_superuser(username=username, password=PASSWORD, **fields)
+
+
+@api_test_settings
+class APITestCase(test.APITestCase):
+    """
+    Base for the API tests.
+    """
+
+
+@api_test_settings
+class APITransactionTestCase(test.APITransactionTestCase):
+    """
+    Base for API tests whose data must be visible to other threads, such
+    as the login pool.
+    """
@@ -0,0 +1,49 @@
+from typing import Any
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from app.metrics import pool_stats, request_metrics
+from app.replicas import database_metrics, replica_aliases, replica_health
+from users.permissions import IsAdminUser
+
+
+class RequestMetricsView(APIView):
+    """
+    - GET: Rolling per-endpoint timings collected by RequestMetricsMiddleware
+      in this worker process (admin only)
+    - DELETE: Reset the window
+    """
+    permission_classes = (IsAdminUser,)
+    
+    def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        return Response(request_metrics.snapshot())
+    
+    def delete(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        request_metrics.reset()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class DatabaseMetricsView(APIView):
+    """
+    - GET: Queries run on each database, replica routing decisions,
+      replica health and connection pool usage, in this worker process
+      (admin only)
+    - DELETE: Reset the counters and re-check replicas on next use
+    """
+    permission_classes = (IsAdminUser,)
+    
+    def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        return Response(
+            {
+                "replicas": replica_aliases(),
+                **database_metrics.snapshot(),
+                "replica_health": replica_health.snapshot(),
+                "pools": pool_stats(),
+            }
+        )
+    
+    def delete(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        database_metrics.reset()
+        replica_health.reset()
+        return Response(status=status.HTTP_204_NO_CONTENT)
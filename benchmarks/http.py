@@ -0,0 +1,121 @@
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from django.conf import settings
+from benchmarks.stats import summarize_latencies
+
+
+def free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def timed_request(
+    url: str, token: Optional[str] = None, method: str = "GET", body: Optional[bytes] = None
+) -> Tuple[float, int]:
+    request = urllib.request.Request(url, data=body, method=method)
+    if token:
+        request.add_header("Authorization", f"Bearer {token}")
+    if body is not None:
+        request.add_header("Content-Type", "application/json")
+    started = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request, timeout=60) as response:
+            response.read()
+            status = response.status
+    except urllib.error.HTTPError as exc:
+        status = exc.code
+    except (urllib.error.URLError, OSError):
+        status = 0
+    return time.perf_counter() - started, status
+
+
+def run_load(
+    url: str,
+    token: Optional[str],
+    total: int,
+    concurrency: int,
+    method: str = "GET",
+    body: Optional[bytes] = None,
+    bodies: Optional[Sequence[bytes]] = None,
+) -> Dict[str, Any]:
+    """
+    Fire `total` requests at `url` from `concurrency` threads.
+    `bodies` gives each request its own body (e.g. single-use tokens).
+    """
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results: List[Tuple[float, int]] = list(
+            pool.map(
+                lambda index: timed_request(
+                    url, token, method, bodies[index] if bodies else body
+                ),
+                range(total),
+            )
+        )
+    elapsed = time.perf_counter() - started
+    
+    summary = summarize_latencies([latency for latency, _ in results], elapsed)
+    summary["errors"] = sum(1 for _, status in results if not 200 <= status < 400)
+    return summary
+
+
+class GunicornServer:
+    """
+    Runs the project under gunicorn.conf.py in a subprocess for the
+    duration of a `with` block. `env` overrides settings for the server.
+    """
+    
+    def __init__(self, mode: str, workers: int, env: Optional[Dict[str, str]] = None) -> None:
+        self.mode = mode
+        self.workers = workers
+        self.env = env or {}
+        self.port = free_port()
+        self.process: Optional[subprocess.Popen] = None
+    
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+    
+    def __enter__(self) -> "GunicornServer":
+        base_dir = Path(settings.BASE_DIR)
+        env = {
+            **os.environ,
+            "SERVER_MODE": self.mode,
+            "GUNICORN_BIND": f"127.0.0.1:{self.port}",
+            "WEB_CONCURRENCY": str(self.workers),
+            **self.env,
+        }
+        self.process = subprocess.Popen(
+            [sys.executable, "-m", "gunicorn", "-c", str(base_dir / "gunicorn.conf.py")],
+            cwd=base_dir,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError(f"gunicorn ({self.mode}) exited during startup")
+            _, status = timed_request(f"{self.base_url}/api/v1/public/teams/")
+            if status:
+                return self
+            time.sleep(0.2)
+        self.__exit__()
+        raise RuntimeError(f"gunicorn ({self.mode}) did not start within 30s")
+    
+    def __exit__(self, *exc: Any) -> None:
+        if self.process and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
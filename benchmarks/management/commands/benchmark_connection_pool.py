@@ -0,0 +1,122 @@
+import json
+from typing import Any, Dict, List, Optional
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from users.tokens import PulseRefreshToken
+from benchmarks.http import GunicornServer, run_load
+from benchmarks.seed import bench_users
+
+ENDPOINTS = {
+    "pulselog-list": "/api/v1/pulse-logs/",
+    "team-list": "/api/v1/teams/",
+    "feedback-list": "/api/v1/team-feedbacks/",
+}
+POOL_MODES = ("persistent", "pooled")
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare read throughput with persistent connections (CONN_MAX_AGE) "
+        "and with psycopg_pool (DATABASE_POOL) at several gunicorn worker "
+        "counts, and report latency, throughput and the server connections "
+        "held after each run as JSON. Pooling needs PostgreSQL; seed data "
+        "first with seed_benchmark_data and use DEBUG=True locally."
+    )
+
+    def add_arguments(self, parser: Any) -> None:
+        parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+        parser.add_argument(
+            "--threads",
+            type=int,
+            default=4,
+            help="GUNICORN_THREADS for each worker; pooling only helps with more than one.",
+        )
+        parser.add_argument("--concurrency", type=int, default=32)
+        parser.add_argument("--requests", type=int, default=400)
+        parser.add_argument(
+            "--pool",
+            action="append",
+            choices=POOL_MODES,
+            help="Connection mode to run (repeatable). Defaults to both on PostgreSQL.",
+        )
+        parser.add_argument(
+            "--endpoint",
+            action="append",
+            choices=sorted(ENDPOINTS),
+            help="Endpoint to run (repeatable). Defaults to all.",
+        )
+        parser.add_argument("--output", help="Write the JSON report to this file.")
+
+    @staticmethod
+    def server_connections() -> Optional[int]:
+        """
+        Connections to this database other than our own (PostgreSQL only)
+        """
+        if connection.vendor != "postgresql":
+            return None
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT count(*) FROM pg_stat_activity "
+                "WHERE datname = current_database() AND pid <> pg_backend_pid()"
+            )
+            return cursor.fetchone()[0]
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        user = bench_users().order_by("username").first()
+        if user is None:
+            raise CommandError("No benchmark data. Run seed_benchmark_data first.")
+        token = str(PulseRefreshToken.for_user(user).access_token)
+        
+        modes: List[str] = options["pool"] or list(POOL_MODES)
+        if connection.vendor != "postgresql":
+            if options["pool"] and "pooled" in modes:
+                raise CommandError("Connection pooling needs a PostgreSQL DATABASE_URL.")
+            if "pooled" in modes:
+                self.stderr.write("Not PostgreSQL: only running persistent connections.")
+                modes = ["persistent"]
+        endpoints = options["endpoint"] or sorted(ENDPOINTS)
+        
+        report: Dict[str, Any] = {
+            "meta": {
+                "database": connection.vendor,
+                "threads": options["threads"],
+                "concurrency": options["concurrency"],
+                "requests": options["requests"],
+                "conn_max_age": settings.CONN_MAX_AGE,
+                "pool": settings.DATABASE_POOL_OPTIONS,
+            },
+            "results": {},
+        }
+        for mode in modes:
+            env = {
+                "DATABASE_POOL": str(mode == "pooled"),
+                "GUNICORN_THREADS": str(options["threads"]),
+            }
+            report["results"][mode] = {}
+            for workers in options["workers"]:
+                run: Dict[str, Any] = {"endpoints": {}}
+                with GunicornServer("wsgi", workers, env) as server:
+                    for name in endpoints:
+                        url = server.base_url + ENDPOINTS[name]
+                        run_load(url, token, options["concurrency"], options["concurrency"])
+                        result = run_load(url, token, options["requests"], options["concurrency"])
+                        run["endpoints"][name] = result
+                        self.stderr.write(
+                            f"{mode}, {workers} workers, {name}: "
+                            f"{result['throughput_rps']} req/s, p95 {result['p95_ms']}ms, "
+                            f"{result['errors']} errors"
+                        )
+                    run["server_connections"] = self.server_connections()
+                run["throughput_rps"] = round(
+                    sum(result["throughput_rps"] for result in run["endpoints"].values())
+                    / len(run["endpoints"]),
+                    2,
+                )
+                report["results"][mode][str(workers)] = run
+        
+        output = json.dumps(report, indent=2)
+        if options["output"]:
+            with open(options["output"], "w") as handle:
+                handle.write(output)
+        self.stdout.write(output)
@@ -0,0 +1,115 @@
+import json
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from app.plans import classify_plan, explain
+from benchmarks.management.commands.run_benchmarks import Command as RunBenchmarksCommand
+from benchmarks.stats import summarize_latencies
+from logs.models import PulseLog
+from logs.plans import pulse_log_list_querysets
+
+
+class Command(BaseCommand):
+    help = (
+        "Time the pulse log list queries behind the team and user dashboards "
+        "in process and report latency percentiles and query plans as JSON. "
+        "Seed a large table first, e.g. seed_benchmark_data --pulse-logs 1000000."
+    )
+
+    def add_arguments(self, parser: Any) -> None:
+        parser.add_argument("--repeat", type=int, default=50)
+        parser.add_argument(
+            "--shape",
+            action="append",
+            help="Query shape to run (repeatable). Defaults to all.",
+        )
+        parser.add_argument("--output", help="Write the JSON report to this file.")
+        parser.add_argument(
+            "--compare", help="Previous JSON report to compare the results against."
+        )
+
+    @staticmethod
+    def get_shapes() -> Dict[str, Dict[str, Any]]:
+        sample = (
+            PulseLog.objects.filter(team__isnull=False)
+            .order_by("-timestamp")
+            .values("user_id", "team_id", "year", "week_index")
+            .first()
+        )
+        if sample is None:
+            raise CommandError("No benchmark data. Run seed_benchmark_data first.")
+        team = str(sample["team_id"])
+        user = str(sample["user_id"])
+        return {
+            "recent": {},
+            "team-recent": {"team": team},
+            "team-week": {
+                "team": team, "year": sample["year"], "week_index": sample["week_index"],
+            },
+            "team-year-by-week": {
+                "team": team, "year": sample["year"], "ordering": "-week_index",
+            },
+            "user-recent": {"user": user},
+            "user-week": {
+                "user": user, "year": sample["year"], "week_index": sample["week_index"],
+            },
+        }
+
+    @staticmethod
+    def time_queries(queryset: Any, page_queryset: Any, repeat: int) -> Dict[str, Any]:
+        """
+        Latency of one page plus the total count, as the list view issues them
+        """
+        list(page_queryset.all())
+        queryset.count()
+        latencies: List[float] = []
+        started = time.perf_counter()
+        for _ in range(repeat):
+            begin = time.perf_counter()
+            list(page_queryset.all())
+            queryset.count()
+            latencies.append(time.perf_counter() - begin)
+        return summarize_latencies(latencies, time.perf_counter() - started)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        shapes = self.get_shapes()
+        selected: List[str] = options["shape"] or list(shapes)
+        unknown = set(selected) - set(shapes)
+        if unknown:
+            raise CommandError(f"Unknown shapes: {', '.join(sorted(unknown))}")
+
+        report: Dict[str, Any] = {
+            "meta": {
+                "commit": RunBenchmarksCommand.git_commit(),
+                "started_at": datetime.now(timezone.utc).isoformat(),
+                "database": connection.vendor,
+                "repeat": options["repeat"],
+                "data": {"pulse_logs": PulseLog.objects.count()},
+            },
+            "endpoints": {},
+        }
+        table = PulseLog._meta.db_table
+        for name in selected:
+            params = shapes[name]
+            queryset, page_queryset = pulse_log_list_querysets(params)
+            result = self.time_queries(queryset, page_queryset, options["repeat"])
+            result["params"] = params
+            result.update(classify_plan(explain(page_queryset), table, connection.vendor))
+            report["endpoints"][name] = result
+            self.stderr.write(
+                f"{name}: p50 {result['p50_ms']}ms, p95 {result['p95_ms']}ms, "
+                f"{result['access']} {result['index'] or ''}"
+                f"{' + sort' if result['sort'] else ''}"
+            )
+
+        if options["compare"]:
+            with open(options["compare"]) as handle:
+                report["comparison"] = RunBenchmarksCommand.compare(report, json.load(handle))
+
+        output = json.dumps(report, indent=2)
+        if options["output"]:
+            with open(options["output"], "w") as handle:
+                handle.write(output)
+        self.stdout.write(output)
@@ -0,0 +1,80 @@
+import json
+from typing import Any
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from users.tokens import PulseRefreshToken
+from benchmarks.http import GunicornServer, run_load
+
+User = get_user_model()
+
+# name: (WSGI path, async path)
+ENDPOINTS = {
+    "users-me": ("/api/v1/users/me/", "/api/v1/async/users/me/"),
+    "team-list": ("/api/v1/teams/", "/api/v1/async/teams/"),
+    "pulselog-list": ("/api/v1/pulse-logs/", "/api/v1/async/pulse-logs/"),
+    "feedback-list": ("/api/v1/team-feedbacks/", "/api/v1/async/team-feedbacks/"),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Load test the read endpoints under sync gunicorn workers (WSGI) and "
+        "uvicorn workers (ASGI) with the same worker count, and report the "
+        "latency and throughput of each as JSON. Run against a local "
+        "database with DEBUG=True so requests are not redirected to HTTPS."
+    )
+
+    def add_arguments(self, parser: Any) -> None:
+        parser.add_argument("--workers", type=int, default=2)
+        parser.add_argument("--concurrency", type=int, default=32)
+        parser.add_argument("--requests", type=int, default=400)
+        parser.add_argument(
+            "--endpoint",
+            action="append",
+            choices=sorted(ENDPOINTS),
+            help="Endpoint to test (repeatable). Defaults to all.",
+        )
+        parser.add_argument(
+            "--email",
+            default="loadtest@example.com",
+            help="User to authenticate as. Created if missing.",
+        )
+        parser.add_argument("--output", help="Write the JSON report to this file.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        user = User.objects.filter(email=options["email"]).first()
+        if user is None:
+            user = User.objects.create_user(
+                username=options["email"].split("@")[0],
+                email=options["email"],
+                password=None,
+            )
+        token = str(PulseRefreshToken.for_user(user).access_token)
+        endpoints = options["endpoint"] or sorted(ENDPOINTS)
+        
+        report: dict = {
+            "workers": options["workers"],
+            "concurrency": options["concurrency"],
+            "requests": options["requests"],
+            "results": {},
+        }
+        for mode, path_index in (("wsgi", 0), ("asgi", 1)):
+            with GunicornServer(mode, options["workers"]) as server:
+                for name in endpoints:
+                    url = server.base_url + ENDPOINTS[name][path_index]
+                    run_load(url, token, options["concurrency"], options["concurrency"])
+                    report["results"].setdefault(name, {})[mode] = run_load(
+                        url, token, options["requests"], options["concurrency"]
+                    )
+                    self.stderr.write(f"{mode} {name}: done")
+        
+        for name, modes in report["results"].items():
+            wsgi_rps = modes["wsgi"]["throughput_rps"]
+            if wsgi_rps:
+                modes["asgi_speedup"] = round(modes["asgi"]["throughput_rps"] / wsgi_rps, 2)
+        
+        output = json.dumps(report, indent=2)
+        if options["output"]:
+            with open(options["output"], "w") as handle:
+                handle.write(output)
+        self.stdout.write(output)
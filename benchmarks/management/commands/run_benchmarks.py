@@ -0,0 +1,189 @@
+import json
+import subprocess
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+from django.conf import settings
+from django.db import connection
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from users.tokens import PulseRefreshToken
+from benchmarks.http import GunicornServer, run_load
+from benchmarks.seed import BENCH_PASSWORD, bench_users
+from feedback.models import TeamFeedback
+from logs.models import PulseLog
+from teams.models import Team
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the main API endpoints against a gunicorn server and "
+        "report latency percentiles, throughput and queries per request as "
+        "JSON. Seed data first with seed_benchmark_data. Use DEBUG=True "
+        "locally so requests are not redirected to HTTPS."
+    )
+
+    def add_arguments(self, parser: Any) -> None:
+        parser.add_argument("--mode", choices=("wsgi", "asgi"), default="wsgi")
+        parser.add_argument("--workers", type=int, default=2)
+        parser.add_argument("--concurrency", type=int, default=16)
+        parser.add_argument("--requests", type=int, default=300)
+        parser.add_argument(
+            "--endpoint",
+            action="append",
+            help="Endpoint to run (repeatable). Defaults to all.",
+        )
+        parser.add_argument("--output", help="Write the JSON report to this file.")
+        parser.add_argument(
+            "--compare", help="Previous JSON report to compare the results against."
+        )
+
+    def get_endpoints(self, user: Any) -> Dict[str, Dict[str, Any]]:
+        team = user.teams.first()
+        pulse_log = {"mood": 3, "workload": 3}
+        if team:
+            pulse_log["team"] = str(team.id)
+        return {
+            "login": {
+                "method": "POST",
+                "path": "/api/v1/auth/login/",
+                "body": {"email": user.email, "password": BENCH_PASSWORD},
+                "auth": False,
+            },
+            "token-refresh": {
+                "method": "POST",
+                "path": "/api/v1/auth/refresh/",
+                "body_factory": lambda: {"refresh": str(PulseRefreshToken.for_user(user))},
+                "auth": False,
+            },
+            "pulselog-create": {
+                "method": "POST",
+                "path": "/api/v1/pulse-logs/",
+                "body": pulse_log,
+            },
+            "pulselog-list": {"path": "/api/v1/pulse-logs/"},
+            "team-list": {"path": "/api/v1/teams/"},
+            "feedback-list": {"path": "/api/v1/team-feedbacks/"},
+        }
+
+    def count_queries(self, spec: Dict[str, Any], token: str) -> int:
+        """
+        Queries issued by one in-process request to the endpoint
+        """
+        client = Client(HTTP_HOST="localhost")
+        headers = {"HTTP_AUTHORIZATION": f"Bearer {token}"} if spec.get("auth", True) else {}
+        method = getattr(client, spec.get("method", "GET").lower())
+        kwargs: Dict[str, Any] = {"secure": True, **headers}
+        
+        def request() -> None:
+            body = spec["body_factory"]() if "body_factory" in spec else spec.get("body")
+            if body is not None:
+                kwargs.update(data=json.dumps(body), content_type="application/json")
+            method(spec["path"], **kwargs)
+        
+        request()
+        with CaptureQueriesContext(connection) as queries:
+            request()
+        return len(queries)
+
+    @staticmethod
+    def make_bodies(spec: Dict[str, Any], count: int) -> Optional[List[bytes]]:
+        """
+        Per-request bodies for endpoints whose payload can only be used once
+        """
+        if "body_factory" not in spec:
+            return None
+        return [json.dumps(spec["body_factory"]()).encode() for _ in range(count)]
+
+    @staticmethod
+    def git_commit() -> Optional[str]:
+        try:
+            return subprocess.run(
+                ["git", "rev-parse", "--short", "HEAD"],
+                cwd=settings.BASE_DIR,
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    @staticmethod
+    def compare(current: Dict[str, Any], baseline: Dict[str, Any]) -> Dict[str, Any]:
+        comparison = {}
+        for name, result in current["endpoints"].items():
+            previous = baseline.get("endpoints", {}).get(name)
+            if not previous:
+                continue
+            comparison[name] = {
+                metric: round(result[metric] - previous[metric], 3)
+                for metric in ("p50_ms", "p95_ms", "p99_ms", "throughput_rps", "queries")
+                if metric in result and metric in previous
+            }
+        return comparison
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        user = bench_users().order_by("username").first()
+        if user is None:
+            raise CommandError("No benchmark data. Run seed_benchmark_data first.")
+        token = str(PulseRefreshToken.for_user(user).access_token)
+        
+        endpoints = self.get_endpoints(user)
+        selected: List[str] = options["endpoint"] or list(endpoints)
+        unknown = set(selected) - set(endpoints)
+        if unknown:
+            raise CommandError(f"Unknown endpoints: {', '.join(sorted(unknown))}")
+        
+        report: Dict[str, Any] = {
+            "meta": {
+                "commit": self.git_commit(),
+                "started_at": datetime.now(timezone.utc).isoformat(),
+                "database": connection.vendor,
+                "mode": options["mode"],
+                "workers": options["workers"],
+                "concurrency": options["concurrency"],
+                "requests": options["requests"],
+                "data": {
+                    "users": bench_users().count(),
+                    "teams": Team.objects.count(),
+                    "pulse_logs": PulseLog.objects.count(),
+                    "feedback": TeamFeedback.objects.count(),
+                },
+            },
+            "endpoints": {},
+        }
+        
+        with GunicornServer(options["mode"], options["workers"]) as server:
+            for name in selected:
+                spec = endpoints[name]
+                body = json.dumps(spec["body"]).encode() if "body" in spec else None
+                auth_token = token if spec.get("auth", True) else None
+                url = server.base_url + spec["path"]
+                method = spec.get("method", "GET")
+                
+                warmup_bodies = self.make_bodies(spec, options["concurrency"])
+                bodies = self.make_bodies(spec, options["requests"])
+                run_load(
+                    url, auth_token, options["concurrency"], options["concurrency"],
+                    method, body, warmup_bodies,
+                )
+                result = run_load(
+                    url, auth_token, options["requests"], options["concurrency"],
+                    method, body, bodies,
+                )
+                result["queries"] = self.count_queries(spec, token)
+                report["endpoints"][name] = result
+                self.stderr.write(
+                    f"{name}: p95 {result['p95_ms']}ms, "
+                    f"{result['throughput_rps']} req/s, {result['queries']} queries"
+                )
+        
+        if options["compare"]:
+            with open(options["compare"]) as handle:
+                report["comparison"] = self.compare(report, json.load(handle))
+        
+        output = json.dumps(report, indent=2)
+        if options["output"]:
+            with open(options["output"], "w") as handle:
+                handle.write(output)
+        self.stdout.write(output)
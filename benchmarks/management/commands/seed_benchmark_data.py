@@ -0,0 +1,48 @@
+from typing import Any
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from benchmarks.seed import BENCH_PASSWORD, reset_bench_data, seed_bench_data
+
+
+class Command(BaseCommand):
+    help = "Seed users, teams, pulse logs and feedback for benchmarks."
+
+    def add_arguments(self, parser: Any) -> None:
+        parser.add_argument("--users", type=int, default=200)
+        parser.add_argument("--teams", type=int, default=20)
+        parser.add_argument("--pulse-logs", type=int, default=20000)
+        parser.add_argument("--feedback", type=int, default=5000)
+        parser.add_argument("--teams-per-user", type=int, default=1)
+        parser.add_argument("--batch-size", type=int, default=2000)
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="Delete previously seeded benchmark data first.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if options["reset"]:
+            reset_bench_data()
+        
+        counts = seed_bench_data(
+            users=options["users"],
+            teams=options["teams"],
+            pulse_logs=options["pulse_logs"],
+            feedback=options["feedback"],
+            teams_per_user=options["teams_per_user"],
+            batch_size=options["batch_size"],
+            seed=options["seed"],
+        )
+        # The logs are bulk inserted, which skips the signals keeping these
+        call_command("rebuild_pulse_rollups", stdout=self.stdout)
+        call_command("rebuild_user_stats", stdout=self.stdout)
+        
+        self.stdout.write(
+            self.style.SUCCESS(
+                "Seeded {users} users, {teams} teams, {pulse_logs} pulse logs and "
+                "{feedback} feedback entries (password: {password})".format(
+                    password=BENCH_PASSWORD, **counts
+                )
+            )
+        )
@@ -0,0 +1,112 @@
+import random
+from typing import Any, Dict
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from feedback.models import TeamFeedback
+from logs.models import PulseLog
+from teams.models import Team
+
+User = get_user_model()
+
+BENCH_EMAIL_DOMAIN = "bench.example.com"
+BENCH_TEAM_PREFIX = "bench-team-"
+BENCH_PASSWORD = "BenchPass123!"
+
+
+def bench_users():  # type: ignore[no-untyped-def]
+    return User.objects.filter(email__endswith=f"@{BENCH_EMAIL_DOMAIN}")
+
+
+def reset_bench_data() -> None:
+    """
+    Delete everything created by seed_bench_data (logs and feedback cascade).
+    """
+    with transaction.atomic():
+        bench_users().delete()
+        Team.objects.filter(team_name__startswith=BENCH_TEAM_PREFIX).delete()
+
+
+def seed_bench_data(
+    users: int,
+    teams: int,
+    pulse_logs: int,
+    feedback: int,
+    teams_per_user: int = 1,
+    batch_size: int = 2000,
+    seed: int = 42,
+) -> Dict[str, Any]:
+    """
+    Bulk insert a reproducible data set for benchmarks.
+    All seeded users share BENCH_PASSWORD, hashed once.
+    """
+    rng = random.Random(seed)
+    password = make_password(BENCH_PASSWORD)
+    offset = bench_users().count()
+    
+    with transaction.atomic():
+        user_objs = User.objects.bulk_create(
+            (
+                User(
+                    username=f"bench{offset + index}",
+                    email=f"bench{offset + index}@{BENCH_EMAIL_DOMAIN}",
+                    password=password,
+                )
+                for index in range(users)
+            ),
+            batch_size=batch_size,
+        )
+        team_objs = Team.objects.bulk_create(
+            (Team(team_name=f"{BENCH_TEAM_PREFIX}{index}") for index in range(teams)),
+            batch_size=batch_size,
+        )
+        
+        memberships = {}
+        if team_objs:
+            Membership = Team.members.through
+            rows = []
+            for user in user_objs:
+                chosen = rng.sample(team_objs, min(teams_per_user, len(team_objs)))
+                memberships[user.pk] = chosen
+                rows.extend(Membership(team_id=team.pk, user_id=user.pk) for team in chosen)
+            Membership.objects.bulk_create(rows, batch_size=batch_size)
+        
+        def pulse_log(index: int) -> PulseLog:
+            user = user_objs[index % len(user_objs)]
+            user_teams = memberships.get(user.pk)
+            return PulseLog(
+                user=user,
+                team=rng.choice(user_teams) if user_teams else None,
+                mood=rng.randint(1, 5),
+                workload=rng.randint(1, 5),
+                comment=rng.choice(["", "Busy week", "Shipped it", "Blocked on review"]),
+                year=rng.choice([2023, 2024, 2025]),
+                week_index=rng.randint(1, 52),
+            )
+        
+        def team_feedback(index: int) -> TeamFeedback:
+            user = user_objs[index % len(user_objs)]
+            user_teams = memberships.get(user.pk)
+            return TeamFeedback(
+                user=user,
+                team=rng.choice(user_teams) if user_teams else None,
+                message=rng.choice(
+                    ["Great collaboration", "Too many meetings", "Need clearer goals"]
+                ),
+                is_anonymous=rng.random() < 0.3,
+            )
+        
+        if user_objs:
+            PulseLog.objects.bulk_create(
+                (pulse_log(index) for index in range(pulse_logs)), batch_size=batch_size
+            )
+            TeamFeedback.objects.bulk_create(
+                (team_feedback(index) for index in range(feedback)), batch_size=batch_size
+            )
+    
+    return {
+        "users": len(user_objs),
+        "teams": len(team_objs),
+        "pulse_logs": pulse_logs if user_objs else 0,
+        "feedback": feedback if user_objs else 0,
+    }
@@ -0,0 +1,14 @@
+from typing import Any, Dict, Sequence
+from app.metrics import summarize
+
+
+def summarize_latencies(latencies: Sequence[float], elapsed: float) -> Dict[str, Any]:
+    """
+    Latency percentiles in milliseconds and throughput in requests/second.
+    """
+    summary = summarize([latency * 1000 for latency in latencies])
+    return {
+        "requests": len(latencies),
+        "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        **{f"{metric}_ms": value for metric, value in summary.items()},
+    }
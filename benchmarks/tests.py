@@ -0,0 +1,64 @@
+import json
+from io import StringIO
+from typing import Any
+from unittest import mock
+from django.core.management import call_command
+from django.test import LiveServerTestCase
+from app.testing import api_test_settings
+from benchmarks.seed import bench_users
+from logs.models import PulseLog, TeamWeeklyPulse, UserPulseStats
+from teams.models import Team
+
+
+class LiveServer:
+    """
+    Stands in for GunicornServer: gunicorn can't see the test database, so
+    the load goes to the test case's live server instead.
+    """
+    
+    def __init__(self, base_url: str) -> None:
+        self.base_url = base_url
+    
+    def __enter__(self) -> "LiveServer":
+        return self
+    
+    def __exit__(self, *exc: Any) -> None:
+        pass
+
+
+@api_test_settings
+class BenchmarkSmokeTests(LiveServerTestCase):
+    def test_seed_and_run_benchmarks(self) -> None:
+        call_command(
+            "seed_benchmark_data",
+            users=3,
+            teams=2,
+            pulse_logs=20,
+            feedback=5,
+            stdout=StringIO(),
+        )
+        self.assertEqual(bench_users().count(), 3)
+        self.assertEqual(Team.objects.count(), 2)
+        self.assertEqual(PulseLog.objects.count(), 20)
+        self.assertTrue(TeamWeeklyPulse.objects.exists())
+        self.assertEqual(
+            sum(UserPulseStats.objects.values_list("total_logs", flat=True)), 20
+        )
+        
+        out = StringIO()
+        with mock.patch(
+            "benchmarks.management.commands.run_benchmarks.GunicornServer",
+            lambda mode, workers: LiveServer(self.live_server_url),
+        ):
+            call_command("run_benchmarks", requests=3, concurrency=1, stdout=out, stderr=StringIO())
+        report = json.loads(out.getvalue())
+        
+        self.assertEqual(report["meta"]["data"]["pulse_logs"], 20)
+        self.assertEqual(
+            set(report["endpoints"]),
+            {"login", "token-refresh", "pulselog-create", "pulselog-list", "team-list", "feedback-list"},
+        )
+        for name, result in report["endpoints"].items():
+            self.assertEqual(result["requests"], 3, name)
+            self.assertEqual(result["errors"], 0, name)
+            self.assertGreater(result["queries"], 0, name)
@@ -1,9 +1,12 @@
 from django.contrib import admin
+from app.replicas import ReplicaAdminMixin
+from app.search import SearchIndexAdminMixin
 from feedback.models import TeamFeedback
+from feedback.search import feedback_search
 
 
 @admin.register(TeamFeedback)
-class TeamFeedbackAdmin(admin.ModelAdmin):
+class TeamFeedbackAdmin(ReplicaAdminMixin, SearchIndexAdminMixin, admin.ModelAdmin):
     list_display = [
         "get_author_display",
         "team",
@@ -12,7 +15,9 @@ class TeamFeedbackAdmin(admin.ModelAdmin):
         "created_at",
     ]
     list_filter = ["is_anonymous", "team", "created_at"]
-    search_fields = ["message", "user__username", "team__team_name"]
+    # Messages are matched through the full-text index
+    search_fields = ["user__username", "team__team_name"]
+    search_index = feedback_search
     ordering = ["-created_at"]
     readonly_fields = ["created_at", "updated_at"]
     
@@ -1,6 +1,13 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 
 class FeedbackConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'feedback'
+
+    def ready(self) -> None:
+        from app.search import install_search_indexes
+        import feedback.search  # noqa: F401
+        
+        post_migrate.connect(install_search_indexes, sender=self)
@@ -0,0 +1,37 @@
+from typing import Any, Iterator
+
+TEAM_FEEDBACK_EXPORT_COLUMNS = (
+    "id",
+    "username",
+    "team_id",
+    "team_name",
+    "message",
+    "is_anonymous",
+    "created_at",
+)
+
+
+def team_feedback_export_rows(queryset: Any, chunk_size: int) -> Iterator[tuple]:
+    """
+    Stream feedback rows as tuples through a server-side cursor.
+    Authors of anonymous feedback are masked the same way as in the API.
+    """
+    rows = queryset.values_list(
+        "id",
+        "user__username",
+        "team_id",
+        "team__team_name",
+        "message",
+        "is_anonymous",
+        "created_at",
+    ).iterator(chunk_size=chunk_size)
+    for id, username, team_id, team_name, message, is_anonymous, created_at in rows:
+        yield (
+            id,
+            "Anonymous" if is_anonymous else username,
+            team_id,
+            team_name or "General",
+            message,
+            is_anonymous,
+            created_at,
+        )
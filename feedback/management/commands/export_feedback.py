@@ -0,0 +1,15 @@
+from typing import Any
+from app.exports import BaseExportCommand
+from feedback.exports import TEAM_FEEDBACK_EXPORT_COLUMNS, team_feedback_export_rows
+from feedback.models import TeamFeedback
+from feedback.views import TeamFeedbackListCreateView
+
+
+class Command(BaseExportCommand):
+    help = "Stream all team feedback to CSV or NDJSON."
+    model = TeamFeedback
+    filterset_fields = TeamFeedbackListCreateView.filterset_fields
+    export_columns = TEAM_FEEDBACK_EXPORT_COLUMNS
+
+    def get_export_rows(self, queryset: Any, chunk_size: int) -> Any:
+        return team_feedback_export_rows(queryset, chunk_size)
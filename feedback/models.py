@@ -1,5 +1,6 @@
 import uuid
 from django.conf import settings
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from app.abstracts import TimeStampedModel
 
@@ -32,6 +33,8 @@ class TeamFeedback(TimeStampedModel):
         default=False,
         help_text="Whether to hide the user's identity"
     )
+    # Maintained by a database trigger on PostgreSQL (see feedback/search.py)
+    search_vector = SearchVectorField(null=True, editable=False)
     
     class Meta:
         db_table = "team_feedbacks"
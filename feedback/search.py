@@ -0,0 +1,4 @@
+from app.search import register_search_index
+from feedback.models import TeamFeedback
+
+feedback_search = register_search_index(TeamFeedback, "message")
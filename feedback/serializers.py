@@ -1,6 +1,7 @@
 from typing import Any
 from rest_framework import serializers
 from feedback.models import TeamFeedback
+from teams.membership import team_name, user_team_ids
 from teams.models import Team
 
 
@@ -36,11 +37,14 @@ class TeamFeedbackSerializer(serializers.ModelSerializer):
 
     def get_team_name(self, obj: Any) -> str:
         """
-        Return team name or 'General' if no team
+        Return team name or 'General' if no team. Lists select the team;
+        a feedback just created reads the name from the cache.
         """
-        if obj.team:
+        if obj.team_id is None:
+            return "General"
+        if TeamFeedback.team.is_cached(obj):
             return obj.team.team_name
-        return "General"
+        return team_name(obj.team_id) or "General"
 
     def create(self, validated_data: Any) -> Any:
         user = self.context["request"].user
@@ -57,26 +61,23 @@ class TeamFeedbackSerializer(serializers.ModelSerializer):
             else:
                 validated_data["team"] = None
         else:
-            user_teams = user.teams.all()
-            if not user_teams.exists():
+            team_ids = user_team_ids(user)
+            if not team_ids:
                 raise serializers.ValidationError(
                     {"error": "You must belong to a team to submit feedback"}
                 )
             
-            if team_id:
-                try:
-                    team = Team.objects.get(id=team_id)
-                    if team not in user_teams:
-                        raise serializers.ValidationError(
-                            {"team": "You are not a member of this team"}
-                        )
-                    validated_data["team"] = team
-                except Team.DoesNotExist:
+            if team_id and team_id not in team_ids:
+                if Team.objects.filter(id=team_id).exists():
                     raise serializers.ValidationError(
-                        {"team": "Team not found"}
+                        {"team": "You are not a member of this team"}
                     )
-            else:
-                validated_data["team"] = user_teams.first()
+                raise serializers.ValidationError(
+                    {"team": "Team not found"}
+                )
+            # Without an explicit team, fall back to the team with the lowest
+            # id, as user.teams.first() did (teams have no default ordering)
+            validated_data["team_id"] = team_id or min(team_ids)
 
         validated_data["user"] = user
         return super().create(validated_data)
@@ -1,3 +1,82 @@
-from django.test import TestCase
+from app.testing import APITestCase, create_user
+from feedback.models import TeamFeedback
+from teams.models import Team
 
-# Create your tests here.
+
+class TeamFeedbackSearchTests(APITestCase):
+    def setUp(self) -> None:
+        self.user = create_user()
+        other = create_user("other")
+        self.team = Team.objects.create(team_name="Core")
+        self.team.members.add(self.user)
+        other_team = Team.objects.create(team_name="Platform")
+        other_team.members.add(other)
+        
+        for message in [
+            "Too many meetings this week",
+            "Deployments keep failing",
+            "Meetings about meetings about meetings",
+        ]:
+            TeamFeedback.objects.create(user=self.user, team=self.team, message=message)
+        TeamFeedback.objects.create(user=other, team=other_team, message="Meetings ran long")
+        self.client.force_authenticate(self.user)
+    
+    def search(self, query: str) -> list:
+        response = self.client.get("/api/v1/team-feedbacks/", {"q": query})
+        self.assertEqual(response.status_code, 200)
+        return [item["message"] for item in response.json()["results"]]
+    
+    def test_search_is_ranked_and_scoped(self) -> None:
+        self.assertEqual(
+            self.search("meetings"),
+            ["Meetings about meetings about meetings", "Too many meetings this week"],
+        )
+        self.assertEqual(self.search("deploy"), ["Deployments keep failing"])
+        self.assertEqual(self.search("retro"), [])
+    
+    def test_index_follows_updates_and_deletes(self) -> None:
+        feedback = TeamFeedback.objects.get(message="Deployments keep failing")
+        feedback.message = "Retro was useful"
+        feedback.save()
+        self.assertEqual(self.search("deploy"), [])
+        self.assertEqual(self.search("retro"), ["Retro was useful"])
+        feedback.delete()
+        self.assertEqual(self.search("retro"), [])
+    
+    def test_search_pages_in_rank_order(self) -> None:
+        response = self.client.get("/api/v1/team-feedbacks/", {"q": "meetings", "page_size": 1})
+        messages = [item["message"] for item in response.json()["results"]]
+        while response.json()["next"]:
+            response = self.client.get(response.json()["next"])
+            messages += [item["message"] for item in response.json()["results"]]
+        self.assertEqual(messages, self.search("meetings"))
+
+
+class TeamFeedbackETagTests(APITestCase):
+    def setUp(self) -> None:
+        self.user = create_user()
+        self.team = Team.objects.create(team_name="Core")
+        self.team.members.add(self.user)
+        self.feedback = TeamFeedback.objects.create(user=self.user, team=self.team, message="Good week")
+        self.client.force_authenticate(self.user)
+        self.urls = [f"/api/v1/team-feedbacks/{self.feedback.id}/"]
+    
+    def etags(self) -> list:
+        return [self.client.get(url)["ETag"] for url in self.urls]
+    
+    def test_lists_are_not_conditional(self) -> None:
+        self.assertNotIn("ETag", self.client.get("/api/v1/team-feedbacks/"))
+    
+    def test_etag_follows_author_and_team_names(self) -> None:
+        etags = self.etags()
+        self.assertEqual(self.etags(), etags)
+        
+        self.user.username = "renamed"
+        self.user.save()
+        renamed = self.etags()
+        self.assertTrue(all(old != new for old, new in zip(etags, renamed)))
+        self.assertEqual(self.client.get(self.urls[0]).json()["username"], "renamed")
+        
+        self.team.team_name = "Platform"
+        self.team.save()
+        self.assertTrue(all(old != new for old, new in zip(renamed, self.etags())))
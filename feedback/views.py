@@ -2,22 +2,23 @@ from rest_framework import generics
 from rest_framework.permissions import IsAuthenticated
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import OrderingFilter
+from app.async_views import AsyncListView
+from app.conditional import ConditionalGetMixin
+from app.exports import ExportMixin
+from app.pagination import KeysetPagination
+from app.replicas import ReplicaReadMixin
+from app.search import SearchFilterBackend
+from feedback.exports import TEAM_FEEDBACK_EXPORT_COLUMNS, team_feedback_export_rows
 from feedback.models import TeamFeedback
+from feedback.search import feedback_search
 from feedback.serializers import TeamFeedbackSerializer
+from teams.membership import user_team_ids
 
 
-class TeamFeedbackListCreateView(generics.ListCreateAPIView):
+class TeamFeedbackQuerysetMixin:
     """
-    List team feedbacks or create new feedback.
-    - Authenticated users can create feedback
-    - Message is required
-    - User and team are automatically assigned from logged-in user
+    Scopes feedback to the user's teams unless they are an admin.
     """
-    serializer_class = TeamFeedbackSerializer
-    permission_classes = (IsAuthenticated,)
-    filter_backends = [DjangoFilterBackend, OrderingFilter]
-    filterset_fields = ["is_anonymous", "team"]
-    ordering_fields = ["created_at"]
     
     def get_queryset(self):  # type: ignore[no-untyped-def]
         user = self.request.user
@@ -25,13 +26,57 @@ class TeamFeedbackListCreateView(generics.ListCreateAPIView):
         if user.is_staff:
             return TeamFeedback.objects.select_related("user", "team").all()
         
-        user_teams = user.teams.all()
         return TeamFeedback.objects.filter(
-            team__in=user_teams
+            team_id__in=user_team_ids(user)
         ).select_related("user", "team")
 
 
-class TeamFeedbackDetailView(generics.RetrieveDestroyAPIView):
+class TeamFeedbackListCreateView(
+    ReplicaReadMixin, TeamFeedbackQuerysetMixin, generics.ListCreateAPIView
+):
+    """
+    List team feedbacks or create new feedback.
+    - Authenticated users can create feedback
+    - Message is required
+    - User and team are automatically assigned from logged-in user
+    - `?q=` searches messages, best match first
+    """
+    serializer_class = TeamFeedbackSerializer
+    permission_classes = (IsAuthenticated,)
+    pagination_class = KeysetPagination
+    filter_backends = [DjangoFilterBackend, SearchFilterBackend, OrderingFilter]
+    filterset_fields = ["is_anonymous", "team"]
+    ordering_fields = ["created_at"]
+    search_index = feedback_search
+
+
+class TeamFeedbackAsyncListView(AsyncListView):
+    """
+    Async variant of the feedback list for ASGI deployments.
+    """
+    view_class = TeamFeedbackListCreateView
+
+
+class TeamFeedbackExportView(
+    ExportMixin, TeamFeedbackQuerysetMixin, generics.GenericAPIView
+):
+    """
+    Stream team feedback as CSV or NDJSON (`?format=csv|ndjson`).
+    - Same scoping and filters as the feedback list
+    """
+    permission_classes = (IsAuthenticated,)
+    filter_backends = TeamFeedbackListCreateView.filter_backends
+    filterset_fields = TeamFeedbackListCreateView.filterset_fields
+    ordering_fields = TeamFeedbackListCreateView.ordering_fields
+    search_index = feedback_search
+    export_columns = TEAM_FEEDBACK_EXPORT_COLUMNS
+    export_filename = "team_feedbacks"
+    
+    def get_export_rows(self, queryset):  # type: ignore[no-untyped-def]
+        return team_feedback_export_rows(queryset, self.export_chunk_size)
+
+
+class TeamFeedbackDetailView(ConditionalGetMixin, generics.RetrieveDestroyAPIView):
     """
     Retrieve or delete a team feedback.
     - Users can only delete their own feedback
@@ -40,6 +85,7 @@ class TeamFeedbackDetailView(generics.RetrieveDestroyAPIView):
     serializer_class = TeamFeedbackSerializer
     permission_classes = (IsAuthenticated,)
     lookup_field = "id"
+    conditional_fields = ("updated_at", "user__updated_at", "team__updated_at")
     
     def get_queryset(self):  # type: ignore[no-untyped-def]
         user = self.request.user
@@ -47,4 +93,4 @@ class TeamFeedbackDetailView(generics.RetrieveDestroyAPIView):
         if user.is_staff:
             return TeamFeedback.objects.select_related("user", "team").all()
         
-        return TeamFeedback.objects.filter(user=user).select_related("user", "team")
+        return TeamFeedback.objects.filter(user_id=user.pk).select_related("user", "team")
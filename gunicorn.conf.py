@@ -0,0 +1,29 @@
+"""
+Gunicorn configuration for teampulse.
+
+SERVER_MODE=wsgi (default) runs sync workers on teampulse.wsgi.
+SERVER_MODE=asgi runs uvicorn workers on teampulse.asgi, where the
+/api/v1/async/ read endpoints are served without blocking a worker per
+request.
+"""
+import multiprocessing
+import os
+
+server_mode = os.environ.get("SERVER_MODE", "wsgi").lower()
+
+bind = os.environ.get("GUNICORN_BIND", f"0.0.0.0:{os.environ.get('PORT', '8000')}")
+workers = int(
+    os.environ.get("WEB_CONCURRENCY", min(multiprocessing.cpu_count() * 2 + 1, 8))
+)
+# More than one thread turns sync workers into gthread workers, so requests
+# keep being served while logins wait on the password hashing pool
+threads = int(os.environ.get("GUNICORN_THREADS", "1"))
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", "30"))
+accesslog = "-"
+
+if server_mode == "asgi":
+    wsgi_app = "teampulse.asgi:application"
+    worker_class = "uvicorn_worker.UvicornWorker"
+else:
+    wsgi_app = "teampulse.wsgi:application"
+    worker_class = "sync"
@@ -0,0 +1,27 @@
+from django.contrib import admin
+from insights.models import TeamKeyword, TextAnalysis
+
+
+@admin.register(TextAnalysis)
+class TextAnalysisAdmin(admin.ModelAdmin):
+    list_display = ["source", "object_id", "team", "label", "sentiment", "updated_at"]
+    list_filter = ["source", "label", "team"]
+    search_fields = ["object_id"]
+    ordering = ["-updated_at"]
+    readonly_fields = ["sentiment", "label", "keywords", "created_at", "updated_at"]
+    show_full_result_count = False
+    
+    def get_queryset(self, request):  # type: ignore[no-untyped-def]
+        return super().get_queryset(request).select_related("team")
+
+
+@admin.register(TeamKeyword)
+class TeamKeywordAdmin(admin.ModelAdmin):
+    list_display = ["team", "source", "keyword", "mention_count", "mean_sentiment", "updated_at"]
+    list_filter = ["source", "team"]
+    search_fields = ["keyword", "team__team_name"]
+    ordering = ["team", "-mention_count"]
+    readonly_fields = ["mention_count", "sentiment_sum", "created_at", "updated_at"]
+    
+    def get_queryset(self, request):  # type: ignore[no-untyped-def]
+        return super().get_queryset(request).select_related("team")
@@ -0,0 +1,113 @@
+"""
+Lexicon-based sentiment scoring and keyword extraction.
+Pure Python with no Django imports, so worker processes can import it
+without configuring the project.
+"""
+import math
+import re
+from collections import Counter
+from typing import Iterable, List, Optional, Sequence, Tuple
+from insights.lexicon import INTENSIFIERS, NEGATIONS, SENTIMENT, STOPWORDS
+
+TOKEN = re.compile(r"[a-z]+(?:'[a-z]+)?")
+# Words this far before a sentiment word can negate it
+NEGATION_WINDOW = 3
+# Scale applied to a negated word: "not great" is mildly negative
+NEGATION_SCALE = -0.5
+# Normalises the summed weights into (-1, 1); higher flattens scores
+NORMALISATION = 15
+# Scores within this distance of zero are labelled neutral
+NEUTRAL_BAND = 0.05
+# Longer "words" are usually pasted identifiers or URLs, not themes
+MAX_KEYWORD_LENGTH = 32
+
+POSITIVE = "positive"
+NEUTRAL = "neutral"
+NEGATIVE = "negative"
+
+Analysis = Tuple[float, str, List[str]]
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Lowercase word tokens, keeping contractions ("don't") whole.
+    """
+    return TOKEN.findall(text.lower().replace("’", "'"))
+
+
+def normalize_keyword(token: str) -> str:
+    """
+    Fold possessives and simple plurals so "deploys" and "deploy's" count
+    as "deploy". Words ending in -ss, -us and -is are left alone.
+    """
+    if token.endswith("'s"):
+        token = token[:-2]
+    if len(token) > 4 and token.endswith("s") and not token.endswith(("ss", "us", "is")):
+        token = token[:-1]
+    return token
+
+
+def sentiment_score(tokens: Sequence[str]) -> float:
+    """
+    Sum of the lexicon weights, each scaled by an intensifier directly
+    before it and flipped by a negation shortly before it, squashed into
+    (-1, 1).
+    """
+    total = 0.0
+    for index, token in enumerate(tokens):
+        weight = SENTIMENT.get(token)
+        if weight is None:
+            continue
+        if index and tokens[index - 1] in INTENSIFIERS:
+            weight *= INTENSIFIERS[tokens[index - 1]]
+        if any(word in NEGATIONS for word in tokens[max(0, index - NEGATION_WINDOW):index]):
+            weight *= NEGATION_SCALE
+        total += weight
+    return total / math.sqrt(total * total + NORMALISATION)
+
+
+def sentiment_label(score: float) -> str:
+    if score >= NEUTRAL_BAND:
+        return POSITIVE
+    if score <= -NEUTRAL_BAND:
+        return NEGATIVE
+    return NEUTRAL
+
+
+def extract_keywords(tokens: Sequence[str], limit: int) -> List[str]:
+    """
+    The `limit` most frequent content words, ties broken by first use.
+    """
+    counts: Counter = Counter()
+    for token in tokens:
+        if token in STOPWORDS or token in NEGATIONS or token in INTENSIFIERS:
+            continue
+        keyword = normalize_keyword(token)
+        if 3 <= len(keyword) <= MAX_KEYWORD_LENGTH and keyword not in STOPWORDS:
+            counts[keyword] += 1
+    return [keyword for keyword, _ in counts.most_common(limit)]
+
+
+def analyse_text(text: str, keyword_limit: int) -> Analysis:
+    """
+    (score, label, keywords) for one message.
+    """
+    tokens = tokenize(text)
+    score = sentiment_score(tokens)
+    return round(score, 4), sentiment_label(score), extract_keywords(tokens, keyword_limit)
+
+
+def analyse_texts(
+    items: Iterable[Tuple[str, str]], keyword_limit: int
+) -> List[Tuple[str, Optional[Analysis], Optional[str]]]:
+    """
+    Analyse (key, text) pairs, returning (key, analysis, error) triples so
+    one bad message doesn't fail the batch it came in.
+    """
+    results = []
+    for key, text in items:
+        try:
+            results.append((key, analyse_text(text, keyword_limit), None))
+        except Exception as error:
+            results.append((key, None, f"{type(error).__name__}: {error}"))
+    return results
@@ -0,0 +1,9 @@
+from django.apps import AppConfig
+
+
+class InsightsConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'insights'
+
+    def ready(self) -> None:
+        import insights.signals  # noqa: F401
@@ -0,0 +1,76 @@
+"""
+Word lists for the text analysis in insights/analysis.py, tuned for
+check-in comments and team feedback. Weights run from -3 (very negative)
+to 3 (very positive).
+"""
+
+SENTIMENT = {
+    # positive
+    "amazing": 3, "awesome": 3, "excellent": 3, "fantastic": 3, "love": 3,
+    "outstanding": 3, "perfect": 3, "wonderful": 3, "brilliant": 3,
+    "great": 2.5, "proud": 2.5, "excited": 2.5, "thrilled": 2.5,
+    "happy": 2, "enjoy": 2, "enjoyed": 2, "enjoying": 2, "fun": 2,
+    "glad": 2, "grateful": 2, "thanks": 2, "thank": 2, "appreciate": 2,
+    "appreciated": 2, "success": 2, "successful": 2, "win": 2, "wins": 2,
+    "motivated": 2, "productive": 2, "supportive": 2, "helpful": 2,
+    "good": 1.5, "nice": 1.5, "smooth": 1.5, "improved": 1.5, "improving": 1.5,
+    "progress": 1.5, "confident": 1.5, "collaborative": 1.5, "focused": 1.5,
+    "rested": 1.5, "relaxed": 1.5, "calm": 1.5, "clear": 1, "easy": 1,
+    "solid": 1, "efficient": 1.5, "fast": 1, "balanced": 1.5, "positive": 1.5,
+    "better": 1.5, "best": 2.5, "shipped": 1.5, "delivered": 1.5, "resolved": 1,
+    "fixed": 1, "ok": 0.5, "okay": 0.5, "fine": 0.5, "steady": 0.5,
+    # negative
+    "awful": -3, "terrible": -3, "horrible": -3, "hate": -3, "toxic": -3,
+    "burnout": -3, "miserable": -3, "worst": -3,
+    "exhausted": -2.5, "overwhelmed": -2.5, "frustrated": -2.5, "angry": -2.5,
+    "stressed": -2, "stressful": -2, "stress": -2, "frustrating": -2,
+    "anxious": -2, "worried": -2, "sad": -2, "upset": -2, "unhappy": -2,
+    "disappointed": -2, "disappointing": -2, "chaos": -2, "chaotic": -2,
+    "struggling": -2, "struggle": -2, "painful": -2, "unfair": -2,
+    "ignored": -2, "overloaded": -2, "understaffed": -2, "outage": -2,
+    "crash": -2, "crashed": -2, "broken": -2, "failed": -2, "failure": -2,
+    "failing": -2, "sick": -2, "lonely": -2, "mess": -2, "worse": -2,
+    "bad": -1.5, "tired": -1.5, "blocked": -1.5, "blocker": -1.5,
+    "blockers": -1.5, "confusing": -1.5, "confused": -1.5, "unclear": -1.5,
+    "annoying": -1.5, "boring": -1.5, "rushed": -1.5, "messy": -1.5,
+    "pressure": -1.5, "overtime": -1.5, "delayed": -1.5, "conflict": -1.5,
+    "poor": -1.5, "negative": -1.5, "concerned": -1.5, "slow": -1,
+    "late": -1, "delay": -1, "bug": -1, "bugs": -1, "problem": -1,
+    "problems": -1, "issue": -1, "issues": -1, "concern": -1, "hard": -1,
+    "difficult": -1, "busy": -0.5,
+}
+
+NEGATIONS = {
+    "not", "no", "never", "none", "nothing", "neither", "nor", "without",
+    "cannot", "can't", "don't", "doesn't", "didn't", "isn't", "aren't",
+    "wasn't", "weren't", "won't", "wouldn't", "shouldn't", "couldn't",
+    "haven't", "hasn't", "hadn't", "barely", "hardly",
+}
+
+INTENSIFIERS = {
+    "very": 1.5, "really": 1.5, "extremely": 2, "super": 1.5, "so": 1.3,
+    "totally": 1.5, "incredibly": 2, "absolutely": 2, "quite": 1.2,
+    "pretty": 1.2, "too": 1.3, "slightly": 0.6, "somewhat": 0.7,
+    "kinda": 0.7, "bit": 0.7,
+}
+
+STOPWORDS = {
+    "a", "about", "above", "after", "again", "against", "all", "also", "am",
+    "an", "and", "any", "are", "as", "at", "be", "because", "been", "before",
+    "being", "below", "between", "both", "but", "by", "can", "could", "did",
+    "do", "does", "doing", "down", "during", "each", "even", "ever", "few",
+    "for", "from", "further", "get", "got", "had", "has", "have", "having",
+    "he", "her", "here", "hers", "herself", "him", "himself", "his", "how",
+    "i", "i'm", "i've", "if", "in", "into", "is", "it", "it's", "its",
+    "itself", "just", "lot", "lots", "me", "more", "most", "much", "my",
+    "myself", "of", "off", "on", "once", "one", "only", "or", "other", "our",
+    "ours", "ourselves", "out", "over", "own", "same", "she", "should",
+    "some", "still", "such", "than", "that", "the", "their", "theirs",
+    "them", "themselves", "then", "there", "these", "they", "this", "those",
+    "through", "to", "under", "until", "up", "us", "was", "we", "we're",
+    "were", "what", "when", "where", "which", "while", "who", "whom", "why",
+    "will", "with", "would", "you", "your", "yours", "yourself",
+    "yourselves", "week", "weeks", "today", "yesterday", "day", "days",
+    "time", "thing", "things", "feel", "feeling", "felt", "think", "bit",
+    "like", "make", "made", "way", "well", "yet",
+}
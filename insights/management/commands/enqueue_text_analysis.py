@@ -0,0 +1,62 @@
+from typing import Any
+from django.core.management.base import BaseCommand
+from insights.models import FEEDBACK, PULSE_LOG, TextAnalysis
+from insights.pipeline import SOURCES
+from insights.tasks import enqueue
+
+
+class Command(BaseCommand):
+    help = (
+        "Queue existing feedback messages and pulse log comments on the "
+        "analysis task queue. Walks each table in primary key order and is "
+        "safe to interrupt and run again: analysing a text twice only "
+        "rewrites its analysis."
+    )
+
+    def add_arguments(self, parser: Any) -> None:
+        parser.add_argument(
+            "--source",
+            choices=(FEEDBACK, PULSE_LOG, "all"),
+            default="all",
+        )
+        parser.add_argument(
+            "--missing",
+            action="store_true",
+            help="Only queue texts that have no analysis yet.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=2000,
+            help="Number of texts read per query.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        sources = [FEEDBACK, PULSE_LOG] if options["source"] == "all" else [options["source"]]
+        total = 0
+        for source in sources:
+            queued = self.enqueue_source(source, options["missing"], options["batch_size"])
+            self.stdout.write(f"Queued {queued} {source} texts")
+            total += queued
+        self.stdout.write(self.style.SUCCESS(f"Queued {total} texts for analysis"))
+
+    def enqueue_source(self, source: str, missing: bool, batch_size: int) -> int:
+        model, field = SOURCES[source]
+        texts = model.objects.filter(**{f"{field}__isnull": False}).exclude(**{field: ""})
+        queued = 0
+        last_pk = None
+        while True:
+            batch = texts.order_by("pk")
+            if last_pk is not None:
+                batch = batch.filter(pk__gt=last_pk)
+            pks = list(batch.values_list("pk", flat=True)[:batch_size])
+            if not pks:
+                return queued
+            last_pk = pks[-1]
+            if missing:
+                analysed = set(
+                    TextAnalysis.objects.filter(source=source, object_id__in=pks)
+                    .values_list("object_id", flat=True)
+                )
+                pks = [pk for pk in pks if pk not in analysed]
+            queued += enqueue(source, pks)
@@ -0,0 +1,22 @@
+from typing import Any
+from django.core.management.base import BaseCommand
+from insights.models import TextAnalysis
+from insights.pipeline import aggregate_team_keywords
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the keyword counts of every team with analysed texts. "
+        "The analysis tasks refresh the teams they touch; run this after "
+        "changing TEXT_ANALYSIS_TEAM_KEYWORDS or the lexicon."
+    )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        teams = set(
+            TextAnalysis.objects.filter(team__isnull=False)
+            .order_by()
+            .values_list("team_id", flat=True)
+            .distinct()
+        )
+        written = aggregate_team_keywords(teams)
+        self.stdout.write(self.style.SUCCESS(f"Refreshed {written} keywords for {len(teams)} teams"))
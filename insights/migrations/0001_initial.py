@@ -0,0 +1,75 @@
+# Generated by Django 5.2.8 on 2026-10-18 08:41
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('teams', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TextAnalysisJob',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('source', models.CharField(choices=[('feedback', 'Team feedback'), ('pulse_log', 'Pulse log comment')], max_length=16)),
+                ('object_id', models.UUIDField()),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('failed', 'Failed')], default='pending', max_length=16)),
+                ('attempts', models.IntegerField(default=0)),
+                ('claimed_at', models.DateTimeField(blank=True, null=True)),
+                ('error', models.TextField(blank=True, default='')),
+            ],
+            options={
+                'db_table': 'text_analysis_jobs',
+                'ordering': ['created_at'],
+                'indexes': [models.Index(fields=['status', 'created_at'], name='text_analys_status_060398_idx')],
+                'constraints': [models.UniqueConstraint(fields=('source', 'object_id'), name='unique_text_analysis_job')],
+            },
+        ),
+        migrations.CreateModel(
+            name='TeamKeyword',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('source', models.CharField(choices=[('feedback', 'Team feedback'), ('pulse_log', 'Pulse log comment')], max_length=16)),
+                ('keyword', models.CharField(max_length=64)),
+                ('mention_count', models.IntegerField(default=0)),
+                ('sentiment_sum', models.FloatField(default=0)),
+                ('team', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='keywords', to='teams.team')),
+            ],
+            options={
+                'db_table': 'team_keywords',
+                'ordering': ['-mention_count', 'keyword'],
+                'constraints': [models.UniqueConstraint(fields=('team', 'source', 'keyword'), name='unique_team_keyword')],
+            },
+        ),
+        migrations.CreateModel(
+            name='TextAnalysis',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('source', models.CharField(choices=[('feedback', 'Team feedback'), ('pulse_log', 'Pulse log comment')], max_length=16)),
+                ('object_id', models.UUIDField()),
+                ('sentiment', models.FloatField(help_text='From -1 (negative) to 1 (positive)')),
+                ('label', models.CharField(max_length=16)),
+                ('keywords', models.JSONField(default=list)),
+                ('team', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='text_analyses', to='teams.team')),
+            ],
+            options={
+                'verbose_name_plural': 'text analyses',
+                'db_table': 'text_analyses',
+                'indexes': [models.Index(fields=['team', 'source'], name='text_analys_team_id_2c3c1c_idx')],
+                'constraints': [models.UniqueConstraint(fields=('source', 'object_id'), name='unique_text_analysis')],
+            },
+        ),
+    ]
@@ -0,0 +1,16 @@
+# Generated by Django 5.2.8 on 2026-10-18 09:45
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('insights', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.DeleteModel(
+            name='TextAnalysisJob',
+        ),
+    ]
@@ -0,0 +1,91 @@
+import uuid
+from django.db import models
+from app.abstracts import TimeStampedModel
+
+FEEDBACK = "feedback"
+PULSE_LOG = "pulse_log"
+SOURCE_CHOICES = [
+    (FEEDBACK, "Team feedback"),
+    (PULSE_LOG, "Pulse log comment"),
+]
+
+
+class TextAnalysis(TimeStampedModel):
+    """
+    Sentiment and keywords of one feedback message or pulse log comment,
+    written by the analysis tasks (insights/tasks.py).
+    """
+    id = models.UUIDField(
+        primary_key=True,
+        default=uuid.uuid4,
+        editable=False,
+        unique=True,
+    )
+    source = models.CharField(max_length=16, choices=SOURCE_CHOICES)
+    object_id = models.UUIDField()
+    team = models.ForeignKey(
+        "teams.Team",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="text_analyses",
+    )
+    sentiment = models.FloatField(help_text="From -1 (negative) to 1 (positive)")
+    label = models.CharField(max_length=16)
+    keywords = models.JSONField(default=list)
+    
+    class Meta:
+        db_table = "text_analyses"
+        verbose_name_plural = "text analyses"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["source", "object_id"],
+                name="unique_text_analysis",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["team", "source"]),
+        ]
+    
+    def __str__(self) -> str:
+        return f"{self.source} {self.object_id}: {self.label}"
+
+
+class TeamKeyword(TimeStampedModel):
+    """
+    How often a keyword comes up in a team's feedback or pulse comments,
+    and the mean sentiment of the texts mentioning it. Recomputed per team
+    by the analysis tasks, keeping the most frequent keywords only.
+    """
+    id = models.UUIDField(
+        primary_key=True,
+        default=uuid.uuid4,
+        editable=False,
+        unique=True,
+    )
+    team = models.ForeignKey(
+        "teams.Team",
+        on_delete=models.CASCADE,
+        related_name="keywords",
+    )
+    source = models.CharField(max_length=16, choices=SOURCE_CHOICES)
+    keyword = models.CharField(max_length=64)
+    mention_count = models.IntegerField(default=0)
+    sentiment_sum = models.FloatField(default=0)
+    
+    class Meta:
+        db_table = "team_keywords"
+        ordering = ["-mention_count", "keyword"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["team", "source", "keyword"],
+                name="unique_team_keyword",
+            ),
+        ]
+    
+    @property
+    def mean_sentiment(self) -> float:
+        return self.sentiment_sum / self.mention_count if self.mention_count else 0.0
+    
+    def __str__(self) -> str:
+        return f"{self.team} - {self.keyword} ({self.mention_count})"
@@ -0,0 +1,109 @@
+from collections import Counter, defaultdict
+from typing import Any, Dict, Iterable, List, Set, Tuple
+from django.conf import settings
+from django.db import transaction
+from feedback.models import TeamFeedback
+from insights.analysis import analyse_texts
+from insights.models import FEEDBACK, PULSE_LOG, TeamKeyword, TextAnalysis
+from logs.models import PulseLog
+
+# source -> (model, text field)
+SOURCES: Dict[str, Tuple[Any, str]] = {
+    FEEDBACK: (TeamFeedback, "message"),
+    PULSE_LOG: (PulseLog, "comment"),
+}
+
+
+def load_texts(source: str, object_ids: List[str]) -> Dict[str, Tuple[Any, str]]:
+    """
+    {object id: (team id, text)} for the texts that still exist and
+    aren't blank.
+    """
+    model, field = SOURCES[source]
+    rows = model.objects.filter(pk__in=object_ids).values_list("pk", "team_id", field)
+    return {str(pk): (team_id, text) for pk, team_id, text in rows if text and text.strip()}
+
+
+def analyse(source: str, object_ids: Iterable[Any]) -> Tuple[Set[Any], Dict[str, str]]:
+    """
+    Analyse texts of one source and store the results, deleting the
+    analyses of texts that are gone or blank. Returns the ids of the teams
+    whose keyword aggregates are now stale, and the errors of the texts
+    that failed by object id.
+    """
+    object_ids = [str(object_id) for object_id in object_ids]
+    texts = load_texts(source, object_ids)
+    items = [(pk, text) for pk, (_, text) in texts.items()]
+    results = analyse_texts(items, settings.TEXT_ANALYSIS_KEYWORDS_PER_TEXT)
+    errors = {pk: error for pk, _, error in results if error is not None}
+    
+    with transaction.atomic():
+        previous = TextAnalysis.objects.filter(source=source, object_id__in=object_ids)
+        teams = set(previous.values_list("team_id", flat=True))
+        gone = [pk for pk in object_ids if pk not in texts]
+        if gone:
+            TextAnalysis.objects.filter(source=source, object_id__in=gone).delete()
+        
+        rows = []
+        for pk, analysis, error in results:
+            if error is not None:
+                continue
+            score, label, keywords = analysis
+            team_id = texts[pk][0]
+            teams.add(team_id)
+            rows.append(
+                TextAnalysis(
+                    source=source,
+                    object_id=pk,
+                    team_id=team_id,
+                    sentiment=score,
+                    label=label,
+                    keywords=keywords,
+                )
+            )
+        TextAnalysis.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=["source", "object_id"],
+            update_fields=["team", "sentiment", "label", "keywords", "updated_at"],
+        )
+    teams.discard(None)
+    return teams, errors
+
+
+def aggregate_team_keywords(team_ids: Iterable[Any], chunk_size: int = 2000) -> int:
+    """
+    Recompute the keyword counts of the given teams from their analyses,
+    keeping the TEXT_ANALYSIS_TEAM_KEYWORDS most frequent keywords per
+    team and source. Returns the number of rows written.
+    """
+    limit = settings.TEXT_ANALYSIS_TEAM_KEYWORDS
+    written = 0
+    for team_id in team_ids:
+        counts: Dict[str, Counter] = defaultdict(Counter)
+        sentiment: Dict[str, Counter] = defaultdict(Counter)
+        analyses = (
+            TextAnalysis.objects.filter(team_id=team_id)
+            .order_by()
+            .values_list("source", "keywords", "sentiment")
+        )
+        for source, keywords, score in analyses.iterator(chunk_size=chunk_size):
+            for keyword in keywords:
+                counts[source][keyword] += 1
+                sentiment[source][keyword] += score
+        rows = [
+            TeamKeyword(
+                team_id=team_id,
+                source=source,
+                keyword=keyword,
+                mention_count=count,
+                sentiment_sum=round(sentiment[source][keyword], 4),
+            )
+            for source, keyword_counts in counts.items()
+            for keyword, count in keyword_counts.most_common(limit)
+        ]
+        with transaction.atomic():
+            TeamKeyword.objects.filter(team_id=team_id).delete()
+            TeamKeyword.objects.bulk_create(rows, batch_size=chunk_size)
+        written += len(rows)
+    return written
@@ -0,0 +1,24 @@
+from typing import Any
+from django.conf import settings
+from rest_framework import serializers
+from insights.models import SOURCE_CHOICES, TeamKeyword
+
+
+class TeamKeywordQuerySerializer(serializers.Serializer):
+    source = serializers.ChoiceField(choices=SOURCE_CHOICES, required=False)
+    limit = serializers.IntegerField(min_value=1, default=50)
+    
+    def validate_limit(self, value: int) -> int:
+        return min(value, settings.TEXT_ANALYSIS_TEAM_KEYWORDS)
+
+
+class TeamKeywordSerializer(serializers.ModelSerializer):
+    mean_sentiment = serializers.SerializerMethodField()
+    
+    class Meta:
+        model = TeamKeyword
+        fields = ("keyword", "source", "mention_count", "mean_sentiment", "updated_at")
+        read_only_fields = fields
+    
+    def get_mean_sentiment(self, obj: Any) -> float:
+        return round(obj.mean_sentiment, 4)
@@ -0,0 +1,50 @@
+from typing import Any, List
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from feedback.models import TeamFeedback
+from insights.models import FEEDBACK, PULSE_LOG
+from insights.tasks import enqueue
+from logs.models import PulseLog
+from logs.signals import pulse_logs_bulk_created
+
+
+@receiver(post_save, sender=TeamFeedback)
+def analyse_feedback_on_save(sender: Any, instance: TeamFeedback, **kwargs: Any) -> None:
+    enqueue(FEEDBACK, [instance.pk])
+
+
+@receiver(post_delete, sender=TeamFeedback)
+def analyse_feedback_on_delete(sender: Any, instance: TeamFeedback, **kwargs: Any) -> None:
+    """
+    The task finds the feedback gone, drops its analysis and refreshes the
+    team's keywords.
+    """
+    enqueue(FEEDBACK, [instance.pk])
+
+
+@receiver(post_save, sender=PulseLog)
+def analyse_pulse_log_on_save(
+    sender: Any, instance: PulseLog, created: bool, **kwargs: Any
+) -> None:
+    """
+    Logs created without a comment have nothing to analyse; edits are
+    always queued since they may have cleared or changed the comment.
+    """
+    if created and not (instance.comment or "").strip():
+        return
+    enqueue(PULSE_LOG, [instance.pk])
+
+
+@receiver(pulse_logs_bulk_created, sender=PulseLog)
+def analyse_pulse_logs_on_bulk_create(
+    sender: Any, instances: List[PulseLog], **kwargs: Any
+) -> None:
+    enqueue(
+        PULSE_LOG, [instance.pk for instance in instances if (instance.comment or "").strip()]
+    )
+
+
+@receiver(post_delete, sender=PulseLog)
+def analyse_pulse_log_on_delete(sender: Any, instance: PulseLog, **kwargs: Any) -> None:
+    if (instance.comment or "").strip():
+        enqueue(PULSE_LOG, [instance.pk])
@@ -0,0 +1,41 @@
+import logging
+from typing import Any, Iterable, List
+from django.conf import settings
+from insights.pipeline import aggregate_team_keywords, analyse
+from tasks.registry import task
+from tasks.worker import retry_delay
+
+logger = logging.getLogger(__name__)
+
+
+@task(queue="analysis")
+def analyse_texts_task(source: str, object_ids: List[str], attempt: int = 1) -> None:
+    """
+    Analyse feedback messages or pulse log comments, then refresh the
+    keyword counts of the teams affected. Texts that fail are retried on
+    their own, up to TEXT_ANALYSIS_MAX_ATTEMPTS times, so one bad text
+    doesn't hold back its batch.
+    """
+    teams, errors = analyse(source, object_ids)
+    aggregate_team_keywords(teams)
+    if not errors:
+        return
+    if attempt < settings.TEXT_ANALYSIS_MAX_ATTEMPTS:
+        analyse_texts_task.schedule(
+            (source, list(errors)), {"attempt": attempt + 1}, countdown=retry_delay(attempt)
+        )
+    else:
+        logger.error("Text analysis failed for %s texts: %s", source, errors)
+
+
+def enqueue(source: str, object_ids: Iterable[Any]) -> int:
+    """
+    Queue texts for analysis, TEXT_ANALYSIS_BATCH_SIZE per task. The tasks
+    are written in the caller's transaction, so a rolled back write never
+    leaves one behind.
+    """
+    object_ids = [str(object_id) for object_id in object_ids]
+    batch_size = settings.TEXT_ANALYSIS_BATCH_SIZE
+    for start in range(0, len(object_ids), batch_size):
+        analyse_texts_task.delay(source, object_ids[start:start + batch_size])
+    return len(object_ids)
@@ -0,0 +1,129 @@
+from unittest import mock
+from django.test import SimpleTestCase, override_settings
+from app.testing import APITestCase, create_user
+from feedback.models import TeamFeedback
+from insights.analysis import analyse_text
+from insights.models import FEEDBACK, PULSE_LOG, TeamKeyword, TextAnalysis
+from insights.tasks import enqueue
+from logs.models import PulseLog
+from tasks.models import Task
+from tasks.worker import Worker
+from teams.models import Team
+
+
+class TextAnalysisTests(SimpleTestCase):
+    def test_scores_sentiment_with_negation_and_intensifiers(self) -> None:
+        score, label, _ = analyse_text("Great sprint, really happy with the release", 10)
+        self.assertEqual(label, "positive")
+        self.assertGreater(score, 0.5)
+        
+        score, label, _ = analyse_text("Exhausted and blocked on reviews again", 10)
+        self.assertEqual(label, "negative")
+        self.assertLess(score, -0.5)
+        
+        negated, label, _ = analyse_text("The release was not great", 10)
+        self.assertEqual(label, "negative")
+        self.assertGreater(negated, -0.5)
+        
+        self.assertEqual(analyse_text("Standup moved to 10am", 10)[1], "neutral")
+        stronger = analyse_text("very happy", 10)[0]
+        self.assertGreater(stronger, analyse_text("happy", 10)[0])
+    
+    def test_extracts_normalised_keywords_by_frequency(self) -> None:
+        _, _, keywords = analyse_text(
+            "Deploys failed. The deploy pipeline's flaky and deploys are slow", 3
+        )
+        self.assertEqual(keywords, ["deploy", "failed", "pipeline"])
+        self.assertEqual(analyse_text("I was not in the office", 10)[2], ["office"])
+
+
+@override_settings(TASKS_EAGER=False)
+class TextAnalysisPipelineTests(APITestCase):
+    def setUp(self) -> None:
+        self.user = create_user()
+        self.team = Team.objects.create(team_name="Core")
+        self.team.members.add(self.user)
+        self.client.force_authenticate(self.user)
+        self.worker = Worker(["analysis"], batch_size=10, name="test-worker")
+    
+    def create_feedback(self, message: str) -> TeamFeedback:
+        return TeamFeedback.objects.create(user=self.user, team=self.team, message=message)
+    
+    def queued(self, source: str) -> list:
+        return [
+            object_id
+            for args in Task.objects.filter(queue="analysis").values_list("args", flat=True)
+            if args[0] == source
+            for object_id in args[1]
+        ]
+    
+    def test_writes_are_queued_on_the_analysis_queue(self) -> None:
+        response = self.client.post(
+            "/api/v1/team-feedbacks/", {"message": "Great retro"}, format="json"
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(self.queued(FEEDBACK), [response.json()["id"]])
+        
+        PulseLog.objects.create(user=self.user, team=self.team, mood=3, workload=3)
+        log = PulseLog.objects.create(
+            user=self.user, team=self.team, mood=2, workload=4, comment="Blocked again"
+        )
+        self.assertEqual(self.queued(PULSE_LOG), [str(log.pk)])
+    
+    def test_tasks_analyse_texts_and_aggregate_team_keywords(self) -> None:
+        self.create_feedback("Deploys keep failing, blocked on the pipeline")
+        self.create_feedback("Pipeline is blocked again")
+        removed = self.create_feedback("Great demo day")
+        
+        self.worker.run(once=True)
+        self.assertEqual(self.worker.succeeded, 3)
+        self.assertFalse(Task.objects.exists())
+        self.assertEqual(TextAnalysis.objects.filter(label="negative").count(), 2)
+        
+        response = self.client.get(f"/api/v1/teams/{self.team.id}/keywords/", {"limit": 2})
+        self.assertEqual(response.status_code, 200)
+        results = response.json()["results"]
+        self.assertEqual(
+            [(item["keyword"], item["mention_count"]) for item in results],
+            [("blocked", 2), ("pipeline", 2)],
+        )
+        self.assertLess(results[0]["mean_sentiment"], 0)
+        
+        removed.delete()
+        self.worker.run(once=True)
+        self.assertFalse(TextAnalysis.objects.filter(object_id=removed.pk).exists())
+        self.assertFalse(TeamKeyword.objects.filter(keyword="demo").exists())
+    
+    @override_settings(TEXT_ANALYSIS_BATCH_SIZE=2)
+    def test_texts_are_queued_in_batches(self) -> None:
+        feedback = [self.create_feedback(f"Happy with sprint {index}") for index in range(5)]
+        Task.objects.all().delete()
+        self.assertEqual(enqueue(FEEDBACK, [item.pk for item in feedback]), 5)
+        self.assertEqual(
+            [len(args[1]) for args in Task.objects.order_by("run_at").values_list("args", flat=True)],
+            [2, 2, 1],
+        )
+        self.worker.run(once=True)
+        self.assertEqual(TextAnalysis.objects.filter(label="positive").count(), 5)
+    
+    def test_failing_texts_are_retried_alone(self) -> None:
+        good = self.create_feedback("Calm week")
+        bad = self.create_feedback("Broken text")
+        
+        def analyse_text_or_fail(text: str, keyword_limit: int) -> tuple:
+            if text == bad.message:
+                raise ValueError("unreadable")
+            return analyse_text(text, keyword_limit)
+        
+        with mock.patch("insights.analysis.analyse_text", side_effect=analyse_text_or_fail):
+            self.worker.run(once=True)
+        self.assertTrue(TextAnalysis.objects.filter(object_id=good.pk).exists())
+        retry = Task.objects.get()
+        self.assertEqual(retry.args, [FEEDBACK, [str(bad.pk)]])
+        self.assertEqual(retry.kwargs, {"attempt": 2})
+    
+    def test_keywords_are_limited_to_members(self) -> None:
+        outsider = create_user("outsider")
+        self.client.force_authenticate(outsider)
+        response = self.client.get(f"/api/v1/teams/{self.team.id}/keywords/")
+        self.assertEqual(response.status_code, 403)
@@ -0,0 +1,47 @@
+from django.shortcuts import get_object_or_404
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from app.replicas import ReplicaReadMixin
+from insights.models import TeamKeyword
+from insights.serializers import TeamKeywordQuerySerializer, TeamKeywordSerializer
+from teams.membership import is_team_member
+from teams.models import Team
+
+
+class TeamKeywordListView(ReplicaReadMixin, APIView):
+    """
+    The keywords that come up most in a team's feedback and pulse comments.
+    - Members of the team and admins can view keywords
+    - `?source=feedback|pulse_log` limits them to one kind of text
+    - Counts are precomputed by the analysis tasks
+    """
+    permission_classes = (IsAuthenticated,)
+    
+    def get(self, request: Request, id: str) -> Response:
+        team = get_object_or_404(Team, id=id)
+        if not request.user.is_staff and not is_team_member(request.user, team.id):
+            return Response(
+                {"error": "You are not a member of this team"},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+        
+        serializer = TeamKeywordQuerySerializer(data=request.query_params.dict())
+        serializer.is_valid(raise_exception=True)
+        params = serializer.validated_data
+        
+        keywords = TeamKeyword.objects.filter(team=team)
+        if params.get("source"):
+            keywords = keywords.filter(source=params["source"])
+        keywords = keywords.order_by("-mention_count", "keyword")[: params["limit"]]
+        
+        return Response(
+            {
+                "team_id": str(team.id),
+                "team_name": team.team_name,
+                "results": TeamKeywordSerializer(keywords, many=True).data,
+            },
+            status=status.HTTP_200_OK,
+        )
@@ -1,9 +1,14 @@
+from django.conf import settings
 from django.contrib import admin
-from logs.models import EventLog, PulseLog
+from app.replicas import ReplicaAdminMixin
+from app.search import SearchIndexAdminMixin
+from logs.models import EventLog, PulseLog, TeamWeeklyPulse, UserPulseStats
+from logs.partitions import recent_window_start
+from logs.search import pulse_log_search
 
 
 @admin.register(PulseLog)
-class PulseLogAdmin(admin.ModelAdmin):
+class PulseLogAdmin(ReplicaAdminMixin, SearchIndexAdminMixin, admin.ModelAdmin):
     list_display = [
         "user",
         "mood",
@@ -14,7 +19,9 @@ class PulseLogAdmin(admin.ModelAdmin):
         "timestamp",
     ]
     list_filter = ["mood", "workload", "team", "year", "week_index", "timestamp"]
-    search_fields = ["user__username", "user__email", "comment"]
+    # Comments are matched through the full-text index
+    search_fields = ["user__username", "user__email"]
+    search_index = pulse_log_search
     ordering = ["-timestamp"]
     readonly_fields = ["timestamp", "created_at", "updated_at"]
     
@@ -22,10 +29,96 @@ class PulseLogAdmin(admin.ModelAdmin):
         return super().get_queryset(request).select_related("user", "team")
 
 
+@admin.register(TeamWeeklyPulse)
+class TeamWeeklyPulseAdmin(admin.ModelAdmin):
+    list_display = ["team", "year", "week_index", "log_count", "updated_at"]
+    list_filter = ["year", "team"]
+    ordering = ["-year", "-week_index"]
+    readonly_fields = [
+        "log_count",
+        "mood_sum",
+        "mood_sum_sq",
+        "workload_sum",
+        "workload_sum_sq",
+        "created_at",
+        "updated_at",
+    ]
+
+
+@admin.register(UserPulseStats)
+class UserPulseStatsAdmin(admin.ModelAdmin):
+    list_display = [
+        "user",
+        "current_streak",
+        "longest_streak",
+        "weeks_logged",
+        "total_logs",
+        "last_year",
+        "last_week_index",
+    ]
+    search_fields = ["user__username", "user__email"]
+    ordering = ["-current_streak"]
+    readonly_fields = [
+        "total_logs",
+        "weeks_logged",
+        "mood_sum",
+        "workload_sum",
+        "current_streak",
+        "longest_streak",
+        "last_year",
+        "last_week_index",
+        "created_at",
+        "updated_at",
+    ]
+    
+    def get_queryset(self, request):  # type: ignore[no-untyped-def]
+        return super().get_queryset(request).select_related("user")
+
+
+class EventLogWindowFilter(admin.SimpleListFilter):
+    """
+    Limits the event log changelist to a recent window, the last
+    EVENT_LOG_LIST_WINDOW_DAYS days unless another one is picked, so
+    listing and searching only read the newest partitions.
+    """
+    title = "window"
+    parameter_name = "window"
+    
+    def lookups(self, request, model_admin):  # type: ignore[no-untyped-def]
+        return [
+            ("1", "Last 24 hours"),
+            ("7", "Last 7 days"),
+            ("default", f"Last {settings.EVENT_LOG_LIST_WINDOW_DAYS} days"),
+            ("365", "Last year"),
+            ("all", "All time"),
+        ]
+    
+    def value(self):  # type: ignore[no-untyped-def]
+        value = super().value()
+        return value if value in dict(self.lookup_choices) else "default"
+    
+    def choices(self, changelist):  # type: ignore[no-untyped-def]
+        for lookup, title in self.lookup_choices:
+            yield {
+                "selected": self.value() == lookup,
+                "query_string": changelist.get_query_string({self.parameter_name: lookup}),
+                "display": title,
+            }
+    
+    def queryset(self, request, queryset):  # type: ignore[no-untyped-def]
+        value = self.value()
+        if value == "all":
+            return queryset
+        days = None if value == "default" else int(value)
+        return queryset.filter(timestamp__gte=recent_window_start(days))
+
+
 @admin.register(EventLog)
-class EventLogAdmin(admin.ModelAdmin):
+class EventLogAdmin(ReplicaAdminMixin, admin.ModelAdmin):
     list_display = ["event_name", "timestamp", "created_at"]
-    list_filter = ["event_name", "timestamp"]
+    list_filter = [EventLogWindowFilter, "event_name"]
     search_fields = ["event_name", "metadata"]
     ordering = ["-timestamp"]
     readonly_fields = ["timestamp", "created_at", "updated_at"]
+    # Counting every event for "N total" would read all partitions
+    show_full_result_count = False
@@ -1,6 +1,14 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 
 class LogsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'logs'
+
+    def ready(self) -> None:
+        from app.search import install_search_indexes
+        import logs.search  # noqa: F401
+        import logs.signals  # noqa: F401
+        
+        post_migrate.connect(install_search_indexes, sender=self)
@@ -0,0 +1,47 @@
+from typing import Any, Iterator
+
+PULSE_LOG_EXPORT_FIELDS = (
+    ("id", "id"),
+    ("user_id", "user_id"),
+    ("user_name", "user__username"),
+    ("team_id", "team_id"),
+    ("team_name", "team__team_name"),
+    ("mood", "mood"),
+    ("workload", "workload"),
+    ("comment", "comment"),
+    ("timestamp", "timestamp"),
+    ("timestamp_local", "timestamp_local"),
+    ("year", "year"),
+    ("week_index", "week_index"),
+    ("created_at", "created_at"),
+)
+
+PULSE_LOG_EXPORT_COLUMNS = tuple(column for column, _ in PULSE_LOG_EXPORT_FIELDS)
+
+
+def pulse_log_export_rows(queryset: Any, chunk_size: int) -> Iterator[tuple]:
+    """
+    Stream pulse log rows as tuples through a server-side cursor
+    """
+    lookups = [lookup for _, lookup in PULSE_LOG_EXPORT_FIELDS]
+    return queryset.values_list(*lookups).iterator(chunk_size=chunk_size)
+
+
+EVENT_LOG_EXPORT_FIELDS = (
+    ("id", "id"),
+    ("timestamp", "timestamp"),
+    ("event_name", "event_name"),
+    ("metadata", "metadata"),
+    ("created_at", "created_at"),
+    ("updated_at", "updated_at"),
+)
+
+EVENT_LOG_EXPORT_COLUMNS = tuple(column for column, _ in EVENT_LOG_EXPORT_FIELDS)
+
+
+def event_log_export_rows(queryset: Any, chunk_size: int) -> Iterator[tuple]:
+    """
+    Stream event log rows as tuples through a server-side cursor
+    """
+    lookups = [lookup for _, lookup in EVENT_LOG_EXPORT_FIELDS]
+    return queryset.values_list(*lookups).iterator(chunk_size=chunk_size)
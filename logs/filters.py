@@ -0,0 +1,61 @@
+import json
+import re
+from typing import Any
+from django.db import connections
+from django.db.models import Q
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+
+# Dot-separated key names; "__" is kept out since it separates ORM lookups
+METADATA_SEGMENT = r"[A-Za-z0-9-]+(?:_[A-Za-z0-9-]+)*"
+METADATA_KEY = re.compile(rf"^{METADATA_SEGMENT}(?:\.{METADATA_SEGMENT})*$")
+
+
+class MetadataFilterBackend(BaseFilterBackend):
+    """
+    Filters on JSON metadata keys, e.g. `?meta.team_id=<id>&meta.device.os=ios`.
+    - Dotted keys reach into nested objects
+    - A value that parses as JSON (`5`, `true`, `null`) also matches that
+      type, so `?meta.count=5` finds both 5 and "5"
+    On PostgreSQL each filter is a containment test (`@>`) served by the GIN
+    index on metadata; other databases compare the extracted key.
+    """
+    param_prefix = "meta."
+    field_name = "metadata"
+    
+    def filter_queryset(self, request, queryset, view):  # type: ignore[no-untyped-def]
+        for param in request.query_params:
+            if not param.startswith(self.param_prefix):
+                continue
+            key = param[len(self.param_prefix):]
+            if not METADATA_KEY.match(key):
+                raise ValidationError({param: "Invalid metadata key."})
+            queryset = queryset.filter(
+                self.key_condition(key.split("."), request.query_params[param], queryset.db)
+            )
+        return queryset
+    
+    @staticmethod
+    def candidates(raw: str) -> list:
+        try:
+            parsed = json.loads(raw)
+        except ValueError:
+            return [raw]
+        if isinstance(parsed, (dict, list)) or parsed == raw:
+            return [raw]
+        return [raw, parsed]
+    
+    def key_condition(self, path: list, raw: str, using: str) -> Q:
+        condition = Q()
+        for value in self.candidates(raw):
+            if connections[using].vendor == "postgresql":
+                contained: Any = value
+                for key in reversed(path):
+                    contained = {key: contained}
+                condition |= Q(**{f"{self.field_name}__contains": contained})
+            else:
+                # The explicit exact lookup keeps keys named like lookups
+                # ("contains", "isnull") from being read as one.
+                lookup = "__".join([self.field_name, *path, "exact"])
+                condition |= Q(**{lookup: value})
+        return condition
@@ -0,0 +1,67 @@
+from typing import Any
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from logs.partitions import (
+    archive_month,
+    drop_month,
+    ensure_partitions,
+    expired_months,
+    is_partitioned,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Create the upcoming monthly event log partitions, then archive every "
+        "month older than the retention period to gzipped NDJSON and drop it. "
+        "Safe to run repeatedly, e.g. daily from cron."
+    )
+
+    def add_arguments(self, parser: Any) -> None:
+        parser.add_argument(
+            "--retention-months",
+            type=int,
+            default=settings.EVENT_LOG_RETENTION_MONTHS,
+            help="Whole months to keep before the current one.",
+        )
+        parser.add_argument("--archive-dir", default=settings.EVENT_LOG_ARCHIVE_DIR)
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=settings.EXPORT_CHUNK_SIZE,
+            help="Rows fetched per round trip while archiving.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.EVENT_LOG_DELETE_BATCH_SIZE,
+            help="Rows deleted per statement without partitioning.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="List the months that would be archived without changing anything.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        months = expired_months(options["retention_months"])
+        if options["dry_run"]:
+            for month in months:
+                self.stdout.write(f"Would archive {month:%Y-%m}")
+            return
+        
+        for month in ensure_partitions():
+            self.stdout.write(f"Created partition for {month:%Y-%m}")
+        
+        for month in months:
+            path, count = archive_month(month, options["archive_dir"], options["chunk_size"])
+            drop_month(month, options["batch_size"])
+            if path:
+                self.stdout.write(f"Archived {count} events from {month:%Y-%m} to {path}")
+            else:
+                self.stdout.write(f"Dropped empty month {month:%Y-%m}")
+        
+        storage = "monthly partitions" if is_partitioned() else "a single table"
+        self.stdout.write(
+            self.style.SUCCESS(f"Archived {len(months)} months; event logs use {storage}")
+        )
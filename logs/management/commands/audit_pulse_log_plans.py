@@ -0,0 +1,117 @@
+import json
+from itertools import combinations
+from typing import Any, Dict, List
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from app.plans import classify_plan, explain
+from logs.models import PulseLog
+from logs.plans import pulse_log_list_querysets
+from logs.views import PulseLogListCreateView
+
+
+class Command(BaseCommand):
+    help = (
+        "EXPLAIN the pulse log list query for every combination of the "
+        "filters and orderings the API accepts, and report the plans that "
+        "scan the whole table or sort after reading. Run it against a "
+        "seeded table so the planner sees realistic statistics."
+    )
+
+    def add_arguments(self, parser: Any) -> None:
+        parser.add_argument(
+            "--analyze",
+            action="store_true",
+            help="Refresh the planner statistics (ANALYZE) first.",
+        )
+        parser.add_argument(
+            "--fail-on-seq-scan",
+            action="store_true",
+            help="Exit with an error if a plan filtered on user or team scans the table.",
+        )
+        parser.add_argument("--output", help="Write every plan as JSON to this file.")
+
+    @staticmethod
+    def sample_values() -> Dict[str, Any]:
+        """
+        Filter values taken from one real log so the filters match rows
+        """
+        sample = (
+            PulseLog.objects.filter(team__isnull=False)
+            .order_by("-timestamp")
+            .values("user_id", "team_id", "year", "week_index", "mood", "workload")
+            .first()
+        )
+        if sample is None:
+            raise CommandError("No pulse logs with a team. Run seed_benchmark_data first.")
+        return {
+            "user": str(sample["user_id"]),
+            "team": str(sample["team_id"]),
+            "year": sample["year"],
+            "week_index": sample["week_index"],
+            "mood": sample["mood"],
+            "workload": sample["workload"],
+        }
+
+    @staticmethod
+    def orderings() -> List[str]:
+        fields = PulseLogListCreateView.ordering_fields
+        return [""] + [prefix + field for field in fields for prefix in ("", "-")]
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if options["analyze"]:
+            with connection.cursor() as cursor:
+                cursor.execute(f"ANALYZE {PulseLog._meta.db_table}")
+
+        values = self.sample_values()
+        fields = PulseLogListCreateView.filterset_fields
+        table = PulseLog._meta.db_table
+        results = []
+        for size in range(len(fields) + 1):
+            for filters in combinations(fields, size):
+                for ordering in self.orderings():
+                    params = {field: values[field] for field in filters}
+                    if ordering:
+                        params["ordering"] = ordering
+                    _, page_queryset = pulse_log_list_querysets(params)
+                    plan = explain(page_queryset)
+                    results.append({
+                        "filters": list(filters),
+                        "ordering": ordering or None,
+                        **classify_plan(plan, table, connection.vendor),
+                        "plan": plan,
+                    })
+
+        seq_scans = [result for result in results if result["access"] == "seq_scan"]
+        scoped_seq_scans = [
+            result for result in seq_scans
+            if {"user", "team"} & set(result["filters"])
+        ]
+        sorts = [result for result in results if result["sort"]]
+        for result in results:
+            problems = []
+            if result["access"] == "seq_scan":
+                problems.append("SEQ SCAN")
+            if result["sort"]:
+                problems.append("SORT")
+            if not problems and options["verbosity"] < 2:
+                continue
+            self.stdout.write(
+                "{:<10} {:<45} {:<13} {}".format(
+                    ",".join(problems) or "ok",
+                    "&".join(result["filters"]) or "(none)",
+                    result["ordering"] or "(default)",
+                    result["index"] or "-",
+                )
+            )
+
+        if options["output"]:
+            with open(options["output"], "w") as handle:
+                json.dump({"database": connection.vendor, "plans": results}, handle, indent=2)
+
+        summary = (
+            f"{len(results)} plans: {len(seq_scans)} sequential scans "
+            f"({len(scoped_seq_scans)} filtered on user or team), {len(sorts)} sorts"
+        )
+        if options["fail_on_seq_scan"] and scoped_seq_scans:
+            raise CommandError(summary)
+        self.stdout.write(self.style.SUCCESS(summary))
@@ -0,0 +1,15 @@
+from typing import Any
+from app.exports import BaseExportCommand
+from logs.exports import PULSE_LOG_EXPORT_COLUMNS, pulse_log_export_rows
+from logs.models import PulseLog
+from logs.views import PulseLogListCreateView
+
+
+class Command(BaseExportCommand):
+    help = "Stream all pulse logs to CSV or NDJSON."
+    model = PulseLog
+    filterset_fields = PulseLogListCreateView.filterset_fields
+    export_columns = PULSE_LOG_EXPORT_COLUMNS
+
+    def get_export_rows(self, queryset: Any, chunk_size: int) -> Any:
+        return pulse_log_export_rows(queryset, chunk_size)
@@ -0,0 +1,42 @@
+from typing import Any
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, F, Sum
+from logs.models import PulseLog, TeamWeeklyPulse
+
+
+class Command(BaseCommand):
+    help = "Rebuild the weekly team pulse rollups from the pulse logs."
+
+    def add_arguments(self, parser: Any) -> None:
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of rollup rows inserted per query.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        weeks = (
+            PulseLog.objects.filter(team__isnull=False)
+            .order_by()
+            .values("team_id", "year", "week_index")
+            .annotate(
+                log_count=Count("id"),
+                mood_sum=Sum("mood"),
+                mood_sum_sq=Sum(F("mood") * F("mood")),
+                workload_sum=Sum("workload"),
+                workload_sum_sq=Sum(F("workload") * F("workload")),
+            )
+        )
+        
+        with transaction.atomic():
+            TeamWeeklyPulse.objects.all().delete()
+            rollups = TeamWeeklyPulse.objects.bulk_create(
+                (TeamWeeklyPulse(**week) for week in weeks.iterator()),
+                batch_size=options["batch_size"],
+            )
+        
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt {len(rollups)} weekly team rollups")
+        )
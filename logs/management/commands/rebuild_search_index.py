@@ -0,0 +1,22 @@
+from typing import Any
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS
+from app.search import search_indexes
+
+
+class Command(BaseCommand):
+    help = (
+        "Recreate missing full-text search triggers and recompute the search "
+        "index of feedback messages and pulse log comments. Run it after "
+        "VACUUM on SQLite, which may renumber the rowids the index follows."
+    )
+
+    def add_arguments(self, parser: Any) -> None:
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        for index in search_indexes:
+            if not index.install(options["database"]):
+                index.rebuild(options["database"])
+            self.stdout.write(f"Rebuilt search index for {index.table}.{index.field}")
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {len(search_indexes)} search indexes"))
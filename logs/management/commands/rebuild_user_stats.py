@@ -0,0 +1,45 @@
+from itertools import islice
+from typing import Any
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from logs.models import PulseLog, UserPulseStats
+from logs.rollups import iter_user_stats, weekly_user_totals
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild every user's pulse stats in one streaming pass over the "
+        "logs ordered by (user, year, week_index)."
+    )
+
+    def add_arguments(self, parser: Any) -> None:
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of stats rows inserted per query.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=5000,
+            help="Number of weekly rows fetched per round trip.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        weeks = weekly_user_totals(PulseLog.objects.all()).iterator(
+            chunk_size=options["chunk_size"]
+        )
+        stats = iter_user_stats(weeks)
+        rebuilt = 0
+        
+        with transaction.atomic():
+            UserPulseStats.objects.all().delete()
+            while True:
+                batch = list(islice(stats, options["batch_size"]))
+                if not batch:
+                    break
+                UserPulseStats.objects.bulk_create(batch)
+                rebuilt += len(batch)
+        
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt pulse stats for {rebuilt} users"))
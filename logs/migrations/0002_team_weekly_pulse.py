@@ -0,0 +1,37 @@
+# Generated by Django 5.2.8 on 2026-10-18 07:39
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('logs', '0001_initial'),
+        ('teams', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TeamWeeklyPulse',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('year', models.IntegerField()),
+                ('week_index', models.IntegerField()),
+                ('log_count', models.IntegerField(default=0)),
+                ('mood_sum', models.BigIntegerField(default=0)),
+                ('mood_sum_sq', models.BigIntegerField(default=0)),
+                ('workload_sum', models.BigIntegerField(default=0)),
+                ('workload_sum_sq', models.BigIntegerField(default=0)),
+                ('team', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='weekly_pulses', to='teams.team')),
+            ],
+            options={
+                'db_table': 'team_weekly_pulses',
+                'ordering': ['-year', '-week_index'],
+                'constraints': [models.UniqueConstraint(fields=('team', 'year', 'week_index'), name='unique_team_weekly_pulse')],
+            },
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.8 on 2026-10-18 08:05
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('logs', '0002_team_weekly_pulse'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserPulseStats',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('total_logs', models.IntegerField(default=0)),
+                ('weeks_logged', models.IntegerField(default=0)),
+                ('mood_sum', models.BigIntegerField(default=0)),
+                ('workload_sum', models.BigIntegerField(default=0)),
+                ('current_streak', models.IntegerField(default=0)),
+                ('longest_streak', models.IntegerField(default=0)),
+                ('last_year', models.IntegerField(blank=True, null=True)),
+                ('last_week_index', models.IntegerField(blank=True, null=True)),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='pulse_stats', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name_plural': 'user pulse stats',
+                'db_table': 'user_pulse_stats',
+            },
+        ),
+    ]
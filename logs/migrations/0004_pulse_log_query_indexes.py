@@ -0,0 +1,28 @@
+# Generated by Django 5.2.8 on 2026-10-18 08:13
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('logs', '0003_user_pulse_stats'),
+        ('teams', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='pulselog',
+            index=models.Index(fields=['user', '-timestamp', '-id'], name='pulse_logs_user_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pulselog',
+            index=models.Index(condition=models.Q(('team__isnull', False)), fields=['team', 'year', 'week_index'], name='pulse_logs_team_week_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pulselog',
+            index=models.Index(condition=models.Q(('team__isnull', False)), fields=['team', '-timestamp', '-id'], name='pulse_logs_team_recent_idx'),
+        ),
+    ]
@@ -0,0 +1,108 @@
+from datetime import timezone as dt_timezone
+from django.conf import settings
+from django.db import migrations
+from django.utils import timezone
+
+TABLE = "event_logs"
+
+
+# Month helpers as of this migration, so later changes to logs.partitions
+# can't change what it does
+def month_start(value):
+    value = value.astimezone(dt_timezone.utc)
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(month, count):
+    index = month.year * 12 + month.month - 1 + count
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_name(month):
+    return f"{TABLE}_p{month:%Y_%m}"
+
+
+def index_definitions(cursor):
+    """
+    CREATE INDEX statements for the table's indexes, excluding the primary key.
+    """
+    cursor.execute(
+        "SELECT indexdef FROM pg_indexes WHERE tablename = %s AND indexname NOT IN "
+        "(SELECT conname FROM pg_constraint WHERE conrelid = to_regclass(%s))",
+        [TABLE, TABLE],
+    )
+    return [row[0] for row in cursor.fetchall()]
+
+
+def rename_table(cursor, new_name):
+    cursor.execute(
+        "SELECT conname FROM pg_constraint WHERE conrelid = to_regclass(%s) AND contype = 'p'",
+        [TABLE],
+    )
+    primary_key = cursor.fetchone()[0]
+    cursor.execute(f'ALTER TABLE "{TABLE}" RENAME TO "{new_name}"')
+    cursor.execute(f'ALTER TABLE "{new_name}" RENAME CONSTRAINT "{primary_key}" TO "{new_name}_pkey"')
+
+
+def partition_event_logs(apps, schema_editor):
+    """
+    Rebuild event_logs as a table partitioned by month on "timestamp",
+    with a default partition for rows outside the monthly ones. The
+    primary key has to include the partition key, so it becomes
+    (id, timestamp).
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        indexes = index_definitions(cursor)
+        cursor.execute(f'SELECT min("timestamp") FROM "{TABLE}"')
+        oldest = cursor.fetchone()[0]
+
+        rename_table(cursor, f"{TABLE}_unpartitioned")
+        cursor.execute(
+            f'CREATE TABLE "{TABLE}" (LIKE "{TABLE}_unpartitioned" INCLUDING DEFAULTS) '
+            'PARTITION BY RANGE ("timestamp")'
+        )
+        cursor.execute(f'ALTER TABLE "{TABLE}" ADD PRIMARY KEY ("id", "timestamp")')
+        cursor.execute(f'CREATE TABLE "{TABLE}_default" PARTITION OF "{TABLE}" DEFAULT')
+
+        current = month_start(timezone.now())
+        month = month_start(oldest) if oldest else current
+        last = add_months(current, settings.EVENT_LOG_PARTITIONS_AHEAD)
+        while month <= last:
+            cursor.execute(
+                f'CREATE TABLE "{partition_name(month)}" PARTITION OF "{TABLE}" '
+                "FOR VALUES FROM (%s) TO (%s)",
+                [month, add_months(month, 1)],
+            )
+            month = add_months(month, 1)
+
+        cursor.execute(f'INSERT INTO "{TABLE}" SELECT * FROM "{TABLE}_unpartitioned"')
+        cursor.execute(f'DROP TABLE "{TABLE}_unpartitioned"')
+        for definition in indexes:
+            cursor.execute(definition)
+
+
+def unpartition_event_logs(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        indexes = index_definitions(cursor)
+        rename_table(cursor, f"{TABLE}_partitioned")
+        cursor.execute(f'CREATE TABLE "{TABLE}" (LIKE "{TABLE}_partitioned" INCLUDING DEFAULTS)')
+        cursor.execute(f'ALTER TABLE "{TABLE}" ADD PRIMARY KEY ("id")')
+        cursor.execute(f'INSERT INTO "{TABLE}" SELECT * FROM "{TABLE}_partitioned"')
+        cursor.execute(f'DROP TABLE "{TABLE}_partitioned"')
+        for definition in indexes:
+            cursor.execute(definition)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('logs', '0004_pulse_log_query_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_event_logs, unpartition_event_logs),
+    ]
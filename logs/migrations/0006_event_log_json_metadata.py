@@ -0,0 +1,76 @@
+import json
+from django.db import migrations, models
+
+BATCH_SIZE = 2000
+
+
+def parse_metadata(text):
+    """
+    JSON held in the old text column, or the text itself as a JSON string
+    when it isn't valid JSON. Blank values become null.
+    """
+    if text is None or not text.strip():
+        return None
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+def convert_batches(EventLog, source, target, convert):
+    """
+    Walk the table in primary key order, converting BATCH_SIZE rows per
+    round trip so memory stays flat however many events there are.
+    """
+    last_pk = None
+    while True:
+        queryset = EventLog.objects.order_by("pk").only("pk", source)
+        if last_pk is not None:
+            queryset = queryset.filter(pk__gt=last_pk)
+        events = list(queryset[:BATCH_SIZE])
+        if not events:
+            return
+        for event in events:
+            setattr(event, target, convert(getattr(event, source)))
+        EventLog.objects.bulk_update(events, [target], batch_size=BATCH_SIZE)
+        last_pk = events[-1].pk
+
+
+def text_to_json(apps, schema_editor):
+    EventLog = apps.get_model("logs", "EventLog")
+    convert_batches(EventLog, "metadata", "metadata_json", parse_metadata)
+
+
+def json_to_text(apps, schema_editor):
+    EventLog = apps.get_model("logs", "EventLog")
+    convert_batches(
+        EventLog,
+        "metadata_json",
+        "metadata",
+        lambda value: None if value is None else json.dumps(value),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('logs', '0005_partition_event_logs'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='eventlog',
+            name='metadata_json',
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.RunPython(text_to_json, json_to_text),
+        migrations.RemoveField(
+            model_name='eventlog',
+            name='metadata',
+        ),
+        migrations.RenameField(
+            model_name='eventlog',
+            old_name='metadata_json',
+            new_name='metadata',
+        ),
+    ]
@@ -0,0 +1,34 @@
+from django.db import migrations
+
+INDEX_NAME = "event_logs_metadata_gin"
+
+
+def create_gin_index(apps, schema_editor):
+    """
+    GIN index for metadata containment lookups (PostgreSQL only). On the
+    partitioned table it is created on every partition, including those
+    attached later.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        f'CREATE INDEX IF NOT EXISTS "{INDEX_NAME}" ON "event_logs" '
+        'USING gin ("metadata" jsonb_path_ops)'
+    )
+
+
+def drop_gin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(f'DROP INDEX IF EXISTS "{INDEX_NAME}"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('logs', '0006_event_log_json_metadata'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_gin_index, drop_gin_index),
+    ]
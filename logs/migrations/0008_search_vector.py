@@ -0,0 +1,19 @@
+# Generated by Django 5.2.8 on 2026-10-18 08:20
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('logs', '0007_event_log_metadata_gin'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pulselog',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+    ]
@@ -1,6 +1,7 @@
 import uuid
-from datetime import datetime
+from datetime import date, datetime
 from django.conf import settings
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from app.abstracts import TimeStampedModel
 
@@ -31,6 +32,8 @@ class PulseLog(TimeStampedModel):
     timestamp_local = models.DateTimeField(null=True, blank=True)
     year = models.IntegerField()
     week_index = models.IntegerField()
+    # Maintained by a database trigger on PostgreSQL (see logs/search.py)
+    search_vector = SearchVectorField(null=True, editable=False)
     
     class Meta:
         db_table = "pulse_logs"
@@ -38,20 +41,191 @@ class PulseLog(TimeStampedModel):
         indexes = [
             models.Index(fields=["-timestamp"]),
             models.Index(fields=["user", "year", "week_index"]),
+            # Keyset pages order by (timestamp, id), so the recent-first
+            # indexes carry id as well and pages are read without a sort.
+            models.Index(fields=["user", "-timestamp", "-id"], name="pulse_logs_user_recent_idx"),
+            # Logs without a team never match a team filter.
+            models.Index(
+                fields=["team", "year", "week_index"],
+                name="pulse_logs_team_week_idx",
+                condition=models.Q(team__isnull=False),
+            ),
+            models.Index(
+                fields=["team", "-timestamp", "-id"],
+                name="pulse_logs_team_recent_idx",
+                condition=models.Q(team__isnull=False),
+            ),
         ]
     
+    # Fields the rollup and stats snapshots read
+    snapshot_fields = {"user_id", "team_id", "year", "week_index", "mood", "workload"}
+    
+    @classmethod
+    def from_db(cls, db, field_names, values):  # type: ignore[no-untyped-def]
+        instance = super().from_db(db, field_names, values)
+        # Deferred fields would be loaded one query per row; such logs
+        # take their snapshot when saved instead (see logs.signals)
+        if not cls.snapshot_fields & instance.get_deferred_fields():
+            instance.take_snapshots()
+        return instance
+    
+    def take_snapshots(self) -> None:
+        self._rollup_snapshot = self.rollup_values()
+        self._stats_snapshot = self.stats_values()
+    
+    def rollup_values(self):  # type: ignore[no-untyped-def]
+        """
+        The (team, year, week_index, mood, workload) tuple this log
+        contributes to the weekly rollups, or None if it has no team.
+        """
+        if not self.team_id:
+            return None
+        return (self.team_id, self.year, self.week_index, self.mood, self.workload)
+    
+    def stats_values(self):  # type: ignore[no-untyped-def]
+        """
+        The (user, year, week_index, mood, workload) tuple this log
+        contributes to the user's pulse stats.
+        """
+        return (self.user_id, self.year, self.week_index, self.mood, self.workload)
+    
+    @staticmethod
+    def current_week():  # type: ignore[no-untyped-def]
+        """
+        The ISO (year, week_index) pair assigned to logs that don't set
+        one. The year is the ISO year, which differs from the calendar year
+        for the days around New Year that fall in week 1 or week 52/53.
+        """
+        year, week_index, _ = datetime.now().isocalendar()
+        return year, week_index
+    
     def save(self, *args, **kwargs):  # type: ignore[no-untyped-def]
         if not self.year or not self.week_index:
-            now = datetime.now()
-            self.year = now.year
-            self.week_index = now.isocalendar()[1]
+            self.year, self.week_index = self.current_week()
         super().save(*args, **kwargs)
     
     def __str__(self) -> str:
         return f"{self.user.username} - Week {self.week_index}, {self.year}"
 
 
+class TeamWeeklyPulse(TimeStampedModel):
+    """
+    Running totals of pulse logs per team and ISO week.
+    Kept up to date incrementally from PulseLog writes so weekly means and
+    standard deviations can be read without scanning the logs.
+    """
+    id = models.UUIDField(
+        primary_key=True,
+        default=uuid.uuid4,
+        editable=False,
+        unique=True,
+    )
+    team = models.ForeignKey(
+        "teams.Team",
+        on_delete=models.CASCADE,
+        related_name="weekly_pulses",
+    )
+    year = models.IntegerField()
+    week_index = models.IntegerField()
+    log_count = models.IntegerField(default=0)
+    mood_sum = models.BigIntegerField(default=0)
+    mood_sum_sq = models.BigIntegerField(default=0)
+    workload_sum = models.BigIntegerField(default=0)
+    workload_sum_sq = models.BigIntegerField(default=0)
+    
+    class Meta:
+        db_table = "team_weekly_pulses"
+        ordering = ["-year", "-week_index"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["team", "year", "week_index"],
+                name="unique_team_weekly_pulse",
+            ),
+        ]
+    
+    def __str__(self) -> str:
+        return f"{self.team} - Week {self.week_index}, {self.year}"
+
+
+def next_week(year: int, week_index: int):  # type: ignore[no-untyped-def]
+    """
+    The ISO (year, week_index) pair following the given ISO week. `year`
+    must be the ISO year: 28 December always falls in its last week, which
+    is 52 or 53.
+    """
+    if week_index < date(year, 12, 28).isocalendar()[1]:
+        return year, week_index + 1
+    return year + 1, 1
+
+
+class UserPulseStats(TimeStampedModel):
+    """
+    Per-user check-in streaks and running totals.
+    Extended incrementally as logs are written in week order; backfills,
+    edits that move a log and deletes rebuild the user's row.
+    """
+    id = models.UUIDField(
+        primary_key=True,
+        default=uuid.uuid4,
+        editable=False,
+        unique=True,
+    )
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="pulse_stats",
+    )
+    total_logs = models.IntegerField(default=0)
+    weeks_logged = models.IntegerField(default=0)
+    mood_sum = models.BigIntegerField(default=0)
+    workload_sum = models.BigIntegerField(default=0)
+    current_streak = models.IntegerField(default=0)
+    longest_streak = models.IntegerField(default=0)
+    last_year = models.IntegerField(null=True, blank=True)
+    last_week_index = models.IntegerField(null=True, blank=True)
+    
+    class Meta:
+        db_table = "user_pulse_stats"
+        verbose_name_plural = "user pulse stats"
+    
+    def __str__(self) -> str:
+        return f"{self.user} - {self.current_streak} week streak"
+    
+    @property
+    def last_week(self):  # type: ignore[no-untyped-def]
+        if self.last_year is None:
+            return None
+        return self.last_year, self.last_week_index
+    
+    def add_week(self, year: int, week_index: int, log_count: int, mood_sum: int, workload_sum: int) -> bool:
+        """
+        Fold one week of logs into the stats. Returns False, leaving the
+        row untouched, if the week precedes the last logged week.
+        """
+        last = self.last_week
+        week = (year, week_index)
+        if last is not None and week < last:
+            return False
+        if week != last:
+            if last is not None and week == next_week(*last):
+                self.current_streak += 1
+            else:
+                self.current_streak = 1
+            self.weeks_logged += 1
+            self.longest_streak = max(self.longest_streak, self.current_streak)
+            self.last_year, self.last_week_index = week
+        self.total_logs += log_count
+        self.mood_sum += mood_sum
+        self.workload_sum += workload_sum
+        return True
+
+
 class EventLog(TimeStampedModel):
+    """
+    Append-only application events. On PostgreSQL the table is partitioned
+    by month on `timestamp` (see logs/partitions.py), so its primary key in
+    the database is (id, timestamp).
+    """
     id = models.UUIDField(
         primary_key=True,
         default=uuid.uuid4,
@@ -60,7 +234,7 @@ class EventLog(TimeStampedModel):
     )
     timestamp = models.DateTimeField(auto_now_add=True)
     event_name = models.CharField(max_length=255)
-    metadata = models.TextField(blank=True, null=True)
+    metadata = models.JSONField(blank=True, null=True)
     
     class Meta:
         db_table = "event_logs"
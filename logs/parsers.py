@@ -0,0 +1,25 @@
+import json
+from typing import Any
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+
+class NDJSONParser(BaseParser):
+    """
+    Parses newline-delimited JSON into a list, one item per non-empty line.
+    """
+    media_type = "application/x-ndjson"
+    
+    def parse(self, stream, media_type=None, parser_context=None):  # type: ignore[no-untyped-def]
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", "utf-8")
+        items: list[Any] = []
+        for line_number, line in enumerate(stream, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                items.append(json.loads(line.decode(encoding)))
+            except ValueError as exc:
+                raise ParseError(f"NDJSON parse error on line {line_number} - {exc}")
+        return items
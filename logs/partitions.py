@@ -0,0 +1,220 @@
+import gzip
+import os
+import re
+from datetime import datetime, timedelta, timezone as dt_timezone
+from typing import List, Optional, Tuple
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+from app.exports import export_lines
+from logs.exports import EVENT_LOG_EXPORT_COLUMNS, event_log_export_rows
+from logs.models import EventLog
+
+EVENT_LOG_TABLE = EventLog._meta.db_table
+DEFAULT_PARTITION = f"{EVENT_LOG_TABLE}_default"
+PARTITION_NAME = re.compile(rf"^{EVENT_LOG_TABLE}_p(\d{{4}})_(\d{{2}})$")
+
+
+def month_start(value: datetime) -> datetime:
+    """
+    Midnight UTC on the first day of the month containing `value`.
+    """
+    value = value.astimezone(dt_timezone.utc)
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(month: datetime, count: int) -> datetime:
+    index = month.year * 12 + month.month - 1 + count
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def month_range(month: datetime) -> Tuple[datetime, datetime]:
+    return month, add_months(month, 1)
+
+
+def partition_name(month: datetime) -> str:
+    return f"{EVENT_LOG_TABLE}_p{month:%Y_%m}"
+
+
+def is_partitioned() -> bool:
+    """
+    Whether the event log is a partitioned PostgreSQL table. Other
+    databases keep one table and prune by its timestamp index.
+    """
+    if connection.vendor != "postgresql":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s))",
+            [EVENT_LOG_TABLE],
+        )
+        return cursor.fetchone()[0]
+
+
+def partition_months() -> List[datetime]:
+    """
+    Months the event log holds: one per monthly partition on PostgreSQL,
+    otherwise every month from the oldest event to now.
+    """
+    if is_partitioned():
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = to_regclass(%s)",
+                [EVENT_LOG_TABLE],
+            )
+            names = [row[0] for row in cursor.fetchall()]
+        months = []
+        for name in names:
+            match = PARTITION_NAME.match(name)
+            if match:
+                months.append(
+                    datetime(int(match.group(1)), int(match.group(2)), 1, tzinfo=dt_timezone.utc)
+                )
+        return sorted(months)
+
+    oldest = EventLog.objects.order_by("timestamp").values_list("timestamp", flat=True).first()
+    if oldest is None:
+        return []
+    months = [month_start(oldest)]
+    current = month_start(timezone.now())
+    while months[-1] < current:
+        months.append(add_months(months[-1], 1))
+    return months
+
+
+def default_partition_months() -> List[datetime]:
+    """
+    Months with rows in the default partition, which catches events outside
+    the monthly partitions (PostgreSQL only).
+    """
+    if not is_partitioned():
+        return []
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT DISTINCT date_trunc('month', \"timestamp\" AT TIME ZONE 'UTC') "
+            f'FROM "{DEFAULT_PARTITION}"'
+        )
+        return sorted(row[0].replace(tzinfo=dt_timezone.utc) for row in cursor.fetchall())
+
+
+def create_partition(month: datetime) -> None:
+    """
+    Attach the partition for `month`, moving any of its rows that landed in
+    the default partition first (PostgreSQL only).
+    """
+    start, end = month_range(month)
+    name = partition_name(month)
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            f'CREATE TABLE "{name}" (LIKE "{EVENT_LOG_TABLE}" INCLUDING DEFAULTS INCLUDING CONSTRAINTS)'
+        )
+        cursor.execute(
+            f'INSERT INTO "{name}" SELECT * FROM "{DEFAULT_PARTITION}" '
+            'WHERE "timestamp" >= %s AND "timestamp" < %s',
+            [start, end],
+        )
+        cursor.execute(
+            f'DELETE FROM "{DEFAULT_PARTITION}" WHERE "timestamp" >= %s AND "timestamp" < %s',
+            [start, end],
+        )
+        cursor.execute(
+            f'ALTER TABLE "{EVENT_LOG_TABLE}" ATTACH PARTITION "{name}" '
+            "FOR VALUES FROM (%s) TO (%s)",
+            [start, end],
+        )
+
+
+def ensure_partitions(ahead: Optional[int] = None) -> List[datetime]:
+    """
+    Create the partitions for this month and the next `ahead` months so
+    inserts never fall through to the default partition. Returns the
+    months created; a no-op without partitioning.
+    """
+    if not is_partitioned():
+        return []
+    if ahead is None:
+        ahead = settings.EVENT_LOG_PARTITIONS_AHEAD
+    existing = set(partition_months())
+    current = month_start(timezone.now())
+    created = []
+    for offset in range(ahead + 1):
+        month = add_months(current, offset)
+        if month not in existing:
+            create_partition(month)
+            created.append(month)
+    return created
+
+
+def expired_months(retention_months: int, now: Optional[datetime] = None) -> List[datetime]:
+    """
+    Months that ended more than `retention_months` months before `now`,
+    including those whose rows only sit in the default partition.
+    """
+    cutoff = add_months(month_start(now or timezone.now()), -retention_months)
+    months = set(partition_months()) | set(default_partition_months())
+    return sorted(month for month in months if month < cutoff)
+
+
+def month_events(month: datetime):  # type: ignore[no-untyped-def]
+    start, end = month_range(month)
+    return EventLog.objects.filter(timestamp__gte=start, timestamp__lt=end)
+
+
+def archive_month(month: datetime, directory: str, chunk_size: int) -> Tuple[Optional[str], int]:
+    """
+    Write a month of events to `<directory>/event_logs-YYYY-MM.ndjson.gz`.
+    The file is written under a temporary name and renamed once complete,
+    so a half-written archive is never mistaken for a finished one.
+    Returns the path (None for an empty month) and the row count.
+    """
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{EVENT_LOG_TABLE}-{month:%Y-%m}.ndjson.gz")
+    partial = f"{path}.partial"
+    count = 0
+    rows = event_log_export_rows(month_events(month).order_by("timestamp", "id"), chunk_size)
+    with gzip.open(partial, "wt", encoding="utf-8") as output:
+        for line in export_lines(EVENT_LOG_EXPORT_COLUMNS, rows, "ndjson"):
+            output.write(line)
+            count += 1
+    if not count:
+        os.remove(partial)
+        return None, 0
+    os.replace(partial, path)
+    return path, count
+
+
+def drop_month(month: datetime, batch_size: int) -> None:
+    """
+    Remove a month of events: detach and drop its partition on PostgreSQL,
+    otherwise delete the month in primary key batches so no statement
+    holds the write lock for long.
+    """
+    if is_partitioned():
+        start, end = month_range(month)
+        name = partition_name(month)
+        with transaction.atomic(), connection.cursor() as cursor:
+            if month in partition_months():
+                cursor.execute(f'ALTER TABLE "{EVENT_LOG_TABLE}" DETACH PARTITION "{name}"')
+                cursor.execute(f'DROP TABLE "{name}"')
+            cursor.execute(
+                f'DELETE FROM "{DEFAULT_PARTITION}" WHERE "timestamp" >= %s AND "timestamp" < %s',
+                [start, end],
+            )
+        return
+
+    events = month_events(month)
+    while True:
+        ids = list(events.order_by().values_list("pk", flat=True)[:batch_size])
+        if not ids:
+            return
+        EventLog.objects.filter(pk__in=ids).delete()
+
+
+def recent_window_start(days: Optional[int] = None) -> datetime:
+    """
+    Start of the window event log lists read by default.
+    """
+    if days is None:
+        days = settings.EVENT_LOG_LIST_WINDOW_DAYS
+    return timezone.now() - timedelta(days=days)
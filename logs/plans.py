@@ -0,0 +1,27 @@
+from typing import Any, Dict, Optional, Tuple
+from django.contrib.auth import get_user_model
+from django.http import HttpRequest, QueryDict
+from rest_framework.request import Request
+from logs.views import PulseLogListCreateView
+
+User = get_user_model()
+
+
+def pulse_log_list_querysets(params: Dict[str, Any], user: Optional[Any] = None) -> Tuple[Any, Any]:
+    """
+    The filtered queryset (counted for the total) and the page query
+    PulseLogListCreateView runs for the given query parameters, built with
+    the view's own filter backends and keyset paginator. Defaults to an
+    admin, whose logs are not scoped to their user.
+    """
+    http_request = HttpRequest()
+    http_request.method = "GET"
+    http_request.GET = QueryDict(mutable=True)
+    for name, value in params.items():
+        http_request.GET[name] = str(value)
+    request = Request(http_request)
+    request.user = user if user is not None else User(is_staff=True)
+    view = PulseLogListCreateView(request=request, format_kwarg=None, args=(), kwargs={})
+    queryset = view.filter_queryset(view.get_queryset())
+    page_queryset, _, _ = view.paginator.prepare(queryset, request, view)
+    return queryset, page_queryset
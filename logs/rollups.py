@@ -0,0 +1,124 @@
+from collections import defaultdict
+from typing import Any, Iterable, Iterator, Optional, Tuple
+from django.db import transaction
+from django.db.models import Count, F, Sum
+from logs.models import PulseLog, TeamWeeklyPulse, UserPulseStats
+
+RollupValues = Tuple[Any, int, int, int, int]
+
+
+def apply_pulse_rollups(
+    entries: Iterable[Optional[RollupValues]], sign: int = 1
+) -> None:
+    """
+    Add (sign=1) or remove (sign=-1) pulse log contributions to the weekly
+    team rollups. Entries are grouped by (team, year, week_index) so each
+    affected week costs one UPDATE however many logs it covers.
+    """
+    deltas: dict = defaultdict(lambda: [0, 0, 0, 0, 0])
+    for entry in entries:
+        if entry is None:
+            continue
+        team_id, year, week_index, mood, workload = entry
+        delta = deltas[(team_id, year, week_index)]
+        delta[0] += sign
+        delta[1] += sign * mood
+        delta[2] += sign * mood * mood
+        delta[3] += sign * workload
+        delta[4] += sign * workload * workload
+    
+    with transaction.atomic():
+        for (team_id, year, week_index), delta in deltas.items():
+            rollup, _ = TeamWeeklyPulse.objects.get_or_create(
+                team_id=team_id, year=year, week_index=week_index
+            )
+            TeamWeeklyPulse.objects.filter(pk=rollup.pk).update(
+                log_count=F("log_count") + delta[0],
+                mood_sum=F("mood_sum") + delta[1],
+                mood_sum_sq=F("mood_sum_sq") + delta[2],
+                workload_sum=F("workload_sum") + delta[3],
+                workload_sum_sq=F("workload_sum_sq") + delta[4],
+            )
+            if sign < 0:
+                TeamWeeklyPulse.objects.filter(
+                    pk=rollup.pk, log_count__lte=0
+                ).delete()
+
+
+def apply_user_stats(entries: Iterable[Optional[RollupValues]]) -> None:
+    """
+    Extend users' pulse stats with newly created logs, given as
+    (user, year, week_index, mood, workload) tuples. Users whose new logs
+    precede their last logged week are rebuilt instead.
+    """
+    weeks: dict = defaultdict(lambda: [0, 0, 0])
+    for entry in entries:
+        if entry is None:
+            continue
+        user_id, year, week_index, mood, workload = entry
+        week = weeks[(user_id, year, week_index)]
+        week[0] += 1
+        week[1] += mood
+        week[2] += workload
+    
+    by_user: dict = defaultdict(list)
+    for (user_id, year, week_index), totals in sorted(weeks.items(), key=lambda item: item[0][1:]):
+        by_user[user_id].append((year, week_index, *totals))
+    
+    stale = []
+    with transaction.atomic():
+        for user_id, user_weeks in by_user.items():
+            stats, _ = UserPulseStats.objects.select_for_update().get_or_create(
+                user_id=user_id
+            )
+            if stats.last_week is not None and user_weeks[0][:2] < stats.last_week:
+                stale.append(user_id)
+                continue
+            for week in user_weeks:
+                stats.add_week(*week)
+            stats.save()
+    if stale:
+        rebuild_user_stats(stale)
+
+
+def iter_user_stats(weeks: Iterable[Tuple[Any, int, int, int, int, int]]) -> Iterator[UserPulseStats]:
+    """
+    Fold (user, year, week_index, log_count, mood_sum, workload_sum) rows,
+    ordered by (user, year, week_index), into one UserPulseStats per user.
+    """
+    stats = None
+    for user_id, year, week_index, log_count, mood_sum, workload_sum in weeks:
+        if stats is None or stats.user_id != user_id:
+            if stats is not None:
+                yield stats
+            stats = UserPulseStats(user_id=user_id)
+        stats.add_week(year, week_index, log_count, mood_sum, workload_sum)
+    if stats is not None:
+        yield stats
+
+
+def weekly_user_totals(queryset: Any) -> Any:
+    """
+    Per (user, year, week_index) log counts and sums, in streak order.
+    """
+    return (
+        queryset.order_by("user_id", "year", "week_index")
+        .values("user_id", "year", "week_index")
+        .annotate(
+            log_count=Count("id"),
+            mood_sum=Sum("mood"),
+            workload_sum=Sum("workload"),
+        )
+        .values_list("user_id", "year", "week_index", "log_count", "mood_sum", "workload_sum")
+    )
+
+
+def rebuild_user_stats(user_ids: Iterable[Any]) -> None:
+    """
+    Recompute the stats of the given users from their logs.
+    """
+    user_ids = list(user_ids)
+    weeks = weekly_user_totals(PulseLog.objects.filter(user_id__in=user_ids))
+    with transaction.atomic():
+        UserPulseStats.objects.filter(user_id__in=user_ids).delete()
+        UserPulseStats.objects.bulk_create(iter_user_stats(weeks))
@@ -0,0 +1,4 @@
+from app.search import register_search_index
+from logs.models import PulseLog
+
+pulse_log_search = register_search_index(PulseLog, "comment")
@@ -1,6 +1,10 @@
-from typing import Any
+import json
+import math
+from typing import Any, Optional
+from django.db import transaction
 from rest_framework import serializers
-from logs.models import PulseLog, EventLog
+from logs.models import PulseLog, EventLog, TeamWeeklyPulse, UserPulseStats, next_week
+from logs.signals import pulse_logs_bulk_created
 from teams.models import Team
 
 class PulseLogSerializer(serializers.ModelSerializer):
@@ -50,13 +54,198 @@ class PulseLogSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
+class PulseLogBulkItemSerializer(serializers.Serializer):
+    """
+    Validates a single entry of a bulk pulse log upload
+    """
+    mood = serializers.IntegerField()
+    workload = serializers.IntegerField()
+    comment = serializers.CharField(allow_blank=True, required=False)
+    team = serializers.UUIDField(required=False, allow_null=True)
+    timestamp_local = serializers.DateTimeField(required=False, allow_null=True)
+    year = serializers.IntegerField(required=False)
+    week_index = serializers.IntegerField(required=False)
+
+
+class PulseLogBulkSerializer(serializers.ListSerializer):
+    """
+    Validates a list of pulse logs item by item so that one bad entry
+    doesn't reject the whole batch, then inserts the valid entries with
+    bulk_create inside a single transaction. bulk_create skips post_save,
+    so receivers of pulse_logs_bulk_created keep rollups, stats and text
+    analysis up to date instead.
+    """
+    child = PulseLogBulkItemSerializer()
+    
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.item_errors: list = []
+    
+    def to_internal_value(self, data: Any) -> Any:
+        if not isinstance(data, list):
+            raise serializers.ValidationError(
+                {"non_field_errors": ["Expected a list of pulse logs"]}
+            )
+        if not data:
+            raise serializers.ValidationError(
+                {"non_field_errors": ["At least one pulse log is required"]}
+            )
+        if self.max_length and len(data) > self.max_length:
+            raise serializers.ValidationError(
+                {"non_field_errors": [f"At most {self.max_length} pulse logs per request"]}
+            )
+        
+        valid = []
+        for index, item in enumerate(data):
+            child = PulseLogBulkItemSerializer(data=item)
+            if child.is_valid():
+                valid.append((index, child.validated_data))
+            else:
+                self.item_errors.append({"index": index, "errors": child.errors})
+        
+        team_ids = {attrs["team"] for _, attrs in valid if attrs.get("team")}
+        teams = Team.objects.in_bulk(team_ids) if team_ids else {}
+        
+        resolved = []
+        for index, attrs in valid:
+            team_id = attrs.pop("team", None)
+            if team_id and team_id not in teams:
+                self.item_errors.append(
+                    {"index": index, "errors": {"team": ["Team not found"]}}
+                )
+                continue
+            attrs["team"] = teams.get(team_id) if team_id else None
+            resolved.append(attrs)
+        
+        self.item_errors.sort(key=lambda error: error["index"])
+        return resolved
+    
+    def create(self, validated_data: Any) -> Any:
+        user = self.context["request"].user
+        batch_size = self.context.get("batch_size")
+        year, week_index = PulseLog.current_week()
+        
+        logs = []
+        for attrs in validated_data:
+            log = PulseLog(user=user, **attrs)
+            if not log.year or not log.week_index:
+                log.year, log.week_index = year, week_index
+            logs.append(log)
+        
+        with transaction.atomic():
+            PulseLog.objects.bulk_create(logs, batch_size=batch_size)
+            pulse_logs_bulk_created.send(sender=PulseLog, instances=logs)
+        return logs
+
+
 class EventLogSerializer(serializers.ModelSerializer):
     id = serializers.CharField(read_only=True)
     event_name = serializers.CharField(max_length=255)
-    metadata = serializers.CharField(allow_blank=True, required=False)
+    metadata = serializers.JSONField(allow_null=True, required=False)
     
     class Meta:
         model = EventLog
         fields = ("id", "timestamp", "event_name", "metadata", "created_at")
         read_only_fields = ("id", "timestamp", "created_at")
-        
\ No newline at end of file
+    
+    def validate_metadata(self, value):  # type: ignore[no-untyped-def]
+        """
+        Clients written against the old text field send JSON encoded as a
+        string; store the decoded value so its keys can be filtered on.
+        """
+        if isinstance(value, str):
+            try:
+                return json.loads(value) if value.strip() else None
+            except ValueError:
+                return value
+        return value
+
+
+class TeamWeeklyPulseSerializer(serializers.ModelSerializer):
+    team_id = serializers.UUIDField(read_only=True)
+    team_name = serializers.CharField(source="team.team_name", read_only=True)
+    mood_mean = serializers.SerializerMethodField()
+    mood_stddev = serializers.SerializerMethodField()
+    workload_mean = serializers.SerializerMethodField()
+    workload_stddev = serializers.SerializerMethodField()
+    
+    class Meta:
+        model = TeamWeeklyPulse
+        fields = (
+            "team_id",
+            "team_name",
+            "year",
+            "week_index",
+            "log_count",
+            "mood_mean",
+            "mood_stddev",
+            "workload_mean",
+            "workload_stddev",
+        )
+        read_only_fields = fields
+    
+    @staticmethod
+    def _mean(total: int, count: int) -> Optional[float]:
+        if not count:
+            return None
+        return total / count
+    
+    @staticmethod
+    def _stddev(total: int, total_sq: int, count: int) -> Optional[float]:
+        """
+        Population standard deviation from the running sums.
+        """
+        if not count:
+            return None
+        mean = total / count
+        return math.sqrt(max(total_sq / count - mean * mean, 0.0))
+    
+    def get_mood_mean(self, obj: Any) -> Optional[float]:
+        return self._mean(obj.mood_sum, obj.log_count)
+    
+    def get_mood_stddev(self, obj: Any) -> Optional[float]:
+        return self._stddev(obj.mood_sum, obj.mood_sum_sq, obj.log_count)
+    
+    def get_workload_mean(self, obj: Any) -> Optional[float]:
+        return self._mean(obj.workload_sum, obj.log_count)
+    
+    def get_workload_stddev(self, obj: Any) -> Optional[float]:
+        return self._stddev(obj.workload_sum, obj.workload_sum_sq, obj.log_count)
+
+
+class UserPulseStatsSerializer(serializers.ModelSerializer):
+    current_streak = serializers.SerializerMethodField()
+    mood_mean = serializers.SerializerMethodField()
+    workload_mean = serializers.SerializerMethodField()
+    
+    class Meta:
+        model = UserPulseStats
+        fields = (
+            "current_streak",
+            "longest_streak",
+            "last_year",
+            "last_week_index",
+            "total_logs",
+            "weeks_logged",
+            "mood_mean",
+            "workload_mean",
+        )
+        read_only_fields = fields
+    
+    def get_current_streak(self, obj: Any) -> int:
+        """
+        The streak only counts while the last logged week is this week or
+        the one before it.
+        """
+        if obj.last_week is None:
+            return 0
+        this_week = PulseLog.current_week()
+        if obj.last_week == this_week or next_week(*obj.last_week) == this_week:
+            return obj.current_streak
+        return 0
+    
+    def get_mood_mean(self, obj: Any) -> Optional[float]:
+        return TeamWeeklyPulseSerializer._mean(obj.mood_sum, obj.total_logs)
+    
+    def get_workload_mean(self, obj: Any) -> Optional[float]:
+        return TeamWeeklyPulseSerializer._mean(obj.workload_sum, obj.total_logs)
@@ -0,0 +1,116 @@
+import threading
+import weakref
+from typing import Any, List, Set
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import Signal, receiver
+from logs.models import PulseLog
+from logs.rollups import apply_pulse_rollups, apply_user_stats
+from logs.tasks import rebuild_user_stats_task
+
+# Sent with `instances` after PulseLog.objects.bulk_create, which skips
+# post_save, inside the creating transaction
+pulse_logs_bulk_created = Signal()
+
+
+@receiver(pre_save, sender=PulseLog)
+def snapshot_deferred_log(sender: Any, instance: PulseLog, **kwargs: Any) -> None:
+    """
+    A log loaded with snapshot fields deferred reads them from its stored
+    row before the row is overwritten.
+    """
+    if instance._state.adding or hasattr(instance, "_rollup_snapshot"):
+        return
+    stored = PulseLog.objects.filter(pk=instance.pk).only(*PulseLog.snapshot_fields).first()
+    if stored is not None:
+        instance._rollup_snapshot = stored._rollup_snapshot
+        instance._stats_snapshot = stored._stats_snapshot
+
+
+@receiver(post_save, sender=PulseLog)
+def update_rollups_on_save(sender: Any, instance: PulseLog, **kwargs: Any) -> None:
+    previous = getattr(instance, "_rollup_snapshot", None)
+    current = instance.rollup_values()
+    if previous != current:
+        apply_pulse_rollups([previous], sign=-1)
+        apply_pulse_rollups([current])
+    instance._rollup_snapshot = current
+
+
+@receiver(pulse_logs_bulk_created, sender=PulseLog)
+def update_rollups_on_bulk_create(sender: Any, instances: List[PulseLog], **kwargs: Any) -> None:
+    apply_pulse_rollups(instance.rollup_values() for instance in instances)
+    for instance in instances:
+        instance._rollup_snapshot = instance.rollup_values()
+
+
+@receiver(post_delete, sender=PulseLog)
+def update_rollups_on_delete(sender: Any, instance: PulseLog, **kwargs: Any) -> None:
+    previous = getattr(instance, "_rollup_snapshot", instance.rollup_values())
+    apply_pulse_rollups([previous], sign=-1)
+    instance._rollup_snapshot = None
+
+
+@receiver(post_save, sender=PulseLog)
+def update_user_stats_on_save(
+    sender: Any, instance: PulseLog, created: bool, **kwargs: Any
+) -> None:
+    previous = getattr(instance, "_stats_snapshot", None)
+    current = instance.stats_values()
+    if created:
+        apply_user_stats([current])
+    elif previous != current:
+        affected = {current[0]} | ({previous[0]} if previous else set())
+        rebuild_user_stats_task.delay(sorted(str(user_id) for user_id in affected))
+    instance._stats_snapshot = current
+
+
+@receiver(pulse_logs_bulk_created, sender=PulseLog)
+def update_user_stats_on_bulk_create(sender: Any, instances: List[PulseLog], **kwargs: Any) -> None:
+    apply_user_stats(instance.stats_values() for instance in instances)
+    for instance in instances:
+        instance._stats_snapshot = instance.stats_values()
+
+
+# Per thread: database alias -> weak reference to the UserStatsRebuild
+# registered for that connection's current transaction
+_pending_rebuilds = threading.local()
+
+
+class UserStatsRebuild:
+    """
+    on_commit callback queueing one stats rebuild for the users whose logs
+    a transaction deleted. Only the transaction's commit callbacks hold it,
+    so a rolled back transaction drops it and the next one starts afresh.
+    """
+    
+    def __init__(self, using: str) -> None:
+        self.using = using
+        self.user_ids: Set[str] = set()
+    
+    def __call__(self) -> None:
+        pending = getattr(_pending_rebuilds, "batches", {})
+        current = pending.get(self.using)
+        if current is not None and current() is self:
+            del pending[self.using]
+        rebuild_user_stats_task.delay(sorted(self.user_ids))
+    
+    @classmethod
+    def add(cls, user_id: Any, using: str) -> None:
+        pending = _pending_rebuilds.__dict__.setdefault("batches", {})
+        rebuild = pending[using]() if using in pending else None
+        if rebuild is None:
+            rebuild = cls(using)
+            pending[using] = weakref.ref(rebuild)
+            transaction.on_commit(rebuild, using=using)
+        rebuild.user_ids.add(str(user_id))
+
+
+@receiver(post_delete, sender=PulseLog)
+def update_user_stats_on_delete(sender: Any, instance: PulseLog, **kwargs: Any) -> None:
+    """
+    Rebuilt by a task queued once the transaction commits, for all the
+    logs it deleted. When the user itself is being deleted, their stats
+    row goes with them and the rebuild finds nothing to write.
+    """
+    UserStatsRebuild.add(instance.user_id, kwargs["using"])
@@ -0,0 +1,11 @@
+from typing import Any, List
+from logs.rollups import rebuild_user_stats
+from tasks.registry import task
+
+
+@task()
+def rebuild_user_stats_task(user_ids: List[Any]) -> None:
+    """
+    Rebuild users' pulse stats after edits or deletes of their logs.
+    """
+    rebuild_user_stats(user_ids)
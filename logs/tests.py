@@ -1,3 +1,523 @@
-from django.test import TestCase
+import csv
+import gzip
+import json
+import os
+import tempfile
+from datetime import datetime, timedelta, timezone as dt_timezone
+from io import BytesIO, StringIO
+from typing import Any, List, Optional
+from unittest import mock
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import Count, F, Sum
+from django.test import SimpleTestCase, TestCase, override_settings
+from rest_framework.exceptions import ParseError
+from django.utils import timezone
+from app.plans import classify_plan, explain
+from app.testing import APITestCase, create_admin, create_user
+from insights.models import PULSE_LOG
+from logs.models import EventLog, PulseLog, TeamWeeklyPulse, UserPulseStats, next_week
+from logs.parsers import NDJSONParser
+from logs.plans import pulse_log_list_querysets
+from logs.rollups import rebuild_user_stats
+from logs.serializers import UserPulseStatsSerializer
+from logs.partitions import add_months, expired_months, month_start
+from tasks.models import Task
+from teams.models import Team
 
-# Create your tests here.
+
+class TeamWeeklyPulseRollupTests(APITestCase):
+    def setUp(self) -> None:
+        self.user = create_user()
+        self.team = Team.objects.create(team_name="Core")
+        self.other_team = Team.objects.create(team_name="Platform")
+        self.team.members.add(self.user)
+        self.client.force_authenticate(self.user)
+    
+    def log(self, mood: int, workload: int, week_index: int = 10, team: Optional[Team] = None) -> PulseLog:
+        return PulseLog.objects.create(
+            user=self.user,
+            team=team or self.team,
+            mood=mood,
+            workload=workload,
+            year=2025,
+            week_index=week_index,
+        )
+    
+    def assert_rollups_match_logs(self) -> None:
+        recomputed = {
+            (row.pop("team_id"), row.pop("year"), row.pop("week_index")): row
+            for row in PulseLog.objects.filter(team__isnull=False)
+            .order_by()
+            .values("team_id", "year", "week_index")
+            .annotate(
+                log_count=Count("id"),
+                mood_sum=Sum("mood"),
+                mood_sum_sq=Sum(F("mood") * F("mood")),
+                workload_sum=Sum("workload"),
+                workload_sum_sq=Sum(F("workload") * F("workload")),
+            )
+        }
+        stored = {
+            (row.pop("team_id"), row.pop("year"), row.pop("week_index")): row
+            for row in TeamWeeklyPulse.objects.values(
+                "team_id",
+                "year",
+                "week_index",
+                "log_count",
+                "mood_sum",
+                "mood_sum_sq",
+                "workload_sum",
+                "workload_sum_sq",
+            )
+        }
+        self.assertEqual(stored, recomputed)
+    
+    def test_rollups_follow_creates_edits_and_deletes(self) -> None:
+        first = self.log(mood=2, workload=4)
+        self.log(mood=4, workload=2)
+        self.assert_rollups_match_logs()
+        
+        first.mood = 5
+        first.save()
+        self.assert_rollups_match_logs()
+        
+        first.week_index = 11
+        first.save()
+        self.assert_rollups_match_logs()
+        
+        first.team = self.other_team
+        first.save()
+        self.assert_rollups_match_logs()
+        
+        first.team = None
+        first.save()
+        self.assert_rollups_match_logs()
+        
+        first.delete()
+        PulseLog.objects.get().delete()
+        self.assert_rollups_match_logs()
+        self.assertFalse(TeamWeeklyPulse.objects.exists())
+    
+    def test_deferred_logs_load_without_snapshot_queries(self) -> None:
+        for mood in (2, 3, 4):
+            self.log(mood=mood, workload=3)
+        with self.assertNumQueries(1):
+            ids = [log.id for log in PulseLog.objects.only("id")]
+        self.assertEqual(len(ids), 3)
+        
+        log = PulseLog.objects.only("id", "mood").first()
+        log.mood = 5
+        log.save()
+        self.assert_rollups_match_logs()
+        log = PulseLog.objects.defer("week_index").get(pk=log.pk)
+        log.week_index = 12
+        log.save()
+        self.assert_rollups_match_logs()
+    
+    def test_bulk_created_logs_are_rolled_up(self) -> None:
+        self.log(mood=1, workload=5)
+        response = self.client.post(
+            "/api/v1/pulse-logs/bulk/",
+            [
+                {"mood": 3, "workload": 3, "team": str(self.team.id), "year": 2025, "week_index": 10},
+                {"mood": 5, "workload": 1, "team": str(self.team.id), "year": 2025, "week_index": 11},
+                {"mood": 4, "workload": 2},
+            ],
+            format="json",
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assert_rollups_match_logs()
+    
+    def test_weekly_endpoint_reports_member_teams(self) -> None:
+        self.log(mood=2, workload=4)
+        self.log(mood=4, workload=2)
+        self.log(mood=3, workload=3, week_index=11)
+        self.log(mood=1, workload=1, team=self.other_team)
+        
+        response = self.client.get("/api/v1/pulse-logs/weekly/", {"ordering": "week_index"})
+        self.assertEqual(response.status_code, 200)
+        results = response.json()["results"]
+        self.assertEqual([row["week_index"] for row in results], [10, 11])
+        self.assertEqual({row["team_name"] for row in results}, {"Core"})
+        self.assertEqual(results[0]["log_count"], 2)
+        self.assertEqual(results[0]["mood_mean"], 3.0)
+        self.assertEqual(results[0]["mood_stddev"], 1.0)
+        self.assertEqual(results[1]["workload_stddev"], 0.0)
+
+
+class PulseLogBulkCreateTests(APITestCase):
+    url = "/api/v1/pulse-logs/bulk/"
+    
+    def setUp(self) -> None:
+        self.user = create_user()
+        self.team = Team.objects.create(team_name="Core")
+        self.client.force_authenticate(self.user)
+    
+    @override_settings(TASKS_EAGER=False)
+    def test_creates_logs_and_notifies_receivers(self) -> None:
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                self.url,
+                [
+                    {"mood": 3, "workload": 2, "team": str(self.team.id), "year": 2025, "week_index": 10},
+                    {"mood": 5, "workload": 4, "comment": "Shipped it", "year": 2025, "week_index": 11},
+                ],
+                format="json",
+            )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()["created"], 2)
+        self.assertEqual(response.json()["errors"], [])
+        logs = PulseLog.objects.filter(user=self.user)
+        self.assertEqual({str(log.id) for log in logs}, set(response.json()["ids"]))
+        
+        self.assertEqual(TeamWeeklyPulse.objects.get(team=self.team).mood_sum, 3)
+        stats = UserPulseStats.objects.get(user=self.user)
+        self.assertEqual((stats.total_logs, stats.mood_sum, stats.current_streak), (2, 8, 2))
+        commented = logs.get(comment="Shipped it")
+        self.assertEqual(
+            list(Task.objects.filter(queue="analysis").values_list("args", flat=True)),
+            [[PULSE_LOG, [str(commented.pk)]]],
+        )
+    
+    def test_accepts_ndjson(self) -> None:
+        body = b'{"mood": 4, "workload": 3}\n\n{"mood": 2, "workload": 1}\n'
+        response = self.client.post(self.url, body, content_type="application/x-ndjson")
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()["created"], 2)
+        year, week_index = PulseLog.current_week()
+        self.assertEqual(
+            set(PulseLog.objects.values_list("year", "week_index")), {(year, week_index)}
+        )
+    
+    def test_partial_failure_creates_the_valid_entries(self) -> None:
+        missing_team = "00000000-0000-0000-0000-000000000000"
+        response = self.client.post(
+            self.url,
+            [
+                {"mood": 3, "workload": 3},
+                {"mood": "high", "workload": 3},
+                {"mood": 4, "workload": 2, "team": missing_team},
+            ],
+            format="json",
+        )
+        self.assertEqual(response.status_code, 207)
+        self.assertEqual(response.json()["created"], 1)
+        self.assertEqual([error["index"] for error in response.json()["errors"]], [1, 2])
+        self.assertEqual(response.json()["errors"][1]["errors"], {"team": ["Team not found"]})
+        self.assertEqual(PulseLog.objects.count(), 1)
+        self.assertEqual(UserPulseStats.objects.get(user=self.user).total_logs, 1)
+    
+    def test_rejects_batches_without_valid_entries(self) -> None:
+        response = self.client.post(self.url, [{"mood": "high"}], format="json")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["created"], 0)
+        self.assertEqual(self.client.post(self.url, [], format="json").status_code, 400)
+        self.assertEqual(self.client.post(self.url, {"mood": 3}, format="json").status_code, 400)
+        self.assertFalse(PulseLog.objects.exists())
+    
+    @override_settings(PULSE_LOG_BULK_MAX_ITEMS=2)
+    def test_rejects_oversized_batches(self) -> None:
+        response = self.client.post(self.url, [{"mood": 3, "workload": 3}] * 3, format="json")
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(PulseLog.objects.exists())
+
+
+class UserPulseStatsTests(TestCase):
+    def setUp(self) -> None:
+        self.user = create_user()
+    
+    def at(self, *day: int) -> None:
+        clock = mock.patch("logs.models.datetime")
+        clock.start().now.return_value = datetime(*day)
+        self.addCleanup(clock.stop)
+    
+    def test_current_week_uses_the_iso_year(self) -> None:
+        self.at(2024, 12, 30)
+        self.assertEqual(PulseLog.current_week(), (2025, 1))
+        self.at(2021, 1, 2)
+        self.assertEqual(PulseLog.current_week(), (2020, 53))
+        self.assertEqual(PulseLog.objects.create(user=self.user, mood=3, workload=3).year, 2020)
+    
+    def test_next_week_crosses_iso_years(self) -> None:
+        self.assertEqual(next_week(2025, 10), (2025, 11))
+        self.assertEqual(next_week(2020, 52), (2020, 53))
+        self.assertEqual(next_week(2020, 53), (2021, 1))
+        self.assertEqual(next_week(2024, 52), (2025, 1))
+    
+    def test_streaks_continue_across_the_new_year(self) -> None:
+        for year, week_index in [(2020, 52), (2020, 53), (2021, 1), (2021, 1), (2021, 3)]:
+            PulseLog.objects.create(user=self.user, mood=4, workload=2, year=year, week_index=week_index)
+        expected = (5, 4, 20, 1, 3, (2021, 3))
+        
+        def values(stats: UserPulseStats) -> tuple:
+            return (
+                stats.total_logs,
+                stats.weeks_logged,
+                stats.mood_sum,
+                stats.current_streak,
+                stats.longest_streak,
+                stats.last_week,
+            )
+        
+        self.assertEqual(values(UserPulseStats.objects.get(user=self.user)), expected)
+        rebuild_user_stats([self.user.pk])
+        self.assertEqual(values(UserPulseStats.objects.get(user=self.user)), expected)
+    
+    def test_serialized_streak_lapses_after_a_missed_week(self) -> None:
+        stats = UserPulseStats(current_streak=4, total_logs=8, mood_sum=24, last_year=2024, last_week_index=52)
+        self.at(2024, 12, 30)
+        data = UserPulseStatsSerializer(stats).data
+        self.assertEqual((data["current_streak"], data["mood_mean"]), (4, 3.0))
+        self.at(2025, 1, 6)
+        self.assertEqual(UserPulseStatsSerializer(stats).data["current_streak"], 0)
+        self.assertEqual(UserPulseStatsSerializer(UserPulseStats()).data["current_streak"], 0)
+
+
+class KeysetPaginationTests(APITestCase):
+    url = "/api/v1/pulse-logs/"
+    
+    def setUp(self) -> None:
+        self.user = create_user()
+        self.client.force_authenticate(self.user)
+        # Two logs per week, so every page boundary falls inside a tie
+        for week_index in range(1, 4):
+            for mood in (1, 2):
+                PulseLog.objects.create(
+                    user=self.user, mood=mood, workload=3, year=2025, week_index=week_index
+                )
+    
+    def ids(self, response: Any) -> List[str]:
+        return [row["id"] for row in response.json()["results"]]
+    
+    def expected_ids(self, *ordering: str) -> List[str]:
+        return [str(pk) for pk in PulseLog.objects.order_by(*ordering).values_list("pk", flat=True)]
+    
+    def test_pages_forward_and_back_through_ties(self) -> None:
+        expected = self.expected_ids("week_index", "id")
+        response = self.client.get(self.url, {"ordering": "week_index", "page_size": 4})
+        self.assertEqual(response.json()["count"], 6)
+        self.assertIsNone(response.json()["previous"])
+        first_page = self.ids(response)
+        self.assertEqual(first_page, expected[:4])
+        
+        response = self.client.get(response.json()["next"])
+        self.assertEqual(self.ids(response), expected[4:])
+        self.assertIsNone(response.json()["next"])
+        
+        response = self.client.get(response.json()["previous"])
+        self.assertEqual(self.ids(response), expected[:4])
+        self.assertIsNone(response.json()["previous"])
+    
+    def test_descending_order_covers_every_row_once(self) -> None:
+        seen: List[str] = []
+        url: Optional[str] = self.url
+        params = {"ordering": "-week_index", "page_size": 1, "count": "false"}
+        while url:
+            response = self.client.get(url, params)
+            self.assertNotIn("count", response.json())
+            seen.extend(self.ids(response))
+            url, params = response.json()["next"], {}
+        self.assertEqual(seen, self.expected_ids("-week_index", "-id"))
+    
+    def test_invalid_cursors_are_not_found(self) -> None:
+        for cursor in ("not-base64!", "eyJ4IjoxfQ", "eyJwIjpbMV19", "eyJwIjpbImEiLCJiIl19"):
+            response = self.client.get(self.url, {"ordering": "week_index", "cursor": cursor})
+            self.assertEqual(response.status_code, 404, cursor)
+            self.assertEqual(response.json()["detail"], "Invalid cursor")
+    
+    @override_settings(KEYSET_PAGINATION_MAX_PAGE_SIZE=2)
+    def test_page_size_is_capped_by_the_setting(self) -> None:
+        response = self.client.get(self.url, {"page_size": 50})
+        self.assertEqual(len(response.json()["results"]), 2)
+
+
+class PulseLogExportTests(APITestCase):
+    url = "/api/v1/pulse-logs/export/"
+    
+    def setUp(self) -> None:
+        self.user = create_user()
+        other = create_user("other")
+        self.team = Team.objects.create(team_name="Core")
+        self.client.force_authenticate(self.user)
+        PulseLog.objects.create(
+            user=self.user, team=self.team, mood=4, workload=2, comment='Said "hi", then left',
+            year=2025, week_index=10,
+        )
+        PulseLog.objects.create(user=self.user, mood=2, workload=5, year=2025, week_index=11)
+        PulseLog.objects.create(user=other, mood=1, workload=1, year=2025, week_index=10)
+    
+    def content(self, response: Any) -> str:
+        self.assertTrue(response.streaming)
+        return b"".join(response.streaming_content).decode()
+    
+    def test_streams_csv(self) -> None:
+        response = self.client.get(self.url, {"format": "csv", "ordering": "week_index"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+        self.assertIn('filename="pulse_logs.csv"', response["Content-Disposition"])
+        rows = list(csv.DictReader(StringIO(self.content(response))))
+        self.assertEqual([row["week_index"] for row in rows], ["10", "11"])
+        self.assertEqual(rows[0]["team_name"], "Core")
+        self.assertEqual(rows[0]["comment"], 'Said "hi", then left')
+        self.assertEqual(rows[1]["team_id"], "")
+    
+    def test_streams_filtered_ndjson(self) -> None:
+        response = self.client.get(self.url, {"format": "ndjson", "week_index": 11})
+        self.assertEqual(response["Content-Type"], "application/x-ndjson; charset=utf-8")
+        records = [json.loads(line) for line in self.content(response).splitlines()]
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0]["user_name"], "member")
+        self.assertIsNone(records[0]["team_id"])
+        self.assertEqual(records[0]["mood"], 2)
+    
+    def test_export_command_writes_every_log(self) -> None:
+        out = StringIO()
+        call_command("export_pulse_logs", "--format", "ndjson", "--filter", "week_index=10", stdout=out)
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual(sorted(record["user_name"] for record in records), ["member", "other"])
+
+
+class PulseLogAsyncListTests(APITestCase):
+    url = "/api/v1/async/pulse-logs/"
+    
+    def setUp(self) -> None:
+        self.user = create_user()
+        other = create_user("other")
+        self.client.force_authenticate(self.user)
+        for week_index in (10, 11, 12):
+            PulseLog.objects.create(user=self.user, mood=3, workload=3, year=2025, week_index=week_index)
+        PulseLog.objects.create(user=other, mood=1, workload=1, year=2025, week_index=10)
+    
+    def test_matches_the_sync_list(self) -> None:
+        params = {"ordering": "week_index", "page_size": 2}
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        sync = self.client.get("/api/v1/pulse-logs/", params).json()
+        self.assertEqual(response.json()["results"], sync["results"])
+        self.assertEqual(response.json()["count"], 3)
+        self.assertEqual(
+            response.json()["next"], sync["next"].replace("/api/v1/", "/api/v1/async/")
+        )
+        
+        next_page = self.client.get(response.json()["next"])
+        self.assertEqual([row["week_index"] for row in next_page.json()["results"]], [12])
+    
+    def test_applies_filters_and_authentication(self) -> None:
+        response = self.client.get(self.url, {"week_index": 11})
+        self.assertEqual([row["week_index"] for row in response.json()["results"]], [11])
+        
+        self.client.force_authenticate(None)
+        self.assertEqual(self.client.get(self.url).status_code, 401)
+
+
+class PulseLogListPlanTests(TestCase):
+    def test_builds_the_list_view_queries(self) -> None:
+        user = create_user()
+        other = create_user("other")
+        for owner in (user, other):
+            PulseLog.objects.create(user=owner, mood=3, workload=2, year=2025, week_index=10)
+        
+        queryset, page_queryset = pulse_log_list_querysets({"user": user.pk, "ordering": "-week_index"})
+        self.assertEqual([log.user_id for log in page_queryset], [user.pk])
+        result = classify_plan(explain(page_queryset), PulseLog._meta.db_table, connection.vendor)
+        self.assertIsNotNone(result["access"])
+        
+        queryset, _ = pulse_log_list_querysets({}, user=other)
+        self.assertEqual([log.user_id for log in queryset], [other.pk])
+
+
+class NDJSONParserTests(SimpleTestCase):
+    def test_parses_one_item_per_line(self) -> None:
+        stream = BytesIO(b'{"mood": 1}\n  \n["a", "b"]\r\n3')
+        self.assertEqual(NDJSONParser().parse(stream), [{"mood": 1}, ["a", "b"], 3])
+    
+    def test_reports_the_bad_line(self) -> None:
+        with self.assertRaisesMessage(ParseError, "line 2"):
+            NDJSONParser().parse(BytesIO(b'{"mood": 1}\n{"mood":\n'))
+
+
+class EventLogArchiveTests(TestCase):
+    def create_event(self, name: str, months_ago: int) -> EventLog:
+        event = EventLog.objects.create(event_name=name)
+        timestamp = add_months(month_start(timezone.now()), -months_ago) + timedelta(days=1)
+        EventLog.objects.filter(pk=event.pk).update(timestamp=timestamp)
+        return event
+    
+    def test_archives_and_drops_expired_months(self) -> None:
+        old = self.create_event("old", months_ago=14)
+        kept = self.create_event("kept", months_ago=11)
+        
+        with tempfile.TemporaryDirectory() as directory:
+            call_command(
+                "archive_event_logs",
+                "--retention-months=12",
+                f"--archive-dir={directory}",
+                stdout=StringIO(),
+            )
+            files = os.listdir(directory)
+            self.assertEqual(len(files), 1)
+            with gzip.open(os.path.join(directory, files[0]), "rt") as archive:
+                records = [json.loads(line) for line in archive]
+        
+        self.assertEqual([record["id"] for record in records], [str(old.pk)])
+        self.assertEqual(list(EventLog.objects.values_list("pk", flat=True)), [kept.pk])
+
+
+class MonthArithmeticTests(SimpleTestCase):
+    def month(self, year: int, month: int) -> datetime:
+        return datetime(year, month, 1, tzinfo=dt_timezone.utc)
+    
+    def test_add_months_crosses_year_boundaries(self) -> None:
+        self.assertEqual(add_months(self.month(2024, 11), 1), self.month(2024, 12))
+        self.assertEqual(add_months(self.month(2024, 12), 1), self.month(2025, 1))
+        self.assertEqual(add_months(self.month(2025, 1), -1), self.month(2024, 12))
+        self.assertEqual(add_months(self.month(2025, 3), -15), self.month(2023, 12))
+        self.assertEqual(add_months(self.month(2023, 12), 25), self.month(2026, 1))
+        new_year_in_paris = datetime(2025, 1, 1, 0, 30, tzinfo=dt_timezone(timedelta(hours=1)))
+        self.assertEqual(month_start(new_year_in_paris), self.month(2024, 12))
+    
+    def test_expired_months_include_the_default_partition(self) -> None:
+        with mock.patch(
+            "logs.partitions.partition_months", return_value=[self.month(2024, 6), self.month(2025, 6)]
+        ), mock.patch(
+            "logs.partitions.default_partition_months", return_value=[self.month(2023, 2), self.month(2024, 6)]
+        ):
+            months = expired_months(12, now=datetime(2025, 7, 15, tzinfo=dt_timezone.utc))
+        self.assertEqual(months, [self.month(2023, 2), self.month(2024, 6)])
+
+
+class EventLogMetadataFilterTests(APITestCase):
+    def setUp(self) -> None:
+        admin = create_admin()
+        self.client.force_authenticate(admin)
+        EventLog.objects.create(event_name="login", metadata={"team_id": "a", "count": 5})
+        EventLog.objects.create(event_name="login", metadata={"team_id": "b", "count": "5"})
+        EventLog.objects.create(event_name="login", metadata={"device": {"os": "ios"}})
+        EventLog.objects.create(event_name="login", metadata=None)
+    
+    def count(self, query: str) -> int:
+        response = self.client.get(f"/api/v1/event-logs/?{query}")
+        self.assertEqual(response.status_code, 200)
+        return response.json()["count"]
+    
+    def test_filters_on_keys(self) -> None:
+        self.assertEqual(self.count("meta.team_id=a"), 1)
+        self.assertEqual(self.count("meta.count=5"), 2)
+        self.assertEqual(self.count("meta.count=5&meta.team_id=b"), 1)
+        self.assertEqual(self.count("meta.device.os=ios"), 1)
+        self.assertEqual(self.count("meta.device.os=android"), 0)
+    
+    def test_rejects_lookup_syntax_in_keys(self) -> None:
+        response = self.client.get("/api/v1/event-logs/?meta.team_id__isnull=true")
+        self.assertEqual(response.status_code, 400)
+    
+    def test_json_string_metadata_is_decoded(self) -> None:
+        response = self.client.post(
+            "/api/v1/event-logs/",
+            {"event_name": "signup", "metadata": '{"team_id": "c"}'},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()["metadata"], {"team_id": "c"})
+        self.assertEqual(self.count("meta.team_id=c"), 1)
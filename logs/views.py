@@ -1,32 +1,120 @@
-from rest_framework import generics
+from django.conf import settings
+from rest_framework import generics, status
+from rest_framework.parsers import JSONParser
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import OrderingFilter
-from logs.models import PulseLog, EventLog
-from logs.serializers import EventLogSerializer, PulseLogSerializer
+from app.async_views import AsyncListView
+from app.exports import ExportMixin
+from app.pagination import KeysetPagination
+from app.replicas import ReplicaReadMixin
+from app.search import SearchFilterBackend
+from logs.exports import PULSE_LOG_EXPORT_COLUMNS, pulse_log_export_rows
+from logs.filters import MetadataFilterBackend
+from logs.models import PulseLog, EventLog, TeamWeeklyPulse
+from logs.parsers import NDJSONParser
+from logs.partitions import recent_window_start
+from logs.search import pulse_log_search
+from logs.serializers import (
+    EventLogSerializer,
+    PulseLogBulkSerializer,
+    PulseLogSerializer,
+    TeamWeeklyPulseSerializer,
+)
+from teams.membership import user_team_ids
 from users.permissions import IsAdminUser
 
 
-class PulseLogListCreateView(generics.ListCreateAPIView):
+class PulseLogQuerysetMixin:
+    """
+    Scopes pulse logs to the current user unless they are an admin.
+    """
+    
+    def get_queryset(self):  # type: ignore[no-untyped-def]
+        user = self.request.user
+        if user.is_staff:
+            return PulseLog.objects.select_related("user", "team").all()
+        return PulseLog.objects.filter(user_id=user.pk).select_related("user", "team")
+
+
+class PulseLogListCreateView(ReplicaReadMixin, PulseLogQuerysetMixin, generics.ListCreateAPIView):
     """
     List and create pulse logs. 
     - Authenticated users can view their own logs and create logs
     - Admins can view all logs
+    - `?q=` searches comments, best match first
     """
     serializer_class = PulseLogSerializer
     permission_classes = (IsAuthenticated,)
-    filter_backends = [DjangoFilterBackend, OrderingFilter]
+    pagination_class = KeysetPagination
+    filter_backends = [DjangoFilterBackend, SearchFilterBackend, OrderingFilter]
     filterset_fields = ["user", "team", "year", "week_index", "mood", "workload"]
     ordering_fields = ["timestamp", "year", "week_index"]
+    search_index = pulse_log_search
+
+
+class PulseLogBulkCreateView(APIView):
+    """
+    Create many pulse logs for the current user in one request.
+    - Accepts a JSON array or NDJSON (application/x-ndjson)
+    - Invalid entries are reported by index; valid entries are still created
+    """
+    permission_classes = (IsAuthenticated,)
+    parser_classes = (JSONParser, NDJSONParser)
     
-    def get_queryset(self):  # type: ignore[no-untyped-def]
-        user = self.request.user
-        if user.is_staff:
-            return PulseLog.objects.select_related("user", "team").all()
-        return PulseLog.objects.filter(user=user).select_related("user", "team")
+    def post(self, request: Request) -> Response:
+        serializer = PulseLogBulkSerializer(
+            data=request.data,
+            max_length=settings.PULSE_LOG_BULK_MAX_ITEMS,
+            context={
+                "request": request,
+                "batch_size": settings.PULSE_LOG_BULK_BATCH_SIZE,
+            },
+        )
+        serializer.is_valid(raise_exception=True)
+        
+        if not serializer.validated_data:
+            return Response(
+                {"created": 0, "ids": [], "errors": serializer.item_errors},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        
+        logs = serializer.save()
+        return Response(
+            {
+                "created": len(logs),
+                "ids": [str(log.id) for log in logs],
+                "errors": serializer.item_errors,
+            },
+            status=(
+                status.HTTP_207_MULTI_STATUS
+                if serializer.item_errors
+                else status.HTTP_201_CREATED
+            ),
+        )
+
+
+class PulseLogExportView(ExportMixin, PulseLogQuerysetMixin, generics.GenericAPIView):
+    """
+    Stream pulse logs as CSV or NDJSON (`?format=csv|ndjson`).
+    - Same scoping and filters as the pulse log list
+    """
+    permission_classes = (IsAuthenticated,)
+    filter_backends = PulseLogListCreateView.filter_backends
+    filterset_fields = PulseLogListCreateView.filterset_fields
+    ordering_fields = PulseLogListCreateView.ordering_fields
+    search_index = pulse_log_search
+    export_columns = PULSE_LOG_EXPORT_COLUMNS
+    export_filename = "pulse_logs"
+    
+    def get_export_rows(self, queryset):  # type: ignore[no-untyped-def]
+        return pulse_log_export_rows(queryset, self.export_chunk_size)
 
 
-class PulseLogDetailView(generics.RetrieveUpdateDestroyAPIView):
+class PulseLogDetailView(PulseLogQuerysetMixin, generics.RetrieveUpdateDestroyAPIView):
     """
     Retrieve, update or delete a pulse log.
     - Users can only access their own logs
@@ -35,24 +123,51 @@ class PulseLogDetailView(generics.RetrieveUpdateDestroyAPIView):
     serializer_class = PulseLogSerializer
     permission_classes = (IsAuthenticated,)
     lookup_field = "id"
+
+
+class TeamWeeklyPulseListView(ReplicaReadMixin, generics.ListAPIView):
+    """
+    Weekly mood/workload aggregates per team, read from the rollup table.
+    - Users can view the weeks of teams they belong to
+    - Admins can view all teams
+    """
+    serializer_class = TeamWeeklyPulseSerializer
+    permission_classes = (IsAuthenticated,)
+    filter_backends = [DjangoFilterBackend, OrderingFilter]
+    filterset_fields = ["team", "year", "week_index"]
+    ordering_fields = ["year", "week_index", "log_count"]
     
     def get_queryset(self):  # type: ignore[no-untyped-def]
         user = self.request.user
+        queryset = TeamWeeklyPulse.objects.select_related("team")
         if user.is_staff:
-            return PulseLog.objects.select_related("user", "team").all()
-        return PulseLog.objects.filter(user=user).select_related("user", "team")
+            return queryset.all()
+        return queryset.filter(team_id__in=user_team_ids(user))
 
 
-class EventLogListCreateView(generics.ListCreateAPIView):
+class EventLogListCreateView(ReplicaReadMixin, generics.ListCreateAPIView):
     """
     List event logs or create a new event log (admin only).
+    - `?meta.<key>=<value>` filters on metadata keys (see MetadataFilterBackend)
+    - `?timestamp__gte=` / `?timestamp__lt=` bound the range read; without
+      either, only the last EVENT_LOG_LIST_WINDOW_DAYS days are listed so
+      the query stays on the newest partitions
     """
-    queryset = EventLog.objects.all()
     serializer_class = EventLogSerializer
     permission_classes = (IsAdminUser,)
-    filter_backends = [DjangoFilterBackend, OrderingFilter]
-    filterset_fields = ["event_name"]
+    pagination_class = KeysetPagination
+    filter_backends = [DjangoFilterBackend, MetadataFilterBackend, OrderingFilter]
+    filterset_fields = {"event_name": ["exact"], "timestamp": ["gte", "lt"]}
     ordering_fields = ["timestamp"]
+    
+    def get_queryset(self):  # type: ignore[no-untyped-def]
+        queryset = EventLog.objects.all()
+        params = self.request.query_params
+        if self.request.method == "GET" and not (
+            "timestamp__gte" in params or "timestamp__lt" in params
+        ):
+            queryset = queryset.filter(timestamp__gte=recent_window_start())
+        return queryset
 
 
 class EventLogDetailView(generics.RetrieveUpdateDestroyAPIView):
@@ -63,3 +178,10 @@ class EventLogDetailView(generics.RetrieveUpdateDestroyAPIView):
     serializer_class = EventLogSerializer
     permission_classes = (IsAdminUser,)
     lookup_field = "id"
+
+
+class PulseLogAsyncListView(AsyncListView):
+    """
+    Async variant of the pulse log list for ASGI deployments.
+    """
+    view_class = PulseLogListCreateView
@@ -0,0 +1,5 @@
+from app.catalog import CatalogCache
+from moods.models import Mood
+from moods.serializers import MoodSerializer
+
+mood_catalog = CatalogCache("moods", Mood.objects.all, MoodSerializer)
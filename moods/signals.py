@@ -0,0 +1,12 @@
+from typing import Any
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from moods.catalog import mood_catalog
+from moods.models import Mood
+
+
+@receiver(post_save, sender=Mood)
+@receiver(post_delete, sender=Mood)
+def invalidate_mood_catalog(sender: Any, **kwargs: Any) -> None:
+    transaction.on_commit(mood_catalog.invalidate)
@@ -1,3 +1,59 @@
-from django.test import TestCase
+import time
+from typing import Any
+from unittest import mock
+from django.core.cache import cache
+from app.catalog import CatalogCache
+from app.testing import APITestCase, create_user
+from moods.catalog import mood_catalog
+from moods.models import Mood
+from moods.serializers import MoodSerializer
 
-# Create your tests here.
+
+class MoodCatalogTests(APITestCase):
+    url = "/api/v1/moods/"
+    
+    def setUp(self) -> None:
+        cache.clear()
+        mood_catalog.invalidate()
+        self.admin = create_user("admin", is_staff=True)
+        self.client.force_authenticate(self.admin)
+        Mood.objects.create(value=1, description="Rough")
+    
+    def descriptions(self, response: Any) -> list:
+        return [row["description"] for row in response.json()["results"]]
+    
+    def test_writes_through_the_api_invalidate_the_catalog(self) -> None:
+        first = self.client.get(self.url)
+        self.assertEqual(self.descriptions(first), ["Rough"])
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(self.url, {"value": 5, "description": "Great"})
+        self.assertEqual(response.status_code, 201)
+        
+        second = self.client.get(self.url)
+        self.assertEqual(self.descriptions(second), ["Rough", "Great"])
+        self.assertNotEqual(second["ETag"], first["ETag"])
+        self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=first["ETag"]).status_code, 200)
+        self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=second["ETag"]).status_code, 304)
+        
+        mood = Mood.objects.get(value=5)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete(f"/api/v1/moods/{mood.id}/")
+        third = self.client.get(self.url)
+        self.assertEqual(self.descriptions(third), ["Rough"])
+        self.assertEqual(third["ETag"], first["ETag"])
+    
+    def test_other_workers_catch_up_without_the_invalidation(self) -> None:
+        # Another worker with a per-process cache never sees invalidate()
+        worker = CatalogCache("moods-other-worker", Mood.objects.all, MoodSerializer, ttl=30)
+        stale = worker.get()
+        Mood.objects.create(value=5, description="Great")
+        self.assertEqual(worker.get(), stale)
+        
+        # Past the TTL, in memory and in the cache
+        with mock.patch("time.time", return_value=time.time() + 31), mock.patch(
+            "time.monotonic", return_value=time.monotonic() + 31
+        ):
+            fresh = worker.get()
+        self.assertNotEqual(fresh.version, stale.version)
+        self.assertIn(b"Great", fresh.body)
@@ -1,5 +1,9 @@
 from rest_framework import generics
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from app.conditional import ConditionalGetMixin
+from app.catalog import catalog_response
+from moods.catalog import mood_catalog
 from moods.models import Mood
 from moods.serializers import MoodSerializer
 from users.permissions import IsAdminUser
@@ -8,6 +12,7 @@ from users.permissions import IsAdminUser
 class MoodListCreateView(generics.ListCreateAPIView):
     """
     List all moods (authenticated users) or create a new mood (admin only).
+    The list is served from the mood catalog cache and is not paginated.
     """
     queryset = Mood.objects.all()
     serializer_class = MoodSerializer
@@ -17,9 +22,15 @@ class MoodListCreateView(generics.ListCreateAPIView):
         if self.request.method == "POST":
             return [IsAdminUser()]
         return [IsAuthenticated()]
+    
+    def list(self, request: Request, *args, **kwargs):  # type: ignore[no-untyped-def]
+        """
+        Serve the whole catalog as cached, pre-rendered JSON
+        """
+        return catalog_response(request, mood_catalog.get())
 
 
-class MoodDetailView(generics.RetrieveUpdateDestroyAPIView):
+class MoodDetailView(ConditionalGetMixin, generics.RetrieveUpdateDestroyAPIView):
     """
     Retrieve (authenticated users), update or delete a mood (admin only).
     """
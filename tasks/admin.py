@@ -0,0 +1,24 @@
+from django.contrib import admin
+from django.utils import timezone
+from tasks.models import Task
+
+
+@admin.register(Task)
+class TaskAdmin(admin.ModelAdmin):
+    list_display = ["name", "queue", "status", "attempts", "run_at", "locked_by", "created_at"]
+    list_filter = ["status", "queue", "name"]
+    search_fields = ["name", "locked_by"]
+    ordering = ["run_at"]
+    readonly_fields = ["attempts", "locked_at", "locked_by", "last_error", "created_at", "updated_at"]
+    actions = ["retry_now"]
+    show_full_result_count = False
+    
+    @admin.action(description="Retry selected tasks now")
+    def retry_now(self, request, queryset):  # type: ignore[no-untyped-def]
+        count = queryset.exclude(status=Task.RUNNING).update(
+            status=Task.PENDING,
+            attempts=0,
+            run_at=timezone.now(),
+            last_error="",
+        )
+        self.message_user(request, f"Queued {count} tasks")
@@ -0,0 +1,87 @@
+import multiprocessing
+import signal
+from typing import Any
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from tasks.registry import registry
+from tasks.processes import run_worker_process
+from tasks.worker import Worker
+
+
+class Command(BaseCommand):
+    help = (
+        "Run queued tasks. Several worker processes (and several hosts) can "
+        "drain the same queues; on PostgreSQL they claim tasks with SKIP "
+        "LOCKED and never block each other. SIGTERM or Ctrl-C lets running "
+        "tasks finish before exiting."
+    )
+
+    def add_arguments(self, parser: Any) -> None:
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=settings.TASK_WORKER_PROCESSES,
+            help="Worker processes to run; 1 runs the worker in this process.",
+        )
+        parser.add_argument(
+            "--queue",
+            action="append",
+            dest="queues",
+            help="Queue to drain; repeat for several. Defaults to 'default'.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.TASK_BATCH_SIZE,
+            help="Tasks claimed per round trip.",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=1.0,
+            help="Seconds to wait when the queues are empty.",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit once the queues are empty instead of polling.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        queues = options["queues"] or ["default"]
+        self.stdout.write(
+            f"Running {len(registry)} registered tasks from {', '.join(queues)} "
+            f"with {options['processes']} processes"
+        )
+        
+        if options["processes"] <= 1:
+            worker = Worker(queues, options["batch_size"])
+            signal.signal(signal.SIGTERM, worker.stop)
+            signal.signal(signal.SIGINT, worker.stop)
+            worker.run(once=options["once"], poll_interval=options["poll_interval"])
+            self.stdout.write(
+                self.style.SUCCESS(f"{worker.succeeded} tasks succeeded, {worker.failed} failed")
+            )
+            return
+        
+        context = multiprocessing.get_context("spawn")
+        processes = [
+            context.Process(
+                target=run_worker_process,
+                args=(queues, options["batch_size"], options["poll_interval"], options["once"]),
+            )
+            for _ in range(options["processes"])
+        ]
+        for process in processes:
+            process.start()
+        
+        def stop(*args: Any) -> None:
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+        
+        signal.signal(signal.SIGTERM, stop)
+        signal.signal(signal.SIGINT, stop)
+        for process in processes:
+            process.join()
+        self.stdout.write(self.style.SUCCESS("Workers stopped"))
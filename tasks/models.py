@@ -0,0 +1,50 @@
+import uuid
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.utils import timezone
+from app.abstracts import TimeStampedModel
+
+
+class Task(TimeStampedModel):
+    """
+    A queued call to a function registered with @task (tasks/registry.py).
+    Workers claim pending tasks whose run_at has passed; a task that
+    succeeds is deleted, one that fails is retried with backoff until it
+    runs out of attempts and is kept as failed.
+    """
+    PENDING = "pending"
+    RUNNING = "running"
+    FAILED = "failed"
+    STATUS_CHOICES = [
+        (PENDING, "Pending"),
+        (RUNNING, "Running"),
+        (FAILED, "Failed"),
+    ]
+    
+    id = models.UUIDField(
+        primary_key=True,
+        default=uuid.uuid4,
+        editable=False,
+        unique=True,
+    )
+    name = models.CharField(max_length=255)
+    queue = models.CharField(max_length=64, default="default")
+    args = models.JSONField(default=list, encoder=DjangoJSONEncoder)
+    kwargs = models.JSONField(default=dict, encoder=DjangoJSONEncoder)
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default=PENDING)
+    attempts = models.IntegerField(default=0)
+    max_attempts = models.IntegerField(default=5)
+    run_at = models.DateTimeField(default=timezone.now)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    locked_by = models.CharField(max_length=255, blank=True, default="")
+    last_error = models.TextField(blank=True, default="")
+    
+    class Meta:
+        db_table = "tasks"
+        ordering = ["run_at"]
+        indexes = [
+            models.Index(fields=["queue", "status", "run_at"]),
+        ]
+    
+    def __str__(self) -> str:
+        return f"{self.name} ({self.status})"
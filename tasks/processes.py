@@ -0,0 +1,19 @@
+"""
+Entry point of the worker processes started by run_tasks. They are
+spawned, not forked, so this module must not import models before
+Django is set up in the new interpreter.
+"""
+import signal
+from typing import Sequence
+
+
+def run_worker_process(queues: Sequence[str], batch_size: int, poll_interval: float, once: bool) -> None:
+    import django
+
+    django.setup()
+    from tasks.worker import Worker
+
+    worker = Worker(queues, batch_size)
+    signal.signal(signal.SIGTERM, worker.stop)
+    signal.signal(signal.SIGINT, worker.stop)
+    worker.run(once=once, poll_interval=poll_interval)
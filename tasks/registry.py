@@ -0,0 +1,72 @@
+from datetime import timedelta
+from typing import Any, Callable, Dict, Optional
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from tasks.models import Task
+
+registry: Dict[str, "TaskFunction"] = {}
+
+
+class TaskFunction:
+    """
+    A function that can be run by the task workers. Calling it runs it
+    inline; delay() queues it instead. Arguments must be JSON serialisable
+    (UUIDs, dates and decimals arrive as strings).
+    """
+    
+    def __init__(self, func: Callable, name: str, queue: str, max_attempts: int) -> None:
+        self.func = func
+        self.name = name
+        self.queue = queue
+        self.max_attempts = max_attempts
+        self.__doc__ = func.__doc__
+    
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.func(*args, **kwargs)
+    
+    def delay(self, *args: Any, **kwargs: Any) -> Optional[Task]:
+        return self.schedule(args, kwargs)
+    
+    def schedule(
+        self, args: Any = (), kwargs: Optional[dict] = None, countdown: float = 0
+    ) -> Optional[Task]:
+        """
+        Queue a call, to run no earlier than `countdown` seconds from now.
+        The task row is written in the caller's transaction, so workers
+        only see it once that transaction commits and never if it rolls
+        back. With TASKS_EAGER the call runs in-process after the commit
+        instead, for development without a worker.
+        """
+        kwargs = kwargs or {}
+        if settings.TASKS_EAGER:
+            transaction.on_commit(lambda: self.func(*args, **kwargs))
+            return None
+        return Task.objects.create(
+            name=self.name,
+            queue=self.queue,
+            args=list(args),
+            kwargs=kwargs,
+            max_attempts=self.max_attempts,
+            run_at=timezone.now() + timedelta(seconds=countdown),
+        )
+
+
+def task(
+    name: Optional[str] = None, queue: str = "default", max_attempts: Optional[int] = None
+) -> Callable[[Callable], TaskFunction]:
+    """
+    Register a function as a task, under `name` (default
+    "<module>.<function>").
+    """
+    def register(func: Callable) -> TaskFunction:
+        task_name = name or f"{func.__module__}.{func.__name__}"
+        wrapped = TaskFunction(
+            func,
+            task_name,
+            queue,
+            settings.TASK_MAX_ATTEMPTS if max_attempts is None else max_attempts,
+        )
+        registry[task_name] = wrapped
+        return wrapped
+    return register
@@ -0,0 +1,141 @@
+from datetime import timedelta
+from typing import List
+from django.db import transaction
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from app.testing import create_user
+from logs.models import PulseLog, UserPulseStats
+from tasks.models import Task
+from tasks.registry import task
+from tasks.worker import Worker, requeue_stale_tasks
+
+calls: List[str] = []
+
+
+@task(name="tests.record")
+def record(value: str) -> None:
+    calls.append(value)
+
+
+@task(name="tests.explode", max_attempts=2)
+def explode() -> None:
+    raise RuntimeError("boom")
+
+
+@task(name="tests.reclaimed")
+def reclaimed() -> None:
+    Task.objects.filter(name="tests.reclaimed").update(locked_by="other-worker")
+
+
+@override_settings(TASKS_EAGER=False)
+class TaskQueueTests(TestCase):
+    def setUp(self) -> None:
+        calls.clear()
+        self.worker = Worker(["default"], batch_size=10, name="test-worker")
+    
+    def test_tasks_run_once_and_are_removed(self) -> None:
+        record.delay("a")
+        record.schedule(["later"], countdown=60)
+        self.worker.run(once=True)
+        self.assertEqual(calls, ["a"])
+        self.assertEqual(list(Task.objects.values_list("args", flat=True)), [["later"]])
+    
+    def test_rolled_back_work_enqueues_nothing(self) -> None:
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                record.delay("rolled back")
+                raise RuntimeError
+        self.assertFalse(Task.objects.exists())
+    
+    def test_failures_back_off_then_fail(self) -> None:
+        explode.delay()
+        self.worker.run(once=True)
+        failed = Task.objects.get()
+        self.assertEqual((failed.status, failed.attempts), (Task.PENDING, 1))
+        self.assertGreater(failed.run_at, timezone.now())
+        self.assertIn("RuntimeError: boom", failed.last_error)
+        
+        Task.objects.update(run_at=timezone.now())
+        self.worker.run(once=True)
+        failed.refresh_from_db()
+        self.assertEqual((failed.status, failed.attempts), (Task.FAILED, 2))
+        self.assertEqual(self.worker.failed, 2)
+    
+    def test_unknown_tasks_fail_without_retrying(self) -> None:
+        Task.objects.create(name="tests.missing")
+        self.worker.run(once=True)
+        self.assertEqual(Task.objects.get().status, Task.FAILED)
+    
+    def test_abandoned_tasks_are_requeued(self) -> None:
+        record.delay("a")
+        Task.objects.update(
+            status=Task.RUNNING, locked_at=timezone.now() - timedelta(hours=1), attempts=1
+        )
+        self.assertEqual(requeue_stale_tasks(), 1)
+        self.worker.run(once=True)
+        self.assertEqual(calls, ["a"])
+    
+    def test_reclaimed_tasks_are_left_to_their_new_worker(self) -> None:
+        reclaimed.delay()
+        self.worker.run(once=True)
+        self.assertEqual(Task.objects.get().locked_by, "other-worker")
+    
+    def test_stopping_releases_unstarted_tasks(self) -> None:
+        record.delay("a")
+        record.delay("b")
+        self.worker.stop()
+        self.worker.run_batch()
+        self.assertEqual(calls, [])
+        self.assertEqual(
+            list(Task.objects.values_list("status", "attempts")),
+            [(Task.PENDING, 0), (Task.PENDING, 0)],
+        )
+    
+    @override_settings(TASKS_EAGER=True)
+    def test_eager_mode_runs_after_commit(self) -> None:
+        with self.captureOnCommitCallbacks(execute=True):
+            record.delay("eager")
+        self.assertEqual(calls, ["eager"])
+        self.assertFalse(Task.objects.exists())
+
+
+@override_settings(TASKS_EAGER=False)
+class UserStatsTaskTests(TestCase):
+    def test_edits_rebuild_stats_in_the_background(self) -> None:
+        user = create_user()
+        log = PulseLog.objects.create(user=user, mood=4, workload=3, year=2024, week_index=10)
+        log.week_index = 12
+        log.save()
+        self.assertEqual(UserPulseStats.objects.get(user=user).last_week_index, 10)
+        self.assertEqual(Task.objects.get(queue="default").name, "logs.tasks.rebuild_user_stats_task")
+        
+        Worker(["default"], batch_size=10).run(once=True)
+        self.assertEqual(UserPulseStats.objects.get(user=user).last_week_index, 12)
+    
+    def test_deletes_queue_one_rebuild_per_transaction(self) -> None:
+        users = [create_user(name) for name in ("first", "second")]
+        for user in users:
+            for week_index in (10, 11):
+                PulseLog.objects.create(user=user, mood=4, workload=3, year=2024, week_index=week_index)
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            PulseLog.objects.filter(week_index=11).delete()
+        task = Task.objects.get()
+        self.assertEqual(task.args, [sorted(str(user.pk) for user in users)])
+        
+        Worker(["default"], batch_size=10).run(once=True)
+        self.assertEqual(
+            list(UserPulseStats.objects.values_list("total_logs", "last_week_index")), [(1, 10), (1, 10)]
+        )
+    
+    def test_rolled_back_deletes_queue_nothing(self) -> None:
+        users = [create_user(name) for name in ("first", "second")]
+        for user in users:
+            PulseLog.objects.create(user=user, mood=4, workload=3, year=2024, week_index=10)
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            with self.assertRaises(RuntimeError), transaction.atomic():
+                PulseLog.objects.filter(user=users[0]).delete()
+                raise RuntimeError
+            PulseLog.objects.filter(user=users[1]).delete()
+        self.assertEqual(Task.objects.get().args, [[str(users[1].pk)]])
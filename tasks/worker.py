@@ -0,0 +1,151 @@
+import logging
+import os
+import random
+import socket
+import time
+import traceback
+from datetime import timedelta
+from typing import Any, List, Optional, Sequence
+from django.conf import settings
+from django.db import DatabaseError, close_old_connections, transaction
+from django.db.models import F
+from django.utils import timezone
+from app.queues import claim_rows
+from tasks.models import Task
+from tasks.registry import registry
+
+logger = logging.getLogger(__name__)
+
+
+def retry_delay(attempts: int) -> float:
+    """
+    Seconds before retrying a task that has failed `attempts` times:
+    exponential from TASK_RETRY_BACKOFF up to TASK_RETRY_BACKOFF_MAX, with
+    jitter so tasks that failed together don't retry together.
+    """
+    delay = min(
+        settings.TASK_RETRY_BACKOFF * 2 ** max(attempts - 1, 0),
+        settings.TASK_RETRY_BACKOFF_MAX,
+    )
+    return delay * random.uniform(0.5, 1)
+
+
+def requeue_stale_tasks() -> int:
+    """
+    Return tasks left running longer than TASK_STALE_SECONDS, by a worker
+    that died or was killed, to the queue.
+    """
+    stale = timezone.now() - timedelta(seconds=settings.TASK_STALE_SECONDS)
+    return Task.objects.filter(status=Task.RUNNING, locked_at__lt=stale).update(
+        status=Task.PENDING, locked_by="", updated_at=timezone.now()
+    )
+
+
+def claim_tasks(queues: Sequence[str], limit: int, worker: str) -> List[Task]:
+    """
+    Mark up to `limit` due tasks from `queues` as running, oldest first.
+    """
+    now = timezone.now()
+    due = Task.objects.filter(queue__in=queues, status=Task.PENDING, run_at__lte=now)
+    pks = claim_rows(
+        due.order_by("run_at"),
+        limit,
+        status=Task.RUNNING,
+        locked_at=now,
+        locked_by=worker,
+        attempts=F("attempts") + 1,
+        updated_at=now,
+    )
+    return list(Task.objects.filter(pk__in=pks, locked_by=worker).order_by("run_at"))
+
+
+def run_task(task: Task) -> bool:
+    """
+    Run a claimed task in its own transaction. Returns whether it
+    succeeded; failures are rescheduled or, out of attempts, kept as
+    failed with their traceback.
+    """
+    function = registry.get(task.name)
+    try:
+        if function is None:
+            raise LookupError(f"No task registered as {task.name!r}")
+        with transaction.atomic():
+            function(*task.args, **task.kwargs)
+    except Exception:
+        error = traceback.format_exc()
+        retry = function is not None and task.attempts < task.max_attempts
+        Task.objects.filter(pk=task.pk, locked_by=task.locked_by).update(
+            status=Task.PENDING if retry else Task.FAILED,
+            run_at=timezone.now() + timedelta(seconds=retry_delay(task.attempts)),
+            locked_at=None,
+            locked_by="",
+            last_error=error,
+            updated_at=timezone.now(),
+        )
+        return False
+    # A worker that claimed it again after TASK_STALE_SECONDS owns it now
+    Task.objects.filter(pk=task.pk, locked_by=task.locked_by).delete()
+    return True
+
+
+class Worker:
+    """
+    Claims and runs tasks in a loop until stopped. Several workers, in
+    one or many processes and hosts, can drain the same queues.
+    """
+    
+    def __init__(self, queues: Sequence[str], batch_size: int, name: Optional[str] = None) -> None:
+        self.queues = list(queues)
+        self.batch_size = batch_size
+        self.name = name or f"{socket.gethostname()}:{os.getpid()}"
+        self.succeeded = 0
+        self.failed = 0
+        self.stopping = False
+    
+    def stop(self, *args: Any) -> None:
+        """
+        Finish the current task, then exit. Unstarted tasks of the claimed
+        batch are released.
+        """
+        self.stopping = True
+    
+    def run_batch(self) -> int:
+        """
+        Claim and run one batch. Returns the number of tasks claimed.
+        """
+        tasks = claim_tasks(self.queues, self.batch_size, self.name)
+        for index, task in enumerate(tasks):
+            if self.stopping:
+                Task.objects.filter(pk__in=[t.pk for t in tasks[index:]]).update(
+                    status=Task.PENDING,
+                    locked_at=None,
+                    locked_by="",
+                    attempts=F("attempts") - 1,
+                )
+                break
+            if run_task(task):
+                self.succeeded += 1
+            else:
+                self.failed += 1
+        return len(tasks)
+    
+    def run(self, once: bool = False, poll_interval: float = 1.0) -> None:
+        """
+        Run batches until stopped, sleeping `poll_interval` seconds when
+        the queues are empty; with `once`, return when they are. Database
+        errors outside a task (a dropped connection, SQLite's lock) are
+        logged and retried after `poll_interval`.
+        """
+        while not self.stopping:
+            close_old_connections()
+            try:
+                requeue_stale_tasks()
+                while not self.stopping and self.run_batch():
+                    pass
+            except DatabaseError:
+                logger.exception("Task worker %s hit a database error", self.name)
+            else:
+                if once:
+                    return
+            time.sleep(poll_interval)
+
@@ -3,7 +3,7 @@ Django settings for teampulse project.
 """
 from datetime import timedelta
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, List
 from corsheaders.defaults import default_headers
 import dj_database_url
 from decouple import config
@@ -47,10 +47,14 @@ INSTALLED_APPS = [
     'workloads',
     'logs',
     'feedback',
+    'insights',
+    'tasks',
+    'benchmarks',
 ]
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'app.middleware.RequestMetricsMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
@@ -59,6 +63,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'app.middleware.ReplicaRoutingMiddleware',
 ]
 
 # CORS Configuration
@@ -104,9 +109,47 @@ WSGI_APPLICATION = 'teampulse.wsgi.application'
 # Database Configuration
 DATABASE_URL = config("DATABASE_URL", default="")
 
+# Seconds a worker keeps its database connection open between requests
+# (0 closes it after each one). Pooled connections ignore it.
+CONN_MAX_AGE = config("CONN_MAX_AGE", default=600, cast=int)
+
+# Check a persistent or pooled connection before reusing it, so one the
+# server dropped is replaced instead of failing the request
+CONN_HEALTH_CHECKS = config("CONN_HEALTH_CHECKS", default=True, cast=bool)
+
+# Pool PostgreSQL connections with psycopg_pool, one pool per worker process
+DATABASE_POOL = config("DATABASE_POOL", default=False, cast=bool)
+DATABASE_POOL_OPTIONS = {
+    "min_size": config("DATABASE_POOL_MIN_SIZE", default=1, cast=int),
+    "max_size": config("DATABASE_POOL_MAX_SIZE", default=4, cast=int),
+    # Seconds a request waits for a free connection before failing
+    "timeout": config("DATABASE_POOL_TIMEOUT", default=10, cast=float),
+    # Seconds before idle connections above min_size are closed
+    "max_idle": config("DATABASE_POOL_MAX_IDLE", default=300, cast=float),
+    # Seconds before a connection is replaced; psycopg_pool adds jitter so
+    # workers started by the same deploy don't all reconnect at once
+    "max_lifetime": config("DATABASE_POOL_MAX_LIFETIME", default=1800, cast=float),
+}
+POOLED_ENGINES = ("django.db.backends.postgresql", "django.contrib.gis.db.backends.postgis")
+
+
+def database_config(url: str) -> Dict[str, Any]:
+    """
+    Settings for one database URL, pooled if DATABASE_POOL is set and it
+    is PostgreSQL (Django's pool requires CONN_MAX_AGE = 0).
+    """
+    database = dj_database_url.parse(
+        url, conn_max_age=CONN_MAX_AGE, conn_health_checks=CONN_HEALTH_CHECKS
+    )
+    if DATABASE_POOL and database["ENGINE"] in POOLED_ENGINES:
+        database["CONN_MAX_AGE"] = 0
+        database.setdefault("OPTIONS", {})["pool"] = dict(DATABASE_POOL_OPTIONS)
+    return database
+
+
 if DATABASE_URL:
     DATABASES = {
-        "default": dj_database_url.parse(DATABASE_URL, conn_max_age=600)
+        "default": database_config(DATABASE_URL)
     }
 else:
     # Fallback to SQLite for local development
@@ -117,6 +160,102 @@ else:
         }
     }
 
+# Read replicas (app/replicas.py): comma separated database URLs, added as
+# "replica_1", "replica_2", ... for list and analytics reads
+DATABASE_REPLICA_URLS = config(
+    "DATABASE_REPLICA_URLS",
+    default="",
+    cast=lambda v: [s.strip() for s in v.split(",") if s.strip()]
+)
+
+# Seconds to wait when connecting to a PostgreSQL replica, so a health
+# check on an unreachable replica doesn't hold up the request running it
+REPLICA_CONNECT_TIMEOUT = config("REPLICA_CONNECT_TIMEOUT", default=2, cast=int)
+
+
+def replica_config(url: str) -> Dict[str, Any]:
+    """
+    Settings for one read replica: database_config() with a short connect
+    timeout on PostgreSQL (unless the URL sets one), and no test database
+    of its own.
+    """
+    database = database_config(url)
+    if database["ENGINE"] in POOLED_ENGINES:
+        database.setdefault("OPTIONS", {}).setdefault("connect_timeout", REPLICA_CONNECT_TIMEOUT)
+    database["TEST"] = {"MIRROR": "default"}
+    return database
+
+
+DATABASE_REPLICAS: List[str] = []
+for index, replica_url in enumerate(DATABASE_REPLICA_URLS, start=1):
+    alias = f"replica_{index}"
+    DATABASES[alias] = replica_config(replica_url)
+    DATABASE_REPLICAS.append(alias)
+
+DATABASE_ROUTERS = ["app.replicas.ReplicaRouter"]
+
+# Seconds a client that wrote keeps reading from the primary (tracked in a
+# signed cookie and, for signed-in users, a cache entry)
+REPLICA_STICKY_SECONDS = config("REPLICA_STICKY_SECONDS", default=10, cast=int)
+
+# Seconds a replica health check is cached for, shared by every worker
+REPLICA_HEALTH_CHECK_INTERVAL = config("REPLICA_HEALTH_CHECK_INTERVAL", default=5, cast=int)
+
+# PostgreSQL replicas further behind than this are skipped
+REPLICA_MAX_LAG_SECONDS = config("REPLICA_MAX_LAG_SECONDS", default=30, cast=int)
+
+# Cache Configuration
+CACHES = {
+    "default": {
+        "BACKEND": config(
+            "CACHE_BACKEND",
+            default="django.core.cache.backends.locmem.LocMemCache",
+        ),
+        "LOCATION": config("CACHE_LOCATION", default="teampulse"),
+    }
+}
+
+# Whether every worker sees the same cache. Per-process backends never see
+# another worker's invalidations, so the caches that guard access fall back
+# to short TTLs with them.
+CACHE_IS_SHARED = not CACHES["default"]["BACKEND"].endswith(("LocMemCache", "DummyCache"))
+
+# Seconds each worker serves the mood/workload catalogs from memory
+# before revalidating against the cache, where their entries expire after
+# the same time (so per-process caches also catch up)
+CATALOG_CACHE_TTL = config("CATALOG_CACHE_TTL", default=30, cast=int)
+
+# Seconds a user's team ids stay cached; membership signals invalidate
+# entries early, this bounds how long another worker with a per-process
+# cache may still grant access to a team the user has left
+TEAM_MEMBERSHIP_CACHE_TTL = config(
+    "TEAM_MEMBERSHIP_CACHE_TTL", default=300 if CACHE_IS_SHARED else 5, cast=int
+)
+
+# Password hashing. PASSWORD_HASHER=argon2 switches new hashes to Argon2id
+# (requires argon2-cffi); PBKDF2 hashes keep verifying and are upgraded on
+# the next login, as are hashes made with a different cost.
+PASSWORD_HASHER = config("PASSWORD_HASHER", default="pbkdf2")
+PASSWORD_PBKDF2_ITERATIONS = config("PASSWORD_PBKDF2_ITERATIONS", default=1_000_000, cast=int)
+PASSWORD_ARGON2_TIME_COST = config("PASSWORD_ARGON2_TIME_COST", default=2, cast=int)
+PASSWORD_ARGON2_MEMORY_COST = config("PASSWORD_ARGON2_MEMORY_COST", default=102400, cast=int)
+PASSWORD_ARGON2_PARALLELISM = config("PASSWORD_ARGON2_PARALLELISM", default=8, cast=int)
+PASSWORD_HASHERS = [
+    "users.hashers.TunablePBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "users.hashers.TunableArgon2PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+]
+if PASSWORD_HASHER == "argon2":
+    PASSWORD_HASHERS.insert(0, PASSWORD_HASHERS.pop(2))
+
+# Login pipeline: concurrent password hashes per process, attempts allowed
+# to wait for one, and how long a request waits before giving up
+LOGIN_HASH_WORKERS = config("LOGIN_HASH_WORKERS", default=2, cast=int)
+LOGIN_QUEUE_LIMIT = config("LOGIN_QUEUE_LIMIT", default=8, cast=int)
+LOGIN_VERIFY_TIMEOUT = config("LOGIN_VERIFY_TIMEOUT", default=10, cast=int)
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -152,7 +291,7 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # REST Framework Configuration
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "users.authentication.ClaimsJWTAuthentication",
     ),
     "DEFAULT_RENDERER_CLASSES": (
         "rest_framework.renderers.JSONRenderer",
@@ -167,14 +306,99 @@ REST_FRAMEWORK = {
     "DEFAULT_FILTER_BACKENDS": [
         "django_filters.rest_framework.DjangoFilterBackend"
     ],
+    "DEFAULT_THROTTLE_RATES": {
+        "login_ip": config("LOGIN_RATE_IP", default="30/min"),
+        "login_email": config("LOGIN_RATE_EMAIL", default="10/min"),
+    },
 }
 
+# Bulk pulse log ingestion
+PULSE_LOG_BULK_MAX_ITEMS = config("PULSE_LOG_BULK_MAX_ITEMS", default=5000, cast=int)
+PULSE_LOG_BULK_BATCH_SIZE = config("PULSE_LOG_BULK_BATCH_SIZE", default=500, cast=int)
+
+# Keyset pagination used by the pulse log, event log and feedback lists
+KEYSET_PAGINATION_MAX_PAGE_SIZE = config(
+    "KEYSET_PAGINATION_MAX_PAGE_SIZE", default=100, cast=int
+)
+
+# Rows fetched per round trip when streaming CSV/NDJSON exports
+EXPORT_CHUNK_SIZE = config("EXPORT_CHUNK_SIZE", default=2000, cast=int)
+
+# Per-request SQL/timing instrumentation (see app/middleware.py), off
+# unless enabled
+REQUEST_METRICS_ENABLED = config("REQUEST_METRICS_ENABLED", default=False, cast=bool)
+REQUEST_METRICS_SAMPLE_RATE = config("REQUEST_METRICS_SAMPLE_RATE", default=0.1, cast=float)
+REQUEST_METRICS_WINDOW = config("REQUEST_METRICS_WINDOW", default=1000, cast=int)
+REQUEST_METRICS_SLOW_STATEMENTS = config("REQUEST_METRICS_SLOW_STATEMENTS", default=5, cast=int)
+REQUEST_METRICS_N_PLUS_ONE_THRESHOLD = config(
+    "REQUEST_METRICS_N_PLUS_ONE_THRESHOLD", default=5, cast=int
+)
+
+# Seconds each worker may trust a cached token version; saving a user
+# drops the entry so role changes revoke claim-backed tokens, which other
+# workers with a per-process cache only see once their entry expires
+TOKEN_VERSION_CACHE_TTL = config(
+    "TOKEN_VERSION_CACHE_TTL", default=300 if CACHE_IS_SHARED else 5, cast=int
+)
+
+# Cached token blacklist (users/blacklist.py). Rejecting a token blacklisted
+# by another worker relies on a shared cache, so the front is off by default
+# with the per-process LocMemCache.
+TOKEN_BLACKLIST_CACHE = config(
+    "TOKEN_BLACKLIST_CACHE",
+    default=CACHE_IS_SHARED,
+    cast=bool,
+)
+TOKEN_BLACKLIST_BATCH_SIZE = config("TOKEN_BLACKLIST_BATCH_SIZE", default=100, cast=int)
+TOKEN_BLACKLIST_FLUSH_INTERVAL = config("TOKEN_BLACKLIST_FLUSH_INTERVAL", default=5, cast=int)
+TOKEN_BLACKLIST_BLOOM_BITS = config("TOKEN_BLACKLIST_BLOOM_BITS", default=1 << 23, cast=int)
+TOKEN_BLACKLIST_BLOOM_HASHES = config("TOKEN_BLACKLIST_BLOOM_HASHES", default=7, cast=int)
+TOKEN_BLACKLIST_BLOOM_REFRESH = config("TOKEN_BLACKLIST_BLOOM_REFRESH", default=300, cast=int)
+
+# Text search configuration for feedback and pulse log search on
+# PostgreSQL (app/search.py); SQLite uses FTS5 prefix matching instead
+SEARCH_CONFIG = config("SEARCH_CONFIG", default="english")
+
+# Event log retention (logs/partitions.py). On PostgreSQL the table is
+# partitioned by month; archive_event_logs writes months older than the
+# retention to gzipped NDJSON and drops them.
+EVENT_LOG_RETENTION_MONTHS = config("EVENT_LOG_RETENTION_MONTHS", default=12, cast=int)
+EVENT_LOG_PARTITIONS_AHEAD = config("EVENT_LOG_PARTITIONS_AHEAD", default=3, cast=int)
+EVENT_LOG_ARCHIVE_DIR = config(
+    "EVENT_LOG_ARCHIVE_DIR", default=str(BASE_DIR / "archives" / "event_logs")
+)
+EVENT_LOG_DELETE_BATCH_SIZE = config("EVENT_LOG_DELETE_BATCH_SIZE", default=5000, cast=int)
+# Days of events the list endpoint and admin show when no range is given
+EVENT_LOG_LIST_WINDOW_DAYS = config("EVENT_LOG_LIST_WINDOW_DAYS", default=30, cast=int)
+
+# Sentiment and keyword analysis of feedback and pulse comments, run off
+# the request path by tasks on the "analysis" queue (insights/tasks.py)
+# Texts per task
+TEXT_ANALYSIS_BATCH_SIZE = config("TEXT_ANALYSIS_BATCH_SIZE", default=500, cast=int)
+TEXT_ANALYSIS_MAX_ATTEMPTS = config("TEXT_ANALYSIS_MAX_ATTEMPTS", default=3, cast=int)
+TEXT_ANALYSIS_KEYWORDS_PER_TEXT = config("TEXT_ANALYSIS_KEYWORDS_PER_TEXT", default=10, cast=int)
+TEXT_ANALYSIS_TEAM_KEYWORDS = config("TEXT_ANALYSIS_TEAM_KEYWORDS", default=200, cast=int)
+
+# Background task queue (tasks/). Workers are run with run_tasks; with
+# TASKS_EAGER (the default with DEBUG) tasks run in-process after commit
+# instead.
+TASKS_EAGER = config("TASKS_EAGER", default=DEBUG, cast=bool)
+TASK_WORKER_PROCESSES = config("TASK_WORKER_PROCESSES", default=1, cast=int)
+TASK_BATCH_SIZE = config("TASK_BATCH_SIZE", default=10, cast=int)
+TASK_MAX_ATTEMPTS = config("TASK_MAX_ATTEMPTS", default=5, cast=int)
+# Retry n waits about TASK_RETRY_BACKOFF * 2**(n - 1) seconds, capped
+TASK_RETRY_BACKOFF = config("TASK_RETRY_BACKOFF", default=10, cast=float)
+TASK_RETRY_BACKOFF_MAX = config("TASK_RETRY_BACKOFF_MAX", default=3600, cast=float)
+# Running tasks older than this are assumed abandoned and run again
+TASK_STALE_SECONDS = config("TASK_STALE_SECONDS", default=900, cast=int)
+
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=30),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=7),
     "ROTATE_REFRESH_TOKENS": True,
     "BLACKLIST_AFTER_ROTATION": True,
     "UPDATE_LAST_LOGIN": False,
+    "TOKEN_REFRESH_SERIALIZER": "users.tokens.PulseTokenRefreshSerializer",
 }
 
 # Security Settings for Production
@@ -3,18 +3,23 @@ from django.urls import path
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
 from users.views import (
+    LoginMetricsView,
     LoginView,
     LogoutView,
     UserDetailView,
     UserListView,
+    UserMeAsyncView,
     UserMeView,
     UserRegisterView,
  )
 from teams.views import (
     TeamAddMemberView,
+    TeamAsyncListView,
     TeamDetailView,
     TeamListCreateView,
+    TeamParticipationView,
     TeamRemoveMemberView,
+    TeamTrendView,
     PublicTeamListView, 
 )
 from moods.views import MoodDetailView, MoodListCreateView
@@ -22,13 +27,21 @@ from workloads.views import WorkloadDetailView, WorkloadListCreateView
 from logs.views import (
     EventLogDetailView,
     EventLogListCreateView,
+    PulseLogAsyncListView,
+    PulseLogBulkCreateView,
     PulseLogDetailView,
+    PulseLogExportView,
     PulseLogListCreateView,
+    TeamWeeklyPulseListView,
 )
 from feedback.views import (
+    TeamFeedbackAsyncListView,
     TeamFeedbackListCreateView,
     TeamFeedbackDetailView,
+    TeamFeedbackExportView,
 )
+from insights.views import TeamKeywordListView
+from app.views import DatabaseMetricsView, RequestMetricsView
 
 urlpatterns = [
     path("admin/", admin.site.urls),
@@ -46,9 +59,12 @@ urlpatterns = [
 
     # Team endpoints
     path("api/v1/teams/", TeamListCreateView.as_view(), name="team-list-create"),
+    path("api/v1/teams/participation/", TeamParticipationView.as_view(), name="team-participation"),
     path("api/v1/teams/<uuid:id>/", TeamDetailView.as_view(), name="team-detail"),
     path("api/v1/teams/<uuid:id>/add-member/", TeamAddMemberView.as_view(), name="team-add-member"),
     path("api/v1/teams/<uuid:id>/remove-member/", TeamRemoveMemberView.as_view(), name="team-remove-member"),
+    path("api/v1/teams/<uuid:id>/trends/", TeamTrendView.as_view(), name="team-trends"),
+    path("api/v1/teams/<uuid:id>/keywords/", TeamKeywordListView.as_view(), name="team-keywords"),
     path("api/v1/public/teams/", PublicTeamListView.as_view(), name="public-team-list"),
     
     # Mood endpoints
@@ -61,6 +77,9 @@ urlpatterns = [
     
     # Pulse log endpoints
     path("api/v1/pulse-logs/", PulseLogListCreateView.as_view(), name="pulselog-list-create"),
+    path("api/v1/pulse-logs/bulk/", PulseLogBulkCreateView.as_view(), name="pulselog-bulk-create"),
+    path("api/v1/pulse-logs/export/", PulseLogExportView.as_view(), name="pulselog-export"),
+    path("api/v1/pulse-logs/weekly/", TeamWeeklyPulseListView.as_view(), name="pulselog-weekly"),
     path("api/v1/pulse-logs/<uuid:id>/", PulseLogDetailView.as_view(), name="pulselog-detail"),
     
     # Event log endpoints
@@ -69,6 +88,17 @@ urlpatterns = [
 
     # Team feedback endpoints
     path("api/v1/team-feedbacks/", TeamFeedbackListCreateView.as_view(), name="feedback-list-create"),
+    path("api/v1/team-feedbacks/export/", TeamFeedbackExportView.as_view(), name="feedback-export"),
     path("api/v1/team-feedbacks/<uuid:id>/", TeamFeedbackDetailView.as_view(), name="feedback-detail"),
 
+    # Async read endpoints (served concurrently under ASGI)
+    path("api/v1/async/users/me/", UserMeAsyncView.as_view(), name="user-me-async"),
+    path("api/v1/async/teams/", TeamAsyncListView.as_view(), name="team-list-async"),
+    path("api/v1/async/pulse-logs/", PulseLogAsyncListView.as_view(), name="pulselog-list-async"),
+    path("api/v1/async/team-feedbacks/", TeamFeedbackAsyncListView.as_view(), name="feedback-list-async"),
+
+    # Operational endpoints (admin only)
+    path("api/v1/admin/request-metrics/", RequestMetricsView.as_view(), name="request-metrics"),
+    path("api/v1/admin/login-metrics/", LoginMetricsView.as_view(), name="login-metrics"),
+    path("api/v1/admin/database-metrics/", DatabaseMetricsView.as_view(), name="database-metrics"),
 ]
@@ -1,4 +1,5 @@
 from django.contrib import admin
+from django.db.models import Count
 from teams.models import Team
 
 
@@ -9,7 +10,12 @@ class TeamAdmin(admin.ModelAdmin):
     filter_horizontal = ["members"]
     ordering = ["-created_at"]
     
+    def get_queryset(self, request):  # type: ignore[no-untyped-def]
+        return super().get_queryset(request).annotate(
+            member_total=Count("members", distinct=True)
+        )
+    
     def member_count(self, obj) -> int:
-        return obj.members.count()
+        return obj.member_total
     
     member_count.short_description = "Members"
@@ -0,0 +1,81 @@
+from typing import Any, FrozenSet, Iterable, Optional
+from uuid import UUID
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, transaction
+from teams.models import Team
+
+
+def membership_cache_key(user_id: Any) -> str:
+    return f"team-membership:{user_id}"
+
+
+def team_name_cache_key(team_id: Any) -> str:
+    return f"team-name:{team_id}"
+
+
+def user_team_ids(user: Any) -> FrozenSet[UUID]:
+    """
+    Ids of the teams the user belongs to, read from the shared cache
+    (one query on a miss). The miss reads the primary, so a lagging
+    replica can't put stale membership back in the cache.
+    """
+    key = membership_cache_key(user.pk)
+    team_ids = cache.get(key)
+    if team_ids is None:
+        team_ids = frozenset(
+            Team.members.through.objects.using(DEFAULT_DB_ALIAS)
+            .filter(user_id=user.pk)
+            .values_list("team_id", flat=True)
+        )
+        cache.set(key, team_ids, settings.TEAM_MEMBERSHIP_CACHE_TTL)
+    return team_ids
+
+
+def is_team_member(user: Any, team_id: Any) -> bool:
+    if not isinstance(team_id, UUID):
+        try:
+            team_id = UUID(str(team_id))
+        except ValueError:
+            return False
+    return team_id in user_team_ids(user)
+
+
+def invalidate_team_membership(user_ids: Iterable[Any]) -> None:
+    """
+    Drop cached memberships now and again once the transaction commits, so
+    a concurrent request cannot re-cache the pre-commit state.
+    """
+    keys = [membership_cache_key(user_id) for user_id in user_ids]
+    if not keys:
+        return
+    cache.delete_many(keys)
+    transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def team_name(team_id: Any) -> Optional[str]:
+    """
+    A team's name, read from the shared cache (one query on a miss), or
+    None if there is no such team.
+    """
+    key = team_name_cache_key(team_id)
+    name = cache.get(key)
+    if name is None:
+        name = (
+            Team.objects.using(DEFAULT_DB_ALIAS)
+            .filter(pk=team_id)
+            .values_list("team_name", flat=True)
+            .first()
+        )
+        if name is not None:
+            cache.set(key, name, settings.TEAM_MEMBERSHIP_CACHE_TTL)
+    return name
+
+
+def invalidate_team_name(team_id: Any) -> None:
+    """
+    Drop a cached team name now and again once the transaction commits.
+    """
+    key = team_name_cache_key(team_id)
+    cache.delete(key)
+    transaction.on_commit(lambda: cache.delete(key))
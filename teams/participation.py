@@ -0,0 +1,76 @@
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+from django.db.models import Count, F
+from logs.models import PulseLog
+from teams.models import Team
+
+Week = Tuple[int, int]
+
+
+def member_logs(team_ids: Iterable[Any], year: int, week_indexes: Sequence[int]) -> Any:
+    """
+    Logs filed against a team by one of its members in the given weeks.
+    The membership join is on the teams_members through table.
+    """
+    return PulseLog.objects.filter(
+        team_id__in=team_ids,
+        team__members=F("user_id"),
+        year=year,
+        week_index__in=week_indexes,
+    ).order_by()
+
+
+def team_participation(
+    teams: Sequence[Team], year: int, week_indexes: Sequence[int], include_missing: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Participation of each team (annotated with member_count) in each week.
+    Costs one grouped query for the participant counts, plus two when the
+    missing members are requested, however many teams and weeks.
+    """
+    team_ids = [team.id for team in teams]
+    participants: Dict[Tuple[Any, int, int], int] = {
+        (row["team_id"], row["year"], row["week_index"]): row["participants"]
+        for row in member_logs(team_ids, year, week_indexes)
+        .values("team_id", "year", "week_index")
+        .annotate(participants=Count("user_id", distinct=True))
+    }
+    
+    members: Dict[Any, List[Dict[str, Any]]] = defaultdict(list)
+    logged: Dict[Tuple[Any, int, int], set] = defaultdict(set)
+    if include_missing:
+        for team_id, user_id, username, email in (
+            Team.members.through.objects.filter(team_id__in=team_ids)
+            .order_by("user__username")
+            .values_list("team_id", "user_id", "user__username", "user__email")
+        ):
+            members[team_id].append({"id": str(user_id), "username": username, "email": email})
+        for team_id, log_year, week_index, user_id in (
+            member_logs(team_ids, year, week_indexes)
+            .values_list("team_id", "year", "week_index", "user_id")
+            .distinct()
+        ):
+            logged[(team_id, log_year, week_index)].add(str(user_id))
+    
+    rows = []
+    for team in teams:
+        for week_index in week_indexes:
+            key = (team.id, year, week_index)
+            count = participants.get(key, 0)
+            row = {
+                "team_id": str(team.id),
+                "team_name": team.team_name,
+                "year": year,
+                "week_index": week_index,
+                "member_count": team.member_count,
+                "participants": count,
+                "participation_rate": (
+                    round(count / team.member_count, 4) if team.member_count else None
+                ),
+            }
+            if include_missing:
+                row["missing_members"] = [
+                    member for member in members[team.id] if member["id"] not in logged[key]
+                ]
+            rows.append(row)
+    return rows
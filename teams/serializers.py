@@ -1,6 +1,8 @@
 from typing import Any
 from rest_framework import serializers
+from app.serializers import DynamicFieldsModelSerializer
 from teams.models import Team
+from users.serializers import UserSerializer, UserSummarySerializer
 
 
 class PublicTeamSerializer(serializers.ModelSerializer):
@@ -10,17 +12,18 @@ class PublicTeamSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = Team
-        fields = ("id", "name")
+        fields = ("id", "name", "team_name")
         read_only_fields = ("id",)
 
 
-class TeamSerializer(serializers.ModelSerializer):
-
-    from users.serializers import UserSerializer
-    
+class TeamSerializer(DynamicFieldsModelSerializer):
+    """
+    Team with a slim member list.
+    Pass expand_members=True to render members with the full UserSerializer.
+    """
     id = serializers.CharField(read_only=True)
     team_name = serializers.CharField(max_length=255)
-    members = UserSerializer(many=True, read_only=True)
+    members = UserSummarySerializer(many=True, read_only=True)
     member_count = serializers.SerializerMethodField()
     
     class Meta:
@@ -28,7 +31,19 @@ class TeamSerializer(serializers.ModelSerializer):
         fields = ("id", "team_name", "members", "member_count", "created_at")
         read_only_fields = ("id", "created_at")
     
+    def __init__(
+        self, *args: Any, expand_members: bool = False, **kwargs: Any
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        if expand_members and "members" in self.fields:
+            self.fields["members"] = UserSerializer(many=True, read_only=True)
+    
     def get_member_count(self, obj: Any) -> int:
+        """
+        Use the annotated count when the queryset provides one
+        """
+        if hasattr(obj, "member_count"):
+            return obj.member_count
         return obj.members.count()
 
 
@@ -47,4 +62,54 @@ class TeamUpdateSerializer(serializers.ModelSerializer):
 
 class TeamMemberSerializer(serializers.Serializer):
     user_id = serializers.UUIDField()
-    
\ No newline at end of file
+
+
+class TeamTrendQuerySerializer(serializers.Serializer):
+    start = serializers.DateField(required=False)
+    end = serializers.DateField(required=False)
+    bucket = serializers.ChoiceField(choices=("day", "week", "month"), default="week")
+    time_field = serializers.ChoiceField(
+        choices=("timestamp", "timestamp_local"), default="timestamp"
+    )
+    percentiles = serializers.CharField(required=False, default="25,75,90")
+    
+    def validate_percentiles(self, value: str) -> list:
+        """
+        Parse a comma separated list of percentiles between 0 and 100
+        """
+        try:
+            percentiles = [float(p) for p in value.split(",") if p.strip()]
+        except ValueError:
+            raise serializers.ValidationError("Percentiles must be numbers")
+        if len(percentiles) > 10:
+            raise serializers.ValidationError("At most 10 percentiles are allowed")
+        if any(p < 0 or p > 100 for p in percentiles):
+            raise serializers.ValidationError("Percentiles must be between 0 and 100")
+        return percentiles
+    
+    def validate(self, attrs: Any) -> Any:
+        start, end = attrs.get("start"), attrs.get("end")
+        if start and end and start > end:
+            raise serializers.ValidationError(
+                {"end": "End date must not be before start date"}
+            )
+        return attrs
+
+
+class TeamParticipationQuerySerializer(serializers.Serializer):
+    year = serializers.IntegerField(required=False, min_value=1)
+    week_index = serializers.IntegerField(required=False, min_value=1, max_value=53)
+    team = serializers.UUIDField(required=False)
+    include = serializers.CharField(required=False, default="")
+    
+    def validate_include(self, value: str) -> list:
+        """
+        Parse a comma separated list of optional sections
+        """
+        sections = [section.strip() for section in value.split(",") if section.strip()]
+        unknown = set(sections) - {"missing"}
+        if unknown:
+            raise serializers.ValidationError(
+                f"Unknown sections: {', '.join(sorted(unknown))}"
+            )
+        return sections
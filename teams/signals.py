@@ -0,0 +1,71 @@
+from typing import Any
+from django.contrib.auth import get_user_model
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+from django.utils import timezone
+from teams.membership import invalidate_team_membership, invalidate_team_name
+from teams.models import Team
+
+User = get_user_model()
+
+
+@receiver(m2m_changed, sender=Team.members.through)
+def touch_membership_timestamps(
+    sender: Any, instance: Any, action: str, reverse: bool, pk_set: Any, **kwargs: Any
+) -> None:
+    """
+    Bump updated_at on both sides of a membership change so ETags that
+    include member lists or team names change with it.
+    """
+    if action == "pre_clear":
+        related = instance.teams if reverse else instance.members
+        instance._cleared_pks = set(related.values_list("pk", flat=True))
+        return
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if action == "post_clear":
+        pk_set = getattr(instance, "_cleared_pks", set())
+    
+    now = timezone.now()
+    type(instance).objects.filter(pk=instance.pk).update(updated_at=now)
+    related_model = Team if reverse else User
+    if pk_set:
+        related_model.objects.filter(pk__in=pk_set).update(updated_at=now)
+
+
+@receiver(m2m_changed, sender=Team.members.through)
+def invalidate_membership_cache(
+    sender: Any, instance: Any, action: str, reverse: bool, pk_set: Any, **kwargs: Any
+) -> None:
+    """
+    Keep the per-user team id cache coherent with membership changes.
+    Runs after touch_membership_timestamps, which records cleared pks.
+    """
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if reverse:
+        invalidate_team_membership([instance.pk])
+        return
+    if action == "post_clear":
+        pk_set = getattr(instance, "_cleared_pks", set())
+    invalidate_team_membership(pk_set or [])
+
+
+@receiver(pre_delete, sender=Team)
+def remember_team_members(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """
+    Deleting a team cascades through the membership table without
+    m2m_changed, so collect the members first.
+    """
+    instance._member_pks = list(instance.members.values_list("pk", flat=True))
+
+
+@receiver(post_delete, sender=Team)
+def invalidate_deleted_team_membership(sender: Any, instance: Any, **kwargs: Any) -> None:
+    invalidate_team_membership(getattr(instance, "_member_pks", []))
+
+
+@receiver(post_save, sender=Team)
+@receiver(post_delete, sender=Team)
+def invalidate_cached_team_name(sender: Any, instance: Any, **kwargs: Any) -> None:
+    invalidate_team_name(instance.pk)
@@ -1,3 +1,302 @@
-from django.test import TestCase
+import time
+from datetime import datetime, timezone
+from unittest import mock
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from app.testing import APITestCase, create_admin, create_user
+from feedback.models import TeamFeedback
+from logs.models import PulseLog
+from teams.membership import team_name, user_team_ids
+from teams.models import Team
 
-# Create your tests here.
+
+class TeamTrendTests(APITestCase):
+    def setUp(self) -> None:
+        self.user = create_user()
+        self.team = Team.objects.create(team_name="Core")
+        self.team.members.add(self.user)
+        self.client.force_authenticate(self.user)
+        for day, mood, workload in [(3, 1, 5), (3, 3, 3), (3, 5, 1), (4, 4, 2), (20, 2, 2)]:
+            log = PulseLog.objects.create(user=self.user, team=self.team, mood=mood, workload=workload)
+            PulseLog.objects.filter(pk=log.pk).update(
+                timestamp=datetime(2025, 3, day, 12, tzinfo=timezone.utc)
+            )
+    
+    def trends(self, **params: str) -> list:
+        response = self.client.get(f"/api/v1/teams/{self.team.id}/trends/", params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()["results"]
+    
+    def test_daily_buckets_summarise_each_day(self) -> None:
+        results = self.trends(bucket="day", start="2025-03-01", end="2025-03-10", percentiles="50,90")
+        self.assertEqual([row["bucket"][:10] for row in results], ["2025-03-03", "2025-03-04"])
+        first = results[0]
+        self.assertEqual(first["log_count"], 3)
+        self.assertEqual(first["mood"]["mean"], 3.0)
+        self.assertEqual(first["mood"]["median"], 3.0)
+        self.assertEqual(first["mood"]["percentiles"], {"50": 3.0, "90": 4.6})
+        self.assertEqual(first["mood"]["histogram"], {"1": 1, "3": 1, "5": 1})
+        self.assertEqual(first["workload"]["mean"], 3.0)
+    
+    def test_monthly_buckets_cover_the_range(self) -> None:
+        results = self.trends(bucket="month")
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]["log_count"], 5)
+        self.assertEqual(results[0]["mood"]["mean"], 3.0)
+    
+    def test_rejects_invalid_parameters(self) -> None:
+        url = f"/api/v1/teams/{self.team.id}/trends/"
+        self.assertEqual(self.client.get(url, {"percentiles": "150"}).status_code, 400)
+        self.assertEqual(
+            self.client.get(url, {"start": "2025-03-10", "end": "2025-03-01"}).status_code, 400
+        )
+        self.assertEqual(self.client.get(url, {"bucket": "year"}).status_code, 400)
+    
+    def test_requires_membership(self) -> None:
+        self.team.members.remove(self.user)
+        response = self.client.get(f"/api/v1/teams/{self.team.id}/trends/")
+        self.assertEqual(response.status_code, 403)
+    
+
+    def test_async_list_matches_the_sync_list(self) -> None:
+        Team.objects.create(team_name="Platform")
+        response = self.client.get("/api/v1/async/teams/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), self.client.get("/api/v1/teams/").json())
+
+
+class TeamListQueryBudgetTests(APITestCase):
+    def setUp(self) -> None:
+        self.user = create_user("viewer")
+        self.client.force_authenticate(self.user)
+        self.user_count = 0
+    
+    def create_teams(self, count: int, members_per_team: int) -> None:
+        for _ in range(count):
+            team = Team.objects.create(team_name=f"Team {Team.objects.count()}")
+            for _ in range(members_per_team):
+                self.user_count += 1
+                member = create_user(f"member{self.user_count}")
+                team.members.add(member)
+    
+    def count_queries(self, url: str) -> int:
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+    
+    def assert_constant_queries(self, url: str) -> None:
+        self.create_teams(2, 2)
+        small = self.count_queries(url)
+        self.create_teams(6, 5)
+        self.assertEqual(self.count_queries(url), small)
+    
+    def test_team_list_queries_do_not_grow_with_teams_or_members(self) -> None:
+        self.assert_constant_queries("/api/v1/teams/")
+    
+    def test_expanded_members_queries_do_not_grow(self) -> None:
+        self.assert_constant_queries("/api/v1/teams/?expand=members")
+    
+    def test_member_count_is_annotated(self) -> None:
+        self.create_teams(1, 3)
+        response = self.client.get("/api/v1/teams/")
+        team = response.json()["results"][0]
+        self.assertEqual(team["member_count"], 3)
+        self.assertEqual(
+            set(team["members"][0]),
+            {"id", "username", "email", "first_name", "last_name"},
+        )
+    
+    def test_fields_param_limits_output(self) -> None:
+        self.create_teams(1, 1)
+        response = self.client.get("/api/v1/teams/?fields=id,team_name")
+        self.assertEqual(set(response.json()["results"][0]), {"id", "team_name"})
+    
+    def test_public_list_hides_members(self) -> None:
+        self.create_teams(1, 2)
+        self.client.force_authenticate(None)
+        response = self.client.get("/api/v1/public/teams/")
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("members", response.json()["results"][0])
+
+
+class TeamMembershipCacheTests(APITestCase):
+    def setUp(self) -> None:
+        self.user = create_user()
+        self.team = Team.objects.create(team_name="Core")
+    
+    def test_cache_follows_membership_changes(self) -> None:
+        self.assertEqual(user_team_ids(self.user), frozenset())
+        self.team.members.add(self.user)
+        self.assertEqual(user_team_ids(self.user), frozenset({self.team.id}))
+        self.user.teams.remove(self.team)
+        self.assertEqual(user_team_ids(self.user), frozenset())
+        self.team.members.add(self.user)
+        self.team.members.clear()
+        self.assertEqual(user_team_ids(self.user), frozenset())
+        self.team.members.add(self.user)
+        self.team.delete()
+        self.assertEqual(user_team_ids(self.user), frozenset())
+    
+    def test_removed_members_lose_access(self) -> None:
+        admin = create_user("admin", is_staff=True)
+        self.team.members.add(self.user)
+        feedback = TeamFeedback.objects.create(user=admin, team=self.team, message="Ship it")
+        trends_url = f"/api/v1/teams/{self.team.id}/trends/"
+        self.client.force_authenticate(self.user)
+        self.assertEqual(self.client.get(trends_url).status_code, 200)
+        feedback_ids = [row["id"] for row in self.client.get("/api/v1/team-feedbacks/").json()["results"]]
+        self.assertEqual(feedback_ids, [str(feedback.id)])
+        
+        self.client.force_authenticate(admin)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                f"/api/v1/teams/{self.team.id}/remove-member/", {"user_id": str(self.user.id)}
+            )
+        self.assertEqual(response.status_code, 200)
+        
+        self.client.force_authenticate(self.user)
+        self.assertEqual(self.client.get(trends_url).status_code, 403)
+        self.assertEqual(self.client.get("/api/v1/team-feedbacks/").json()["results"], [])
+    
+    @override_settings(TEAM_MEMBERSHIP_CACHE_TTL=5)
+    def test_stale_entries_expire(self) -> None:
+        # Another worker with a per-process cache misses the invalidation
+        self.team.members.add(self.user)
+        user_team_ids(self.user)
+        Team.members.through.objects.filter(user_id=self.user.pk).delete()
+        self.assertEqual(user_team_ids(self.user), frozenset({self.team.id}))
+        with mock.patch("time.time", return_value=time.time() + 6):
+            self.assertEqual(user_team_ids(self.user), frozenset())
+    
+    def test_feedback_create_uses_cached_membership(self) -> None:
+        self.team.members.add(self.user)
+        self.client.force_authenticate(self.user)
+        user_team_ids(self.user)
+        team_name(self.team.id)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(
+                "/api/v1/team-feedbacks/", {"message": "Shipping went well"}
+            )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()["team_name"], "Core")
+        # The feedback and its analysis task
+        self.assertEqual(len(queries), 2)
+    
+    def test_feedback_defaults_to_the_lowest_team_id(self) -> None:
+        other = Team.objects.create(team_name="Platform")
+        self.team.members.add(self.user)
+        other.members.add(self.user)
+        first = min((self.team, other), key=lambda team: team.pk)
+        self.assertEqual(self.user.teams.first(), first)
+        self.client.force_authenticate(self.user)
+        response = self.client.post("/api/v1/team-feedbacks/", {"message": "Shipping went well"})
+        self.assertEqual(response.json()["team_name"], first.team_name)
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            first.team_name = "Renamed"
+            first.save()
+        self.assertEqual(team_name(first.pk), "Renamed")
+
+
+class TeamETagTests(APITestCase):
+    def setUp(self) -> None:
+        self.admin = create_user("admin", is_staff=True)
+        self.first = create_user("first")
+        self.second = create_user("second")
+        self.team = Team.objects.create(team_name="Core")
+        self.team.members.add(self.first, self.second)
+        self.client.force_authenticate(self.admin)
+        self.urls = [f"/api/v1/teams/{self.team.id}/"]
+    
+    def etags(self) -> list:
+        etags = []
+        for url in self.urls:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"]).status_code, 304)
+            etags.append(response["ETag"])
+        return etags
+    
+    def assert_etags_change(self, before: list) -> list:
+        after = self.etags()
+        for old, new in zip(before, after):
+            self.assertNotEqual(old, new)
+        return after
+    
+    def test_lists_are_not_conditional(self) -> None:
+        self.assertNotIn("ETag", self.client.get("/api/v1/teams/"))
+    
+    def test_etag_follows_related_rows(self) -> None:
+        etags = self.etags()
+        self.assertEqual(self.etags(), etags)
+        
+        self.first.username = "renamed"
+        self.first.save()
+        etags = self.assert_etags_change(etags)
+        
+        self.team.members.remove(self.second)
+        etags = self.assert_etags_change(etags)
+        
+        self.team.members.add(self.second)
+        etags = self.assert_etags_change(etags)
+        
+        # Not the latest updated member, and deleted without m2m_changed
+        self.first.delete()
+        self.assert_etags_change(etags)
+
+
+class TeamParticipationTests(APITestCase):
+    def setUp(self) -> None:
+        self.admin = create_admin()
+        self.client.force_authenticate(self.admin)
+        self.year, self.week_index = PulseLog.current_week()
+    
+    def create_team(self, members: int, logged: int) -> Team:
+        team = Team.objects.create(team_name=f"Team {Team.objects.count()}")
+        for index in range(members):
+            member = create_user(f"{team.team_name}-{index}", email=f"{team.id}-{index}@example.com")
+            team.members.add(member)
+            if index < logged:
+                PulseLog.objects.create(user=member, team=team, mood=3, workload=3)
+        return team
+    
+    def test_participation_counts_members_who_logged(self) -> None:
+        team = self.create_team(members=3, logged=2)
+        outsider = create_user("outsider")
+        PulseLog.objects.create(user=outsider, team=team, mood=3, workload=3)
+        
+        response = self.client.get(
+            "/api/v1/teams/participation/", {"include": "missing"}
+        )
+        self.assertEqual(response.status_code, 200)
+        row = response.json()["results"][0]
+        self.assertEqual(row["member_count"], 3)
+        self.assertEqual(row["participants"], 2)
+        self.assertEqual(row["participation_rate"], 0.6667)
+        self.assertEqual(
+            [member["username"] for member in row["missing_members"]],
+            [f"{team.team_name}-2"],
+        )
+    
+    def test_query_count_does_not_grow_with_teams(self) -> None:
+        def count_queries() -> int:
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(
+                    "/api/v1/teams/participation/", {"include": "missing"}
+                )
+            self.assertEqual(response.status_code, 200)
+            return len(queries)
+        
+        self.create_team(members=2, logged=1)
+        baseline = count_queries()
+        for _ in range(5):
+            self.create_team(members=3, logged=2)
+        self.assertEqual(count_queries(), baseline)
+    
+    def test_requires_admin(self) -> None:
+        member = create_user()
+        self.client.force_authenticate(member)
+        response = self.client.get("/api/v1/teams/participation/")
+        self.assertEqual(response.status_code, 403)
@@ -0,0 +1,117 @@
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+from django.db.models import Count
+from django.db.models.functions import TruncDay, TruncMonth, TruncWeek
+from django.utils import timezone
+from logs.models import PulseLog
+
+BUCKET_FUNCTIONS = {
+    "day": TruncDay,
+    "week": TruncWeek,
+    "month": TruncMonth,
+}
+
+METRICS = ("mood", "workload")
+
+
+def _value_at(histogram: Sequence[tuple], rank: int) -> int:
+    """
+    Return the value at the given 0-based rank of a sorted (value, count)
+    histogram.
+    """
+    seen = 0
+    for value, count in histogram:
+        seen += count
+        if rank < seen:
+            return value
+    return histogram[-1][0]
+
+
+def percentile(histogram: Sequence[tuple], total: int, pct: float) -> Optional[float]:
+    """
+    Linearly interpolated percentile of a sorted (value, count) histogram.
+    """
+    if not total:
+        return None
+    position = (total - 1) * pct / 100
+    lower = int(position)
+    upper = min(lower + 1, total - 1)
+    low_value = _value_at(histogram, lower)
+    high_value = _value_at(histogram, upper)
+    return low_value + (high_value - low_value) * (position - lower)
+
+
+def summarize(counts: Dict[int, int], percentiles: Iterable[float]) -> Dict[str, Any]:
+    histogram = sorted(counts.items())
+    total = sum(counts.values())
+    mean = sum(value * count for value, count in histogram) / total if total else None
+    return {
+        "mean": mean,
+        "median": percentile(histogram, total, 50),
+        "percentiles": {
+            f"{pct:g}": percentile(histogram, total, pct)
+            for pct in percentiles
+        },
+        "histogram": {str(value): count for value, count in histogram},
+    }
+
+
+def team_trends(
+    team: Any,
+    bucket: str,
+    time_field: str,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    percentiles: Iterable[float] = (25, 75, 90),
+) -> List[Dict[str, Any]]:
+    """
+    Bucketed mood and workload statistics for a team.
+    The database groups logs by (bucket, mood, workload) in a single query;
+    means, medians and percentiles are then derived from the resulting
+    histograms, so the work in Python is proportional to the number of
+    buckets and distinct values rather than the number of logs.
+    """
+    queryset = PulseLog.objects.filter(team=team)
+    if time_field != "timestamp":
+        queryset = queryset.filter(**{f"{time_field}__isnull": False})
+    if start:
+        queryset = queryset.filter(
+            **{f"{time_field}__gte": timezone.make_aware(datetime.combine(start, time.min))}
+        )
+    if end:
+        queryset = queryset.filter(
+            **{
+                f"{time_field}__lt": timezone.make_aware(
+                    datetime.combine(end + timedelta(days=1), time.min)
+                )
+            }
+        )
+    
+    rows = (
+        queryset.order_by()
+        .annotate(bucket=BUCKET_FUNCTIONS[bucket](time_field))
+        .values("bucket", "mood", "workload")
+        .annotate(count=Count("id"))
+        .order_by("bucket")
+    )
+    
+    histograms: Dict[Any, Dict[str, Dict[int, int]]] = defaultdict(
+        lambda: {metric: defaultdict(int) for metric in METRICS}
+    )
+    for row in rows:
+        for metric in METRICS:
+            histograms[row["bucket"]][metric][row[metric]] += row["count"]
+    
+    percentiles = list(percentiles)
+    return [
+        {
+            "bucket": bucket_start,
+            "log_count": sum(metrics["mood"].values()),
+            **{
+                metric: summarize(metrics[metric], percentiles)
+                for metric in METRICS
+            },
+        }
+        for bucket_start, metrics in histograms.items()
+    ]
@@ -1,49 +1,111 @@
 from typing import Any
 from django.contrib.auth import get_user_model
+from django.db.models import Count, Prefetch
 from django.shortcuts import get_object_or_404
 from rest_framework import generics, status
+from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from app.async_views import AsyncListView
+from app.conditional import ConditionalGetMixin
+from app.replicas import ReplicaReadMixin
+from logs.models import PulseLog
+from teams.membership import is_team_member
 from teams.models import Team
+from teams.participation import team_participation
 from teams.serializers import (
+    PublicTeamSerializer,
     TeamMemberSerializer,
+    TeamParticipationQuerySerializer,
     TeamSerializer,
+    TeamTrendQuerySerializer,
     TeamUpdateSerializer,
 )
+from teams.trends import team_trends
 from users.permissions import IsAdminUser
 
 User = get_user_model()
 
+class TeamQuerysetMixin:
+    """
+    Builds team querysets with a fixed number of queries.
+    - `?fields=id,team_name` limits the rendered fields
+    - `?expand=members` renders members with the full user serializer
+    Member counts are annotated and members (plus their teams when expanded)
+    are prefetched only when they are rendered.
+    """
+    
+    def get_requested_fields(self):  # type: ignore[no-untyped-def]
+        fields = self.request.query_params.get("fields")
+        if not fields:
+            return None
+        return [field.strip() for field in fields.split(",") if field.strip()]
+    
+    def expand_members(self) -> bool:
+        expand = self.request.query_params.get("expand", "")
+        return "members" in expand.split(",")
+    
+    def get_queryset(self):  # type: ignore[no-untyped-def]
+        fields = self.get_requested_fields()
+        queryset = Team.objects.all()
+        
+        if fields is None or "member_count" in fields:
+            queryset = queryset.annotate(
+                member_count=Count("members", distinct=True)
+            )
+        if fields is None or "members" in fields:
+            if self.expand_members():
+                members = User.objects.prefetch_related("teams")
+            else:
+                members = User.objects.only(
+                    "id", "username", "email", "first_name", "last_name"
+                )
+            queryset = queryset.prefetch_related(
+                Prefetch("members", queryset=members)
+            )
+        return queryset
+    
+    def get_serializer(self, *args, **kwargs):  # type: ignore[no-untyped-def]
+        if self.get_serializer_class() is TeamSerializer:
+            kwargs.setdefault("fields", self.get_requested_fields())
+            kwargs.setdefault("expand_members", self.expand_members())
+        return super().get_serializer(*args, **kwargs)
+
+
 class PublicTeamListView(generics.ListAPIView):
     """
     Public endpoint to list all teams (for signup page).
-    No authentication required.
+    No authentication required. Members are never exposed.
     """
-    serializer_class = TeamSerializer
+    serializer_class = PublicTeamSerializer
     permission_classes = (AllowAny,)
-    queryset = Team.objects.all()
-class TeamListCreateView(generics.ListCreateAPIView):
+    queryset = Team.objects.only("id", "team_name")
+
+
+class TeamListCreateView(TeamQuerysetMixin, generics.ListCreateAPIView):
     """
     List all teams (authenticated users) or create a new team (admin only).
     """
     serializer_class = TeamSerializer
     permission_classes = (IsAuthenticated,)
-    queryset = Team.objects.prefetch_related("members").all()
     
     def get_permissions(self):  # type: ignore[no-untyped-def]
         if self.request.method == "POST":
             return [IsAdminUser()]
         return [IsAuthenticated()]
 
-class TeamDetailView(generics.RetrieveUpdateDestroyAPIView):
+class TeamDetailView(
+    ConditionalGetMixin, TeamQuerysetMixin, generics.RetrieveUpdateDestroyAPIView
+):
     """
     Retrieve (authenticated users), update or delete a team (admin only).
     """
-    queryset = Team.objects.prefetch_related("members").all()
     permission_classes = (IsAuthenticated,)
     lookup_field = "id"
+    conditional_fields = ("updated_at", "members__updated_at")
+    conditional_counts = ("members",)
     
     def get_serializer_class(self):  # type: ignore[no-untyped-def]
         if self.request.method in ["PUT", "PATCH", "DELETE"]:
@@ -56,6 +118,13 @@ class TeamDetailView(generics.RetrieveUpdateDestroyAPIView):
         return [IsAuthenticated()]
 
 
+class TeamAsyncListView(AsyncListView):
+    """
+    Async variant of the team list for ASGI deployments.
+    """
+    view_class = TeamListCreateView
+
+
 class TeamAddMemberView(APIView):
     """
     Add a member to a team (admin only).
@@ -94,3 +163,96 @@ class TeamRemoveMemberView(APIView):
         return Response(
             {"status": "member removed"}, status=status.HTTP_200_OK
         )
+
+
+class TeamTrendView(ReplicaReadMixin, APIView):
+    """
+    Mood and workload trends for a team, bucketed by day, week or month.
+    - Members of the team and admins can view trends
+    - Statistics are aggregated in the database in a single query
+    """
+    permission_classes = (IsAuthenticated,)
+    
+    def get(self, request: Request, id: str) -> Response:
+        team = get_object_or_404(Team, id=id)
+        if not request.user.is_staff and not is_team_member(request.user, team.id):
+            return Response(
+                {"error": "You are not a member of this team"},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+        
+        serializer = TeamTrendQuerySerializer(data=request.query_params.dict())
+        serializer.is_valid(raise_exception=True)
+        params = serializer.validated_data
+        
+        buckets = team_trends(
+            team,
+            bucket=params["bucket"],
+            time_field=params["time_field"],
+            start=params.get("start"),
+            end=params.get("end"),
+            percentiles=params["percentiles"],
+        )
+        
+        return Response(
+            {
+                "team_id": str(team.id),
+                "team_name": team.team_name,
+                "bucket": params["bucket"],
+                "results": buckets,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
+class TeamParticipationPagination(PageNumberPagination):
+    page_size = 100
+    page_size_query_param = "page_size"
+    max_page_size = 1000
+
+
+class TeamParticipationView(ReplicaReadMixin, generics.GenericAPIView):
+    """
+    Share of each team's members who logged a pulse, per ISO week (admin only).
+    - `?year=&week_index=` selects one week (default: the current week);
+      `?year=` alone covers every week of that year with logs
+    - `?team=<id>` limits the report to one team
+    - `?include=missing` lists the members who have not logged
+    Teams are paginated; each page costs a fixed number of queries.
+    """
+    permission_classes = (IsAdminUser,)
+    pagination_class = TeamParticipationPagination
+    
+    def get_queryset(self):  # type: ignore[no-untyped-def]
+        return Team.objects.annotate(
+            member_count=Count("members", distinct=True)
+        ).order_by("team_name", "id")
+    
+    def get(self, request: Request) -> Response:
+        serializer = TeamParticipationQuerySerializer(data=request.query_params.dict())
+        serializer.is_valid(raise_exception=True)
+        params = serializer.validated_data
+        
+        current_year, current_week = PulseLog.current_week()
+        year = params.get("year", current_year)
+        if "week_index" in params:
+            week_indexes = [params["week_index"]]
+        elif "year" in params:
+            week_indexes = list(
+                PulseLog.objects.filter(year=year)
+                .order_by("week_index")
+                .values_list("week_index", flat=True)
+                .distinct()
+            )
+        else:
+            week_indexes = [current_week]
+        
+        queryset = self.get_queryset()
+        if "team" in params:
+            queryset = queryset.filter(id=params["team"])
+        teams = self.paginate_queryset(queryset)
+        
+        rows = team_participation(
+            teams, year, week_indexes, include_missing="missing" in params["include"]
+        )
+        return self.get_paginated_response(rows)
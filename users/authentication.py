@@ -0,0 +1,112 @@
+from typing import Any, FrozenSet, Optional, Tuple
+from uuid import UUID
+from django.contrib.auth import get_user_model
+from django.utils.functional import cached_property
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.request import Request
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+from users.tokens import TOKEN_VERSION_CLAIM, current_token_version
+
+
+class ClaimsTokenUser(TokenUser):
+    """
+    User backed by access token claims.
+    Exposes what permission checks and queryset scoping need; any other
+    attribute loads the full user row once and is read from it.
+    """
+    
+    @cached_property
+    def id(self) -> UUID:  # type: ignore[override]
+        return UUID(str(self.token[api_settings.USER_ID_CLAIM]))
+    
+    @cached_property
+    def pk(self) -> UUID:  # type: ignore[override]
+        return self.id
+    
+    @cached_property
+    def is_active(self) -> bool:  # type: ignore[override]
+        return bool(self.token.get("is_active", False))
+    
+    @cached_property
+    def username(self) -> str:  # type: ignore[override]
+        return self.user.username
+    
+    @cached_property
+    def team_ids(self) -> FrozenSet[UUID]:
+        """
+        Team ids as of token issue; authorization reads the membership
+        cache, which follows changes immediately.
+        """
+        return frozenset(UUID(team_id) for team_id in self.token.get("teams", []))
+    
+    @cached_property
+    def user(self) -> Any:
+        return get_user_model().objects.get(pk=self.pk)
+    
+    async def aload_user(self) -> Any:
+        """
+        The full user row, loaded with the async ORM (async views can't
+        trigger the lazy load).
+        """
+        if "user" not in self.__dict__:
+            self.__dict__["user"] = await get_user_model().objects.aget(pk=self.pk)
+        return self.user
+    
+    def __getattr__(self, attr: str) -> Any:
+        if attr.startswith("_") or attr in ("token", "user"):
+            raise AttributeError(attr)
+        return getattr(self.user, attr)
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that skips the user query on read requests.
+    - Safe methods get a ClaimsTokenUser built from the token's claims; the
+      token version is checked against a cached copy so role changes revoke
+      older tokens
+    - Writes, and tokens issued without claims, load the user row as before
+    """
+    
+    def authenticate(self, request: Request) -> Optional[Tuple[Any, Any]]:
+        header = self.get_header(request)
+        if header is None:
+            return None
+        
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+        
+        validated_token = self.get_validated_token(raw_token)
+        if request.method in SAFE_METHODS and TOKEN_VERSION_CLAIM in validated_token:
+            return self.get_token_user(validated_token), validated_token
+        return self.get_user(validated_token), validated_token
+    
+    def get_token_user(self, validated_token: Any) -> ClaimsTokenUser:
+        if api_settings.USER_ID_CLAIM not in validated_token:
+            raise InvalidToken("Token contained no recognizable user identification")
+        
+        user = ClaimsTokenUser(validated_token)
+        version = current_token_version(user.pk)
+        if version is None:
+            raise AuthenticationFailed("User not found", code="user_not_found")
+        self.check_token_version(validated_token, version)
+        if not user.is_active:
+            raise AuthenticationFailed("User is inactive", code="user_inactive")
+        return user
+    
+    def get_user(self, validated_token: Any) -> Any:
+        user = super().get_user(validated_token)
+        if TOKEN_VERSION_CLAIM in validated_token:
+            self.check_token_version(validated_token, user.token_version)
+        return user
+    
+    @staticmethod
+    def check_token_version(validated_token: Any, version: int) -> None:
+        if validated_token[TOKEN_VERSION_CLAIM] != version:
+            raise AuthenticationFailed(
+                "Token was issued before a role change; refresh it",
+                code="token_version_stale",
+            )
@@ -0,0 +1,194 @@
+import atexit
+import hashlib
+import logging
+import threading
+import time
+from datetime import datetime, timezone as dt_timezone
+from typing import Any, Dict, Optional, Set
+from uuid import UUID
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def blacklist_cache_key(jti: str) -> str:
+    return f"token-blacklist:{jti}"
+
+
+class BloomFilter:
+    """
+    Fixed-size bloom filter over strings (double hashing on one blake2b
+    digest).
+    """
+    
+    def __init__(self, bits: int, hashes: int) -> None:
+        self.bits = bits
+        self.hashes = hashes
+        self.array = bytearray(bits // 8 + 1)
+    
+    def positions(self, value: str):  # type: ignore[no-untyped-def]
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        step = int.from_bytes(digest[8:], "little") | 1
+        return [(first + index * step) % self.bits for index in range(self.hashes)]
+    
+    def add(self, value: str) -> None:
+        for position in self.positions(value):
+            self.array[position >> 3] |= 1 << (position & 7)
+    
+    def __contains__(self, value: str) -> bool:
+        return all(
+            self.array[position >> 3] & (1 << (position & 7))
+            for position in self.positions(value)
+        )
+
+
+class TokenBlacklist:
+    """
+    Front for simplejwt's OutstandingToken/BlacklistedToken tables.
+    Checks, cheapest first:
+    - a shared cache entry written when the token is blacklisted
+    - a per-process bloom filter of the blacklisted rows in the database;
+      a miss means the token is definitely not blacklisted
+    - the database, for bloom hits
+    Writes set the cache entry immediately and insert rows in batches.
+    The cache backend must be shared by all workers for tokens blacklisted
+    by one worker to be rejected by the others before the next bloom rebuild.
+    """
+    
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._bloom: Optional[BloomFilter] = None
+        self._bloom_built = 0.0
+        self._pending_outstanding: Dict[str, Dict[str, Any]] = {}
+        self._pending_blacklist: Set[str] = set()
+        self._oldest_pending: Optional[float] = None
+        atexit.register(self.flush)
+    
+    def is_blacklisted(self, jti: str) -> bool:
+        if jti in self._pending_blacklist or cache.get(blacklist_cache_key(jti)):
+            return True
+        if jti not in self.bloom():
+            return False
+        return BlacklistedToken.objects.filter(token__jti=jti).exists()
+    
+    def bloom(self) -> BloomFilter:
+        if (
+            self._bloom is None
+            or time.monotonic() - self._bloom_built > settings.TOKEN_BLACKLIST_BLOOM_REFRESH
+        ):
+            self.rebuild_bloom()
+        return self._bloom  # type: ignore[return-value]
+    
+    def rebuild_bloom(self) -> None:
+        bloom = BloomFilter(
+            settings.TOKEN_BLACKLIST_BLOOM_BITS, settings.TOKEN_BLACKLIST_BLOOM_HASHES
+        )
+        built = time.monotonic()
+        jtis = BlacklistedToken.objects.filter(
+            token__expires_at__gt=timezone.now()
+        ).values_list("token__jti", flat=True)
+        for jti in jtis.iterator(chunk_size=5000):
+            bloom.add(jti)
+        with self._lock:
+            for jti in self._pending_blacklist:
+                bloom.add(jti)
+            self._bloom = bloom
+            self._bloom_built = built
+    
+    def outstand(self, payload: Dict[str, Any], token: str) -> None:
+        with self._lock:
+            self._queue_outstanding(payload, token)
+        self.maybe_flush()
+    
+    def blacklist(self, payload: Dict[str, Any], token: str) -> None:
+        jti = payload[api_settings.JTI_CLAIM]
+        timeout = max(int(payload["exp"] - time.time()), 1)
+        cache.set(blacklist_cache_key(jti), True, timeout)
+        with self._lock:
+            self._queue_outstanding(payload, token)
+            self._pending_blacklist.add(jti)
+            if self._bloom is not None:
+                self._bloom.add(jti)
+        self.maybe_flush()
+    
+    def _queue_outstanding(self, payload: Dict[str, Any], token: str) -> None:
+        user_id = payload.get(api_settings.USER_ID_CLAIM)
+        self._pending_outstanding.setdefault(
+            payload[api_settings.JTI_CLAIM],
+            {
+                "user_id": UUID(str(user_id)) if user_id else None,
+                "token": token,
+                "created_at": datetime.fromtimestamp(payload["iat"], tz=dt_timezone.utc),
+                "expires_at": datetime.fromtimestamp(payload["exp"], tz=dt_timezone.utc),
+            },
+        )
+        if self._oldest_pending is None:
+            self._oldest_pending = time.monotonic()
+    
+    def maybe_flush(self) -> None:
+        oldest = self._oldest_pending
+        if len(self._pending_outstanding) >= settings.TOKEN_BLACKLIST_BATCH_SIZE or (
+            oldest is not None
+            and time.monotonic() - oldest >= settings.TOKEN_BLACKLIST_FLUSH_INTERVAL
+        ):
+            self.flush()
+    
+    def flush(self) -> None:
+        """
+        Write queued outstanding and blacklisted tokens in a few queries.
+        """
+        with self._lock:
+            outstanding = self._pending_outstanding
+            blacklisted = self._pending_blacklist
+            self._pending_outstanding = {}
+            self._pending_blacklist = set()
+            self._oldest_pending = None
+        if not outstanding:
+            return
+        
+        try:
+            user_ids = {row["user_id"] for row in outstanding.values() if row["user_id"]}
+            existing = set(
+                get_user_model().objects.filter(pk__in=user_ids).values_list("pk", flat=True)
+            )
+            OutstandingToken.objects.bulk_create(
+                [
+                    OutstandingToken(
+                        jti=jti,
+                        token=row["token"],
+                        user_id=row["user_id"] if row["user_id"] in existing else None,
+                        created_at=row["created_at"],
+                        expires_at=row["expires_at"],
+                    )
+                    for jti, row in outstanding.items()
+                ],
+                ignore_conflicts=True,
+            )
+            if blacklisted:
+                token_ids = OutstandingToken.objects.filter(
+                    jti__in=blacklisted
+                ).values_list("id", flat=True)
+                BlacklistedToken.objects.bulk_create(
+                    [BlacklistedToken(token_id=token_id) for token_id in token_ids],
+                    ignore_conflicts=True,
+                )
+        except Exception:
+            logger.exception("Token blacklist flush failed; requeueing %d tokens", len(outstanding))
+            with self._lock:
+                for jti, row in outstanding.items():
+                    self._pending_outstanding.setdefault(jti, row)
+                self._pending_blacklist |= blacklisted
+                if self._oldest_pending is None:
+                    self._oldest_pending = time.monotonic()
+
+
+token_blacklist = TokenBlacklist()
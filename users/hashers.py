@@ -0,0 +1,32 @@
+from django.conf import settings
+from django.contrib.auth.hashers import Argon2PasswordHasher, PBKDF2PasswordHasher
+
+
+class TunablePBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """
+    PBKDF2-SHA256 with the iteration count taken from
+    PASSWORD_PBKDF2_ITERATIONS. Existing hashes with a different count are
+    re-encoded at the configured cost on the next successful login.
+    """
+    
+    @property
+    def iterations(self) -> int:  # type: ignore[override]
+        return settings.PASSWORD_PBKDF2_ITERATIONS
+
+
+class TunableArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    Argon2id with time/memory cost from settings (requires argon2-cffi).
+    """
+    
+    @property
+    def time_cost(self) -> int:  # type: ignore[override]
+        return settings.PASSWORD_ARGON2_TIME_COST
+    
+    @property
+    def memory_cost(self) -> int:  # type: ignore[override]
+        return settings.PASSWORD_ARGON2_MEMORY_COST
+    
+    @property
+    def parallelism(self) -> int:  # type: ignore[override]
+        return settings.PASSWORD_ARGON2_PARALLELISM
@@ -0,0 +1,119 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Deque, Dict, Optional, Tuple
+from django.conf import settings
+from django.contrib.auth import authenticate
+from django.db import connections
+from app.metrics import summarize
+
+
+class LoginBusy(Exception):
+    """
+    The verification queue is full; the caller should answer 429.
+    """
+
+
+class LoginTimeout(Exception):
+    """
+    Verification did not finish within LOGIN_VERIFY_TIMEOUT seconds.
+    """
+
+
+def pooled_authenticate(request: Any, email: str, password: str) -> Any:
+    """
+    authenticate() on a pool thread: every AUTHENTICATION_BACKENDS entry
+    is tried, user_login_failed is sent on failure, and ModelBackend
+    rehashes outdated passwords and hashes once for unknown emails. The
+    thread's database connections are closed again, since pool threads
+    never pass through the request cycle that would recycle them.
+    """
+    try:
+        return authenticate(request, email=email, password=password)
+    finally:
+        connections.close_all()
+
+
+class PasswordVerifier:
+    """
+    Runs authenticate() for logins on a bounded thread pool.
+    - at most LOGIN_HASH_WORKERS hashes run at once per process
+    - at most LOGIN_QUEUE_LIMIT more wait; further attempts raise LoginBusy
+      immediately instead of tying up a worker
+    """
+    
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._slots: Optional[threading.BoundedSemaphore] = None
+        self._latencies: Deque[float] = deque(maxlen=1000)
+        self._counts = {"verified": 0, "failed": 0, "rejected": 0, "timed_out": 0}
+        self._in_flight = 0
+    
+    def _pool(self) -> Tuple[ThreadPoolExecutor, threading.BoundedSemaphore]:
+        # Created lazily so each forked gunicorn worker gets its own threads
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=settings.LOGIN_HASH_WORKERS,
+                    thread_name_prefix="login-hash",
+                )
+                self._slots = threading.BoundedSemaphore(
+                    settings.LOGIN_HASH_WORKERS + settings.LOGIN_QUEUE_LIMIT
+                )
+            return self._executor, self._slots  # type: ignore[return-value]
+    
+    def _count(self, name: str, delta: int = 1) -> None:
+        with self._lock:
+            self._counts[name] += delta
+    
+    def verify(self, request: Any, email: str, password: str) -> Any:
+        """
+        The user authenticate() returns for the credentials, or None.
+        """
+        executor, slots = self._pool()
+        if not slots.acquire(blocking=False):
+            self._count("rejected")
+            raise LoginBusy()
+        
+        started = time.perf_counter()
+        with self._lock:
+            self._in_flight += 1
+        try:
+            future = executor.submit(pooled_authenticate, request, email, password)
+        except BaseException:
+            self._finish(slots)
+            raise
+        future.add_done_callback(lambda _: self._finish(slots))
+        try:
+            user = future.result(timeout=settings.LOGIN_VERIFY_TIMEOUT)
+        except FutureTimeoutError:
+            self._count("timed_out")
+            raise LoginTimeout()
+        
+        with self._lock:
+            self._latencies.append((time.perf_counter() - started) * 1000)
+        self._count("failed" if user is None else "verified")
+        return user
+    
+    def _finish(self, slots: threading.BoundedSemaphore) -> None:
+        with self._lock:
+            self._in_flight -= 1
+        slots.release()
+    
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            latencies = list(self._latencies)
+            report: Dict[str, Any] = {
+                **self._counts,
+                "in_flight": self._in_flight,
+                "workers": settings.LOGIN_HASH_WORKERS,
+                "queue_limit": settings.LOGIN_QUEUE_LIMIT,
+            }
+        report["verify_ms"] = summarize(latencies) if latencies else None
+        return report
+
+
+password_verifier = PasswordVerifier()
@@ -0,0 +1,42 @@
+from typing import Any
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+from users.blacklist import token_blacklist
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete expired outstanding refresh tokens and their blacklist "
+        "entries in batches. Schedule it (e.g. daily) to keep the token "
+        "tables bounded."
+    )
+
+    def add_arguments(self, parser: Any) -> None:
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Number of tokens deleted per round trip.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        token_blacklist.flush()
+        now = timezone.now()
+        purged = 0
+        while True:
+            token_ids = list(
+                OutstandingToken.objects.filter(expires_at__lte=now)
+                .order_by()
+                .values_list("id", flat=True)[: options["batch_size"]]
+            )
+            if not token_ids:
+                break
+            BlacklistedToken.objects.filter(token_id__in=token_ids).delete()
+            OutstandingToken.objects.filter(id__in=token_ids).delete()
+            purged += len(token_ids)
+        
+        self.stdout.write(self.style.SUCCESS(f"Purged {purged} expired tokens"))
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-18 07:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_alter_user_options'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='token_version',
+            field=models.PositiveIntegerField(default=0, help_text='Bumped whenever access-relevant fields change so issued tokens carrying the old claims stop being accepted.'),
+        ),
+    ]
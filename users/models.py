@@ -97,6 +97,13 @@ class User(AbstractBaseUser, PermissionsMixin, TimeStampedModel):
             "Designates whether the user can log into this admin site."
         ),
     )
+    token_version = models.PositiveIntegerField(
+        default=0,
+        help_text=_(
+            "Bumped whenever access-relevant fields change so issued "
+            "tokens carrying the old claims stop being accepted."
+        ),
+    )
     
     objects = UserManager()
     
@@ -107,6 +114,30 @@ class User(AbstractBaseUser, PermissionsMixin, TimeStampedModel):
         db_table = "users"
         ordering = ['username'] 
     
+    @classmethod
+    def from_db(cls, db, field_names, values):  # type: ignore[no-untyped-def]
+        instance = super().from_db(db, field_names, values)
+        if not {"is_staff", "is_superuser", "is_active"} & instance.get_deferred_fields():
+            instance._claim_snapshot = instance.claim_values()
+        return instance
+    
+    def claim_values(self):  # type: ignore[no-untyped-def]
+        """
+        The fields embedded in access tokens; changing any of them
+        invalidates tokens issued earlier.
+        """
+        return (self.is_staff, self.is_superuser, self.is_active)
+    
+    def save(self, *args, **kwargs):  # type: ignore[no-untyped-def]
+        snapshot = getattr(self, "_claim_snapshot", None)
+        if snapshot is not None and snapshot != self.claim_values():
+            self.token_version += 1
+            update_fields = kwargs.get("update_fields")
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "token_version"}
+        super().save(*args, **kwargs)
+        self._claim_snapshot = self.claim_values()
+    
     def __str__(self) -> str:
         return self.username
     
\ No newline at end of file
@@ -2,8 +2,9 @@ from typing import Any
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
 from rest_framework.validators import UniqueValidator
-from rest_framework_simplejwt.tokens import RefreshToken, TokenError
+from rest_framework_simplejwt.tokens import TokenError
 from teams.models import Team
+from users.tokens import PulseRefreshToken
 
 User = get_user_model()
 
@@ -67,6 +68,18 @@ class UserSerializer(serializers.ModelSerializer):
         user.save()
         return user
 
+class UserSummarySerializer(serializers.ModelSerializer):
+    """
+    Slim user representation for nested member lists
+    """
+    id = serializers.CharField(read_only=True)
+    
+    class Meta:
+        model = User
+        fields = ("id", "username", "email", "first_name", "last_name")
+        read_only_fields = fields
+
+
 class UserUpdateSerializer(serializers.ModelSerializer):
     username = serializers.CharField(read_only=True)
     email = serializers.EmailField(read_only=True)
@@ -148,7 +161,7 @@ class LogoutSerializer(serializers.Serializer):
     
     def save(self, **kwargs):  # type: ignore[no-untyped-def]
         try:
-            RefreshToken(self.token).blacklist()
+            PulseRefreshToken(self.token).blacklist()
         except TokenError:
             raise serializers.ValidationError(
                 "Invalid or expired token", code="invalid_token"
@@ -0,0 +1,17 @@
+from typing import Any
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from users.tokens import invalidate_token_version
+
+User = get_user_model()
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def refresh_token_version(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """
+    Drop the cached token version so claim-backed requests see role and
+    status changes (and deletions) immediately.
+    """
+    invalidate_token_version(instance.pk)
@@ -1,3 +1,234 @@
-from django.test import TestCase
+import threading
+import time
+from unittest import mock
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import BaseBackend
+from django.contrib.auth.signals import user_login_failed
+from django.core.cache import cache
+from django.db import connection
+from django.test import SimpleTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from app.testing import PASSWORD, APITestCase, APITransactionTestCase, create_user
+from users.blacklist import blacklist_cache_key, token_blacklist
+from users.login import LoginBusy, LoginTimeout, PasswordVerifier
+from users.throttles import LoginEmailThrottle, LoginIPThrottle
+from users.tokens import TOKEN_VERSION_CLAIM, PulseRefreshToken, current_token_version
 
-# Create your tests here.
+User = get_user_model()
+
+
+class ClaimsAuthenticationTests(APITestCase):
+    def setUp(self) -> None:
+        self.user = create_user()
+        self.refresh = PulseRefreshToken.for_user(self.user)
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f"Bearer {self.refresh.access_token}"
+        )
+    
+    def test_reads_do_not_load_the_user_row(self) -> None:
+        self.client.get("/api/v1/pulse-logs/")
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/api/v1/pulse-logs/")
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(
+            any('FROM "users"' in query["sql"] for query in queries.captured_queries)
+        )
+    
+    def test_role_change_revokes_issued_tokens(self) -> None:
+        self.user.is_staff = True
+        self.user.save()
+        response = self.client.get("/api/v1/pulse-logs/")
+        self.assertEqual(response.status_code, 401)
+        
+        self.client.credentials()
+        response = self.client.post(
+            "/api/v1/auth/refresh/", {"refresh": str(self.refresh)}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {response.json()['access']}")
+        self.assertEqual(self.client.get("/api/v1/users/").status_code, 200)
+    
+    def test_deactivation_revokes_issued_tokens(self) -> None:
+        self.user.is_active = False
+        self.user.save()
+        response = self.client.get("/api/v1/pulse-logs/")
+        self.assertEqual(response.status_code, 401)
+    
+    @override_settings(TOKEN_VERSION_CACHE_TTL=5)
+    def test_version_bump_reaches_other_workers_within_the_ttl(self) -> None:
+        self.assertEqual(self.client.get("/api/v1/pulse-logs/").status_code, 200)
+        # Bumped by another worker: this worker's cached version is stale
+        User.objects.filter(pk=self.user.pk).update(token_version=self.user.token_version + 1)
+        self.assertEqual(self.client.get("/api/v1/pulse-logs/").status_code, 200)
+        with mock.patch("time.time", return_value=time.time() + 6):
+            self.assertEqual(current_token_version(self.user.pk), self.user.token_version + 1)
+            self.assertEqual(self.client.get("/api/v1/pulse-logs/").status_code, 401)
+    
+    def test_outstanding_token_carries_the_claims(self) -> None:
+        stored = OutstandingToken.objects.get(jti=self.refresh["jti"])
+        self.assertEqual(stored.token, str(self.refresh))
+        self.assertEqual(
+            PulseRefreshToken(stored.token, verify=False)[TOKEN_VERSION_CLAIM],
+            self.user.token_version,
+        )
+    
+    def test_profile_changes_keep_tokens_valid(self) -> None:
+        self.user.first_name = "Renamed"
+        self.user.save()
+        self.assertEqual(self.client.get("/api/v1/pulse-logs/").status_code, 200)
+    
+    def test_async_profile_is_conditional(self) -> None:
+        url = "/api/v1/async/users/me/"
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["username"], "member")
+        etag = response["ETag"]
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+    
+    def test_async_profile_reuses_the_authenticated_user(self) -> None:
+        self.client.credentials()
+        self.client.force_authenticate(self.user)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/api/v1/async/users/me/")
+        self.assertEqual(response.status_code, 200)
+        # Only the ETag aggregate reads the users table
+        user_queries = [query for query in queries.captured_queries if 'FROM "users"' in query["sql"]]
+        self.assertEqual(len(user_queries), 1)
+
+
+@override_settings(TOKEN_BLACKLIST_CACHE=True)
+class CachedBlacklistTests(APITestCase):
+    def setUp(self) -> None:
+        self.user = create_user()
+    
+    def refresh(self, token: str):  # type: ignore[no-untyped-def]
+        return self.client.post("/api/v1/auth/refresh/", {"refresh": token})
+    
+    def test_issued_tokens_are_queued_with_their_claims(self) -> None:
+        with CaptureQueriesContext(connection) as queries:
+            token = PulseRefreshToken.for_user(self.user)
+        self.assertFalse(any("token_blacklist" in query["sql"] for query in queries.captured_queries))
+        self.assertFalse(OutstandingToken.objects.exists())
+        
+        token_blacklist.flush()
+        stored = OutstandingToken.objects.get(jti=token["jti"])
+        self.assertEqual((stored.user_id, stored.token), (self.user.pk, str(token)))
+        self.assertEqual(PulseRefreshToken(stored.token, verify=False)["teams"], [])
+    
+    def test_rotated_tokens_are_rejected_and_persisted(self) -> None:
+        first = str(PulseRefreshToken.for_user(self.user))
+        response = self.refresh(first)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.refresh(first).status_code, 401)
+        
+        token_blacklist.flush()
+        self.assertEqual(BlacklistedToken.objects.count(), 1)
+        cache.delete(blacklist_cache_key(PulseRefreshToken(first, verify=False)["jti"]))
+        token_blacklist.rebuild_bloom()
+        self.assertEqual(self.refresh(first).status_code, 401)
+
+
+class PasscodeBackend(BaseBackend):
+    """
+    Test backend accepting a fixed passcode for any existing email.
+    """
+    
+    def authenticate(self, request, email=None, password=None, **kwargs):  # type: ignore[no-untyped-def]
+        if password == "one-time-passcode":
+            return User.objects.filter(email=email).first()
+        return None
+
+
+class LoginTests(APITransactionTestCase):
+    url = "/api/v1/auth/login/"
+    
+    def setUp(self) -> None:
+        cache.clear()
+        self.user = create_user()
+    
+    def login(self, password: str = PASSWORD, email: str = "member@example.com"):  # type: ignore[no-untyped-def]
+        return self.client.post(self.url, {"email": email, "password": password})
+    
+    def test_successful_logins_are_not_throttled(self) -> None:
+        with mock.patch.object(LoginEmailThrottle, "rate", "2/min", create=True), mock.patch.object(
+            LoginIPThrottle, "rate", "2/min", create=True
+        ):
+            for _ in range(4):
+                response = self.login()
+                self.assertEqual(response.status_code, 200)
+                self.assertIn("access", response.json())
+    
+    def test_failed_attempts_are_throttled_per_email(self) -> None:
+        create_user("other")
+        with mock.patch.object(LoginEmailThrottle, "rate", "2/min", create=True):
+            self.assertEqual(self.login("wrong").status_code, 401)
+            self.assertEqual(self.login("wrong").status_code, 401)
+            response = self.login()
+            self.assertEqual(response.status_code, 429)
+            self.assertIn("Retry-After", response)
+            self.assertEqual(self.login(email="other@example.com").status_code, 200)
+    
+    def test_failed_attempts_are_throttled_per_ip(self) -> None:
+        with mock.patch.object(LoginIPThrottle, "rate", "1/min", create=True):
+            self.assertEqual(self.login("wrong").status_code, 401)
+            self.assertEqual(self.login(email="other@example.com").status_code, 429)
+    
+    def test_failures_send_user_login_failed(self) -> None:
+        failed = []
+        
+        def receiver(sender, credentials, request, **kwargs):  # type: ignore[no-untyped-def]
+            failed.append((credentials["email"], credentials["password"]))
+        
+        user_login_failed.connect(receiver)
+        self.addCleanup(user_login_failed.disconnect, receiver)
+        self.login("wrong")
+        self.login(email="nobody@example.com")
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(self.login().status_code, 401)
+        self.assertEqual(
+            [email for email, _ in failed],
+            ["member@example.com", "nobody@example.com", "member@example.com"],
+        )
+        self.assertNotIn(PASSWORD, [password for _, password in failed])
+    
+    @override_settings(AUTHENTICATION_BACKENDS=["users.tests.PasscodeBackend"])
+    def test_uses_authentication_backends(self) -> None:
+        self.assertEqual(self.login().status_code, 401)
+        self.assertEqual(self.login("one-time-passcode").status_code, 200)
+
+
+class PasswordVerifierTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.verifier = PasswordVerifier()
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.addCleanup(self.release.set)
+    
+    def slow_authenticate(self, request, **credentials):  # type: ignore[no-untyped-def]
+        self.started.set()
+        self.release.wait(5)
+        return None
+    
+    @override_settings(LOGIN_HASH_WORKERS=1, LOGIN_QUEUE_LIMIT=0)
+    def test_rejects_attempts_when_the_pool_is_full(self) -> None:
+        with mock.patch("users.login.authenticate", self.slow_authenticate):
+            waiting = threading.Thread(
+                target=self.verifier.verify, args=(None, "first@example.com", "secret")
+            )
+            waiting.start()
+            self.assertTrue(self.started.wait(5))
+            with self.assertRaises(LoginBusy):
+                self.verifier.verify(None, "second@example.com", "secret")
+            self.release.set()
+            waiting.join(5)
+        snapshot = self.verifier.snapshot()
+        self.assertEqual((snapshot["rejected"], snapshot["failed"], snapshot["in_flight"]), (1, 1, 0))
+    
+    @override_settings(LOGIN_VERIFY_TIMEOUT=0)
+    def test_times_out_slow_verification(self) -> None:
+        with mock.patch("users.login.authenticate", self.slow_authenticate):
+            with self.assertRaises(LoginTimeout):
+                self.verifier.verify(None, "first@example.com", "secret")
+        self.assertEqual(self.verifier.snapshot()["timed_out"], 1)
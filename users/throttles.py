@@ -0,0 +1,50 @@
+import hashlib
+from typing import Any, Optional
+from rest_framework.request import Request
+from rest_framework.throttling import SimpleRateThrottle
+
+
+class FailedLoginThrottle(SimpleRateThrottle):
+    """
+    Rate limit on failed login attempts: requests are refused once the
+    rate is used up, but only attempts the view reports through
+    record_failure() count towards it, so signing in successfully (or
+    benchmarking the login endpoint) is never throttled.
+    """
+    
+    def throttle_success(self) -> bool:
+        return True
+    
+    def record_failure(self, request: Request, view: Any) -> None:
+        key = self.get_cache_key(request, view)
+        if key is None:
+            return
+        now = self.timer()
+        history = [moment for moment in self.cache.get(key, []) if moment > now - self.duration]
+        history.insert(0, now)
+        self.cache.set(key, history, self.duration)
+
+
+class LoginIPThrottle(FailedLoginThrottle):
+    """
+    Limits failed login attempts per client IP.
+    """
+    scope = "login_ip"
+    
+    def get_cache_key(self, request: Request, view: Any) -> Optional[str]:
+        return self.cache_format % {"scope": self.scope, "ident": self.get_ident(request)}
+
+
+class LoginEmailThrottle(FailedLoginThrottle):
+    """
+    Limits failed login attempts per target account, whatever IP they come
+    from.
+    """
+    scope = "login_email"
+    
+    def get_cache_key(self, request: Request, view: Any) -> Optional[str]:
+        email = request.data.get("email")
+        if not email or not isinstance(email, str):
+            return None
+        ident = hashlib.sha256(email.strip().lower().encode()).hexdigest()
+        return self.cache_format % {"scope": self.scope, "ident": ident}
@@ -0,0 +1,139 @@
+from typing import Any, Dict, Optional
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, TokenError
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.utils import datetime_from_epoch, get_md5_hash_password
+from teams.membership import user_team_ids
+from users.blacklist import token_blacklist
+
+TOKEN_VERSION_CLAIM = "ver"
+
+
+def user_claims(user: Any) -> Dict[str, Any]:
+    """
+    Claims that let read requests authorize without loading the user row.
+    """
+    return {
+        "is_staff": user.is_staff,
+        "is_superuser": user.is_superuser,
+        "is_active": user.is_active,
+        "teams": sorted(str(team_id) for team_id in user_team_ids(user)),
+        TOKEN_VERSION_CLAIM: user.token_version,
+    }
+
+
+class PulseRefreshToken(RefreshToken):
+    """
+    Refresh token carrying the user's role, status and team claims.
+    Access tokens derived from it copy them.
+    """
+    
+    @classmethod
+    def for_user(cls, user: Any) -> Any:
+        """
+        A token for `user` with its claims, recorded as outstanding once
+        complete: queued through token_blacklist with TOKEN_BLACKLIST_CACHE,
+        otherwise inserted directly. Replaces BlacklistMixin.for_user, which
+        inserts the token before claims can be added.
+        """
+        token = cls()
+        token[api_settings.USER_ID_CLAIM] = str(getattr(user, api_settings.USER_ID_FIELD))
+        if api_settings.CHECK_REVOKE_TOKEN:
+            token[api_settings.REVOKE_TOKEN_CLAIM] = get_md5_hash_password(user.password)
+        token.payload.update(user_claims(user))
+        if settings.TOKEN_BLACKLIST_CACHE:
+            token_blacklist.outstand(token.payload, str(token))
+        else:
+            OutstandingToken.objects.create(
+                user=user,
+                jti=token[api_settings.JTI_CLAIM],
+                token=str(token),
+                created_at=token.current_time,
+                expires_at=datetime_from_epoch(token["exp"]),
+            )
+        return token
+    
+    def check_blacklist(self) -> None:
+        if not settings.TOKEN_BLACKLIST_CACHE:
+            return super().check_blacklist()
+        if token_blacklist.is_blacklisted(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError("Token is blacklisted")
+    
+    def blacklist(self) -> Any:
+        if not settings.TOKEN_BLACKLIST_CACHE:
+            return super().blacklist()
+        token_blacklist.blacklist(self.payload, str(self))
+    
+    def outstand(self) -> Any:
+        if not settings.TOKEN_BLACKLIST_CACHE:
+            return super().outstand()
+        token_blacklist.outstand(self.payload, str(self))
+
+
+class PulseTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Re-issues claims from the current user row on refresh, so role and
+    membership changes reach clients with their next refresh.
+    """
+    token_class = PulseRefreshToken
+    
+    def validate(self, attrs: Any) -> Dict[str, str]:
+        refresh = self.token_class(attrs["refresh"])
+        user_id = refresh.payload.get(api_settings.USER_ID_CLAIM)
+        user = get_user_model().objects.filter(
+            **{api_settings.USER_ID_FIELD: user_id}
+        ).first()
+        if not api_settings.USER_AUTHENTICATION_RULE(user):
+            raise AuthenticationFailed(
+                self.error_messages["no_active_account"],
+                "no_active_account",
+            )
+        refresh.payload.update(user_claims(user))
+        
+        data = {"access": str(refresh.access_token)}
+        
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            if api_settings.BLACKLIST_AFTER_ROTATION:
+                refresh.blacklist()
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+            refresh.outstand()
+            data["refresh"] = str(refresh)
+        
+        return data
+
+
+def token_version_cache_key(user_id: Any) -> str:
+    return f"token-version:{user_id}"
+
+
+def current_token_version(user_id: Any) -> Optional[int]:
+    """
+    The user's token version from the cache, or None if the user is gone.
+    """
+    key = token_version_cache_key(user_id)
+    version = cache.get(key)
+    if version is None:
+        version = (
+            get_user_model()
+            .objects.filter(pk=user_id)
+            .values_list("token_version", flat=True)
+            .first()
+        )
+        if version is None:
+            return None
+        cache.set(key, version, settings.TOKEN_VERSION_CACHE_TTL)
+    return version
+
+
+def invalidate_token_version(user_id: Any) -> None:
+    key = token_version_cache_key(user_id)
+    cache.delete(key)
+    transaction.on_commit(lambda: cache.delete(key))
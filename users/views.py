@@ -1,14 +1,21 @@
 from typing import Any
 from django.contrib.auth import get_user_model
+from django.db.models import aprefetch_related_objects
 from rest_framework import generics, status
 from rest_framework.generics import GenericAPIView
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from rest_framework_simplejwt.tokens import RefreshToken
-from django.contrib.auth import authenticate
+from app.async_views import AsyncReadView
+from app.conditional import ConditionalGetMixin
+from logs.models import PulseLog, UserPulseStats
+from logs.serializers import UserPulseStatsSerializer
+from users.authentication import ClaimsTokenUser
+from users.login import LoginBusy, LoginTimeout, password_verifier
 from users.permissions import IsAdminUser
+from users.throttles import LoginEmailThrottle, LoginIPThrottle
+from users.tokens import PulseRefreshToken
 from users.serializers import (
     LogoutSerializer,
     UserSerializer,
@@ -32,7 +39,7 @@ class UserRegisterView(APIView):
         serializer.is_valid(raise_exception=True)
         user = serializer.save()
         
-        refresh = RefreshToken.for_user(user)
+        refresh = PulseRefreshToken.for_user(user)
         response = serializer.data
         response["refresh"] = str(refresh)
         response["access"] = str(refresh.access_token)
@@ -43,8 +50,12 @@ class UserRegisterView(APIView):
 class LoginView(APIView):
     """
     Custom login view that returns user details along with tokens.
+    - Failed attempts are rate limited per IP and per email
+    - Passwords are verified on a bounded pool; when it is saturated the
+      view answers 429 instead of queueing
     """
     permission_classes = []
+    throttle_classes = [LoginIPThrottle, LoginEmailThrottle]
     
     def post(self, request: Request) -> Response:
         email = request.data.get('email')
@@ -56,9 +67,24 @@ class LoginView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        user = authenticate(username=email, password=password)
+        try:
+            user = password_verifier.verify(request, email, password)
+        except LoginBusy:
+            return Response(
+                {"error": "Too many login attempts in progress, try again shortly"},
+                status=status.HTTP_429_TOO_MANY_REQUESTS,
+                headers={"Retry-After": "1"},
+            )
+        except LoginTimeout:
+            return Response(
+                {"error": "Login is temporarily unavailable"},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                headers={"Retry-After": "5"},
+            )
         
         if user is None:
+            for throttle in self.get_throttles():
+                throttle.record_failure(request, self)
             return Response(
                 {"error": "Invalid credentials"},
                 status=status.HTTP_401_UNAUTHORIZED
@@ -70,7 +96,7 @@ class LoginView(APIView):
                 status=status.HTTP_401_UNAUTHORIZED
             )
         
-        refresh = RefreshToken.for_user(user)
+        refresh = PulseRefreshToken.for_user(user)
         
         response_data = {
             "first_name": user.first_name,
@@ -82,6 +108,17 @@ class LoginView(APIView):
         return Response(response_data, status=status.HTTP_200_OK)
 
 
+class LoginMetricsView(APIView):
+    """
+    Password verification latency and pool counters for this worker
+    process (admin only).
+    """
+    permission_classes = (IsAdminUser,)
+    
+    def get(self, request: Request) -> Response:
+        return Response(password_verifier.snapshot(), status=status.HTTP_200_OK)
+
+
 class LogoutView(GenericAPIView):
     """
     Logout user by blacklisting their refresh token.
@@ -105,7 +142,7 @@ class UserListView(generics.ListAPIView):
     permission_classes = (IsAdminUser,)
 
 
-class UserDetailView(generics.RetrieveUpdateDestroyAPIView):
+class UserDetailView(ConditionalGetMixin, generics.RetrieveUpdateDestroyAPIView):
     """
     Retrieve, update or delete a user (admin only).
     Can update role (is_staff) and profile info.
@@ -113,6 +150,8 @@ class UserDetailView(generics.RetrieveUpdateDestroyAPIView):
     permission_classes = (IsAdminUser,)
     lookup_field = "id"
     queryset = User.objects.all()
+    conditional_fields = ("updated_at", "teams__updated_at")
+    conditional_counts = ("teams",)
     
     def get_serializer_class(self):  # type: ignore[no-untyped-def]
         if self.request.method in ['PUT', 'PATCH']:
@@ -120,16 +159,47 @@ class UserDetailView(generics.RetrieveUpdateDestroyAPIView):
         return UserSerializer
 
 
-class UserMeView(APIView):
+class UserMeView(ConditionalGetMixin, APIView):
     """
     Get or update current user profile.
     Regular users can only update their name, not their role.
+    - `?include=stats` adds check-in streaks and participation totals
     """
     permission_classes = (IsAuthenticated,)
+    conditional_counts = ("teams",)
+    
+    def include_stats(self) -> bool:
+        return "stats" in self.request.query_params.get("include", "").split(",")
+    
+    @property
+    def conditional_fields(self):  # type: ignore[no-untyped-def]
+        fields = ("updated_at", "teams__updated_at")
+        if self.include_stats():
+            fields += ("pulse_stats__updated_at",)
+        return fields
+    
+    def get_etag_salt(self, request: Request) -> Any:
+        # The current streak lapses when the week changes
+        return PulseLog.current_week() if self.include_stats() else None
+    
+    def get_conditional_queryset(self):  # type: ignore[no-untyped-def]
+        return User.objects.filter(pk=self.request.user.pk)
+    
+    @staticmethod
+    def stats_data(stats: Any) -> Any:
+        return UserPulseStatsSerializer(stats or UserPulseStats()).data
     
     def get(self, request: Request) -> Response:
-        serializer = UserSerializer(request.user)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        not_modified = self.check_not_modified(request)
+        if not_modified is not None:
+            return not_modified
+        
+        data = UserSerializer(request.user).data
+        if self.include_stats():
+            data["stats"] = self.stats_data(
+                UserPulseStats.objects.filter(user_id=request.user.pk).first()
+            )
+        return self.add_etag(Response(data, status=status.HTTP_200_OK))
     
     def patch(self, request: Request) -> Response:
         serializer = UserUpdateSerializer(
@@ -138,4 +208,23 @@ class UserMeView(APIView):
         serializer.is_valid(raise_exception=True)
         serializer.save()
         return Response(serializer.data, status=status.HTTP_200_OK)
-    
\ No newline at end of file
+
+
+class UserMeAsyncView(AsyncReadView):
+    """
+    Async variant of GET /users/me/ for ASGI deployments, with the same
+    conditional GET support.
+    """
+    view_class = UserMeView
+    
+    async def respond(self, view, request, *args, **kwargs):  # type: ignore[no-untyped-def]
+        user = request.user
+        if isinstance(user, ClaimsTokenUser):
+            user = await user.aload_user()
+        await aprefetch_related_objects([user], "teams")
+        data = UserSerializer(user).data
+        if view.include_stats():
+            data["stats"] = view.stats_data(
+                await UserPulseStats.objects.filter(user_id=user.pk).afirst()
+            )
+        return Response(data, status=status.HTTP_200_OK)
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class WorkloadsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'workloads'
+
+    def ready(self) -> None:
+        import workloads.signals  # noqa: F401
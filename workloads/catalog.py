@@ -0,0 +1,5 @@
+from app.catalog import CatalogCache
+from workloads.models import Workload
+from workloads.serializers import WorkloadSerializer
+
+workload_catalog = CatalogCache("workloads", Workload.objects.all, WorkloadSerializer)
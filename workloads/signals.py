@@ -0,0 +1,12 @@
+from typing import Any
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from workloads.catalog import workload_catalog
+from workloads.models import Workload
+
+
+@receiver(post_save, sender=Workload)
+@receiver(post_delete, sender=Workload)
+def invalidate_workload_catalog(sender: Any, **kwargs: Any) -> None:
+    transaction.on_commit(workload_catalog.invalidate)
@@ -1,5 +1,9 @@
 from rest_framework import generics
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from app.conditional import ConditionalGetMixin
+from app.catalog import catalog_response
+from workloads.catalog import workload_catalog
 from workloads.models import Workload
 from workloads.serializers import WorkloadSerializer
 from users.permissions import IsAdminUser
@@ -8,6 +12,7 @@ from users.permissions import IsAdminUser
 class WorkloadListCreateView(generics.ListCreateAPIView):
     """
     List all workloads (authenticated users) or create a new workload (admin only).
+    The list is served from the workload catalog cache and is not paginated.
     """
     queryset = Workload.objects.all()
     serializer_class = WorkloadSerializer
@@ -17,9 +22,15 @@ class WorkloadListCreateView(generics.ListCreateAPIView):
         if self.request.method == "POST":
             return [IsAdminUser()]
         return [IsAuthenticated()]
+    
+    def list(self, request: Request, *args, **kwargs):  # type: ignore[no-untyped-def]
+        """
+        Serve the whole catalog as cached, pre-rendered JSON
+        """
+        return catalog_response(request, workload_catalog.get())
 
 
-class WorkloadDetailView(generics.RetrieveUpdateDestroyAPIView):
+class WorkloadDetailView(ConditionalGetMixin, generics.RetrieveUpdateDestroyAPIView):
     """
     Retrieve (authenticated users), update or delete a workload (admin only).
     """